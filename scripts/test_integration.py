@@ -15,6 +15,9 @@ Usage:
     # Specify custom topic prefix
     python scripts/test_integration.py --prefix mybot
 
+    # Resolve the broker hostname once instead of on every connect
+    python scripts/test_integration.py --broker mqtt.local --resolve-once
+
 Requirements:
     - Mosquitto broker running and accessible
     - paho-mqtt package installed (pip install paho-mqtt)
@@ -29,13 +32,17 @@ Example workflow for Raspberry Pi deployment:
 from __future__ import annotations
 
 import argparse
+import functools
 import json
+import socket
 import sys
+import textwrap
+import threading
 import time
 import uuid
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any
+from typing import Any, NamedTuple
 
 import paho.mqtt.client as mqtt
 
@@ -48,21 +55,198 @@ class TestStatus(Enum):
     SKIPPED = "SKIPPED"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TestResult:
     """Result of a single test case."""
 
     name: str
     status: TestStatus
     topic: str
-    payload: dict[str, Any]
+    payload: bytes
     error: str | None = None
     duration_ms: float = 0.0
 
 
+# (name, topic, payload, mid, confirmation event, monotonic start time, error)
+# of a test message that has been published but not yet confirmed
+InFlightTest = tuple[
+    str, str, bytes, int | None, threading.Event | None, float, str | None
+]
+
+# Timestamps are written into a fixed-width slot of the pre-encoded payload.
+# JSON allows whitespace before a value, so space-padded "%13d.%06d" output is
+# still a valid number and never shifts the rest of the buffer. The bot reads
+# the field as float epoch seconds, so time_ns() is formatted as seconds with
+# integer arithmetic rather than sent as nanoseconds.
+_TS_WIDTH = 20
+_TS_PREFIX = b'{"timestamp":'
+
+# Placeholder for per-publish random IDs (same width as uuid4().hex[:8])
+_ID_SLOT = "########"
+
+
+def _build_template(payload: dict[str, Any]) -> tuple[bytes, tuple[int, ...]]:
+    """Pre-encode a test payload with slots for the timestamp and random IDs.
+
+    Args:
+        payload: Static payload fields (without timestamp). String values may
+            contain _ID_SLOT, which is filled with random hex on each publish.
+
+    Returns:
+        Tuple of (template, id_offsets). The timestamp slot always starts at
+        len(_TS_PREFIX); id_offsets lists where each _ID_SLOT begins.
+    """
+    body = json.dumps(payload, separators=(",", ":")).encode()
+    template = _TS_PREFIX + b" " * _TS_WIDTH + b"," + body[1:]
+
+    id_offsets = []
+    slot = _ID_SLOT.encode()
+    offset = template.find(slot)
+    while offset != -1:
+        id_offsets.append(offset)
+        offset = template.find(slot, offset + len(slot))
+
+    return template, tuple(id_offsets)
+
+
+def _render_payload(template: bytes, id_offsets: tuple[int, ...]) -> bytes:
+    """Fill a payload template with the current timestamp and fresh IDs.
+
+    Args:
+        template: Payload template from _build_template().
+        id_offsets: Offsets of the random ID slots in the template.
+
+    Returns:
+        Encoded JSON payload ready to publish.
+    """
+    buf = bytearray(template)
+    ts_off = len(_TS_PREFIX)
+    sec, usec = divmod(time.time_ns() // 1000, 1_000_000)
+    buf[ts_off:ts_off + _TS_WIDTH] = b"%13d.%06d" % (sec, usec)
+    for offset in id_offsets:
+        buf[offset:offset + len(_ID_SLOT)] = uuid.uuid4().hex[:8].encode()
+    return bytes(buf)
+
+
+class _TestSpec(NamedTuple):
+    """Static definition of an integration test case."""
+
+    name: str
+    topic_suffix: str
+    payload: dict[str, Any]
+    qos: int
+
+
+class _TestCase(NamedTuple):
+    """Integration test case with its payload pre-encoded."""
+
+    name: str
+    topic_suffix: str
+    template: bytes
+    id_offsets: tuple[int, ...]
+    qos: int
+
+
+# Heartbeats and errors are fire-and-forget (QoS 0); the rest wait for PUBACK.
+_TEST_SPECS: tuple[_TestSpec, ...] = (
+    _TestSpec(
+        "Bot Started Event",
+        "status/bot/started",
+        {
+            "session_id": f"test-{_ID_SLOT}",
+            "initial_balance": 100.0,
+            "version": "1.0.0-test",
+            "environment": "integration-test",
+        },
+        1,
+    ),
+    _TestSpec(
+        "Position Opened Event",
+        "trading/position/opened",
+        {
+            "token_id": "test-token-123",
+            "market_name": "Test Market - Will Bitcoin reach $100k?",
+            "side": "YES",
+            "amount": 10.0,
+            "price": 0.55,
+            "cost": 5.50,
+        },
+        1,
+    ),
+    _TestSpec(
+        "Trade Completed Event",
+        "trading/trade/completed",
+        {
+            "trade_id": f"trade-{_ID_SLOT}",
+            "token_id": "test-token-123",
+            "market_name": "Test Market",
+            "side": "SELL",
+            "pnl": 0.50,
+            "pnl_percent": 9.09,
+            "exit_price": 0.60,
+            "hold_time_seconds": 3600,
+        },
+        1,
+    ),
+    _TestSpec(
+        "Balance Update Event",
+        "balance/update",
+        {
+            "balance": 100.50,
+            "previous_balance": 100.0,
+            "change": 0.50,
+            "change_percent": 0.5,
+        },
+        1,
+    ),
+    _TestSpec(
+        "Heartbeat Event",
+        "status/bot/heartbeat",
+        {
+            "uptime_seconds": 60,
+            "active_positions": 1,
+            "balance": 100.50,
+            "memory_mb": 128.5,
+            "cpu_percent": 5.2,
+        },
+        0,
+    ),
+    _TestSpec(
+        "Bot Error Event",
+        "status/bot/error",
+        {
+            "error_type": "TestError",
+            "message": "This is a test error message for integration testing",
+            "severity": "warning",
+            "recoverable": True,
+            "context": {"test_run": True, "source": "integration_test"},
+        },
+        0,
+    ),
+)
+
+
 class MQTTIntegrationTester:
     """Integration tester for MQTT broker connectivity."""
 
+    # Callbacks run on paho's network thread; slots keep their attribute
+    # loads off the instance __dict__
+    __slots__ = (
+        "broker",
+        "port",
+        "prefix",
+        "resolve_once",
+        "keepalive",
+        "reconnect_max_delay",
+        "client",
+        "results",
+        "_fail_count",
+        "_connected_evt",
+        "_pending",
+        "_pending_lock",
+        "_ack_times",
+    )
+
     # MQTT connection result codes
     _CONNECTION_ERRORS = {
         1: "Incorrect protocol version",
@@ -72,22 +256,58 @@ class MQTTIntegrationTester:
         5: "Not authorized",
     }
 
-    def __init__(self, broker: str, port: int, prefix: str) -> None:
+    # Socket send buffer size applied once connected (bytes)
+    _SEND_BUFFER_SIZE = 262144
+
+    # QoS 1 messages allowed in flight at once (all test cases are pipelined)
+    _MAX_INFLIGHT = 20
+
+    # Test cases with payloads encoded once at import time
+    _TEST_CASES: tuple[_TestCase, ...] = tuple(
+        _TestCase(spec.name, spec.topic_suffix, *_build_template(spec.payload), spec.qos)
+        for spec in _TEST_SPECS
+    )
+
+    def __init__(
+        self,
+        broker: str,
+        port: int,
+        prefix: str,
+        resolve_once: bool = False,
+        keepalive: int = 5,
+        reconnect_max_delay: int = 8,
+    ) -> None:
         """Initialize the tester.
 
         Args:
             broker: MQTT broker hostname or IP address.
             port: MQTT broker port.
             prefix: Topic prefix (without trailing slash).
+            resolve_once: Resolve the broker hostname once and connect to
+                the cached IP address instead of the hostname.
+            keepalive: MQTT keepalive interval in seconds. Short values let
+                a dead connection fail the run instead of hanging it.
+            reconnect_max_delay: Upper bound in seconds for paho's
+                exponential reconnect backoff.
         """
         self.broker = broker
         self.port = port
         self.prefix = prefix.rstrip("/")
+        self.resolve_once = resolve_once
+        self.keepalive = keepalive
+        self.reconnect_max_delay = reconnect_max_delay
         self.client: mqtt.Client | None = None
-        self.connected = False
         self.results: list[TestResult] = []
-        self._publish_confirmed = False
-        self._last_mid: int | None = None
+        self._fail_count = 0
+        self._connected_evt = threading.Event()
+        self._pending: dict[int, threading.Event] = {}
+        self._pending_lock = threading.Lock()
+        self._ack_times: dict[int, float] = {}
+
+    @property
+    def connected(self) -> bool:
+        """Whether the client is currently connected to the broker."""
+        return self._connected_evt.is_set()
 
     def _on_connect(
         self,
@@ -101,30 +321,54 @@ class MQTTIntegrationTester:
         # Handle both int and ReasonCode for compatibility
         rc_value = rc if isinstance(rc, int) else rc.value
         if rc_value == 0:
-            self.connected = True
+            self._tune_socket(client)
+            self._connected_evt.set()
         else:
             error_msg = self._CONNECTION_ERRORS.get(
                 rc_value, f"Unknown error (code {rc_value})"
             )
             print(f"Connection failed: {error_msg}")
-            self.connected = False
+            self._connected_evt.clear()
+
+    def _tune_socket(self, client: mqtt.Client) -> None:
+        """Disable Nagle's algorithm and enlarge the socket send buffer.
+
+        MQTT control packets (PUBLISH, PUBACK, PINGREQ) are small, so Nagle's
+        algorithm combined with delayed ACKs can hold them back for ~40ms.
+
+        Args:
+            client: Connected MQTT client whose socket should be tuned.
+        """
+        sock = client.socket()
+        if sock is None:
+            return
+
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self._SEND_BUFFER_SIZE)
+        except OSError as e:
+            print(f"Warning: could not tune MQTT socket: {e}")
 
     def _on_disconnect(
         self,
         client: mqtt.Client,
         userdata: Any,
+        flags: Any,
         rc: int | mqtt.ReasonCode,
         properties: Any = None,
     ) -> None:
         """Handle MQTT disconnection callback."""
-        self.connected = False
+        self._connected_evt.clear()
 
     def _on_publish(
         self, client: mqtt.Client, userdata: Any, mid: int, *args: Any
     ) -> None:
         """Handle MQTT publish confirmation."""
-        if mid == self._last_mid:
-            self._publish_confirmed = True
+        with self._pending_lock:
+            event = self._pending.pop(mid, None)
+        if event is not None:
+            self._ack_times[mid] = time.monotonic()
+            event.set()
 
     def connect(self) -> bool:
         """Connect to the MQTT broker.
@@ -140,18 +384,26 @@ class MQTTIntegrationTester:
             self.client.on_connect = self._on_connect
             self.client.on_disconnect = self._on_disconnect
             self.client.on_publish = self._on_publish
+            self.client.max_inflight_messages_set(self._MAX_INFLIGHT)
+            self.client.reconnect_delay_set(
+                min_delay=1, max_delay=self.reconnect_max_delay
+            )
+            # Surface paho's own warnings and errors (e.g. socket failures)
+            self.client.enable_logger()
+
+            host = self.broker
+            if self.resolve_once:
+                host = resolve_broker(self.broker, self.port)
+                if host != self.broker:
+                    print(f"Resolved {self.broker} to {host}")
 
             print(f"Connecting to MQTT broker at {self.broker}:{self.port}...")
-            self.client.connect(self.broker, self.port, keepalive=60)
+            self.client.connect(host, self.port, keepalive=self.keepalive)
             self.client.loop_start()
 
             # Wait for connection with timeout
             timeout = 10.0
-            start = time.time()
-            while not self.connected and (time.time() - start) < timeout:
-                time.sleep(0.1)
-
-            if not self.connected:
+            if not self._connected_evt.wait(timeout=timeout):
                 print(f"Connection timeout after {timeout}s")
                 return False
 
@@ -173,72 +425,99 @@ class MQTTIntegrationTester:
         if self.client:
             self.client.loop_stop()
             self.client.disconnect()
-            self.connected = False
+            self._connected_evt.clear()
             print("Disconnected from MQTT broker")
 
-    def _publish_and_verify(
-        self, topic: str, payload: dict[str, Any], timeout: float = 5.0
-    ) -> tuple[bool, str | None]:
-        """Publish a message and verify delivery.
+    def _publish(
+        self, topic: str, payload: bytes, qos: int = 1
+    ) -> tuple[int | None, threading.Event | None, str | None]:
+        """Publish a message without waiting for delivery confirmation.
 
         Args:
             topic: Full MQTT topic.
-            payload: Message payload as dictionary.
-            timeout: Maximum time to wait for confirmation.
+            payload: Encoded JSON message payload.
+            qos: MQTT QoS level. QoS 0 messages get no PUBACK, so they count
+                as delivered once paho has accepted them.
 
         Returns:
-            Tuple of (success, error_message).
+            Tuple of (mid, confirmation_event, error_message). mid and
+            confirmation_event are None if the message could not be queued;
+            confirmation_event is also None for QoS 0.
         """
         if not self.client or not self.connected:
-            return False, "Not connected to broker"
-
-        self._publish_confirmed = False
-        payload_json = json.dumps(payload)
+            return None, None, "Not connected to broker"
 
-        try:
-            result = self.client.publish(topic, payload_json, qos=1)
-            self._last_mid = result.mid
+        # Hold the lock until the event is registered so a PUBACK handled
+        # by the network thread in the meantime waits for it in _on_publish
+        with self._pending_lock:
+            try:
+                result = self.client.publish(topic, payload, qos=qos)
+            except Exception as e:
+                return None, None, str(e)
 
             if result.rc != mqtt.MQTT_ERR_SUCCESS:
-                return False, f"Publish failed with code {result.rc}"
+                return None, None, f"Publish failed with code {result.rc}"
 
-            # Wait for publish confirmation
-            start = time.time()
-            while not self._publish_confirmed and (time.time() - start) < timeout:
-                time.sleep(0.05)
+            if qos == 0:
+                self._ack_times[result.mid] = time.monotonic()
+                return result.mid, None, None
 
-            if not self._publish_confirmed:
-                return False, f"Publish confirmation timeout after {timeout}s"
+            event = threading.Event()
+            self._pending[result.mid] = event
 
-            return True, None
+        return result.mid, event, None
 
-        except Exception as e:
-            return False, str(e)
+    def _start_test(
+        self, name: str, full_topic: str, payload: bytes, qos: int = 1
+    ) -> InFlightTest:
+        """Publish the message for a single test case.
+
+        Args:
+            name: Test name for display.
+            full_topic: Full MQTT topic.
+            payload: Payload rendered by _render_payload().
+            qos: MQTT QoS level to publish with.
 
-    def _run_test(
-        self, name: str, topic_suffix: str, payload: dict[str, Any]
+        Returns:
+            In-flight test tuple to be passed to _finish_test().
+        """
+        start_time = time.monotonic()
+        mid, event, error = self._publish(full_topic, payload, qos)
+
+        return name, full_topic, payload, mid, event, start_time, error
+
+    def _finish_test(
+        self,
+        in_flight: InFlightTest,
+        timeout: float = 5.0,
     ) -> TestResult:
-        """Run a single test case.
+        """Wait for a published test message to be confirmed.
 
         Args:
-            name: Test name for display.
-            topic_suffix: Topic suffix (appended to prefix).
-            payload: Message payload.
+            in_flight: Tuple returned by _start_test().
+            timeout: Maximum time to wait for confirmation, measured from
+                when the message was published.
 
         Returns:
             TestResult with outcome.
         """
-        full_topic = f"{self.prefix}/{topic_suffix}"
+        name, full_topic, payload, mid, event, start_time, error = in_flight
 
-        # Ensure timestamp is present
-        if "timestamp" not in payload:
-            payload["timestamp"] = time.time()
+        if event is not None:
+            remaining = max(0.0, start_time + timeout - time.monotonic())
+            if not event.wait(remaining):
+                error = f"Publish confirmation timeout after {timeout}s"
+                with self._pending_lock:
+                    self._pending.pop(mid, None)
 
-        start_time = time.time()
-        success, error = self._publish_and_verify(full_topic, payload)
-        duration_ms = (time.time() - start_time) * 1000
+        end_time = self._ack_times.pop(mid, None) or time.monotonic()
+        duration_ms = (end_time - start_time) * 1000
 
-        status = TestStatus.PASSED if success else TestStatus.FAILED
+        if error is None:
+            status = TestStatus.PASSED
+        else:
+            status = TestStatus.FAILED
+            self._fail_count += 1
 
         return TestResult(
             name=name,
@@ -255,151 +534,74 @@ class MQTTIntegrationTester:
         Returns:
             List of test results.
         """
-        self.results = []
-        current_time = time.time()
-
-        # Test 1: Bot Started Event
-        self.results.append(
-            self._run_test(
-                name="Bot Started Event",
-                topic_suffix="status/bot/started",
-                payload={
-                    "timestamp": current_time,
-                    "session_id": f"test-{uuid.uuid4().hex[:8]}",
-                    "initial_balance": 100.0,
-                    "version": "1.0.0-test",
-                    "environment": "integration-test",
-                },
+        # Render every payload up front so the publish loop below is pure I/O
+        messages = [
+            (
+                case.name,
+                f"{self.prefix}/{case.topic_suffix}",
+                _render_payload(case.template, case.id_offsets),
+                case.qos,
             )
-        )
+            for case in self._TEST_CASES
+        ]
 
-        # Test 2: Position Opened Event
-        self.results.append(
-            self._run_test(
-                name="Position Opened Event",
-                topic_suffix="trading/position/opened",
-                payload={
-                    "timestamp": current_time,
-                    "token_id": "test-token-123",
-                    "market_name": "Test Market - Will Bitcoin reach $100k?",
-                    "side": "YES",
-                    "amount": 10.0,
-                    "price": 0.55,
-                    "cost": 5.50,
-                },
-            )
-        )
-
-        # Test 3: Trade Completed Event
-        self.results.append(
-            self._run_test(
-                name="Trade Completed Event",
-                topic_suffix="trading/trade/completed",
-                payload={
-                    "timestamp": current_time,
-                    "trade_id": f"trade-{uuid.uuid4().hex[:8]}",
-                    "token_id": "test-token-123",
-                    "market_name": "Test Market",
-                    "side": "SELL",
-                    "pnl": 0.50,
-                    "pnl_percent": 9.09,
-                    "exit_price": 0.60,
-                    "hold_time_seconds": 3600,
-                },
-            )
-        )
-
-        # Test 4: Balance Update Event
-        self.results.append(
-            self._run_test(
-                name="Balance Update Event",
-                topic_suffix="balance/update",
-                payload={
-                    "timestamp": current_time,
-                    "balance": 100.50,
-                    "previous_balance": 100.0,
-                    "change": 0.50,
-                    "change_percent": 0.5,
-                },
-            )
-        )
-
-        # Test 5: Heartbeat Event
-        self.results.append(
-            self._run_test(
-                name="Heartbeat Event",
-                topic_suffix="status/bot/heartbeat",
-                payload={
-                    "timestamp": current_time,
-                    "uptime_seconds": 60,
-                    "active_positions": 1,
-                    "balance": 100.50,
-                    "memory_mb": 128.5,
-                    "cpu_percent": 5.2,
-                },
-            )
-        )
-
-        # Test 6: Bot Error Event
-        self.results.append(
-            self._run_test(
-                name="Bot Error Event",
-                topic_suffix="status/bot/error",
-                payload={
-                    "timestamp": current_time,
-                    "error_type": "TestError",
-                    "message": "This is a test error message for integration testing",
-                    "severity": "warning",
-                    "recoverable": True,
-                    "context": {"test_run": True, "source": "integration_test"},
-                },
-            )
-        )
+        # Publish every test message back to back so the PUBACKs are awaited
+        # in parallel instead of one round-trip at a time
+        self._fail_count = 0
+        in_flight = [self._start_test(*message) for message in messages]
 
+        self.results = [self._finish_test(test) for test in in_flight]
         return self.results
 
     def print_results(self) -> None:
-        """Print test results in a formatted output."""
-        print("\n" + "=" * 70)
-        print("INTEGRATION TEST RESULTS")
-        print("=" * 70)
-        print(f"Broker: {self.broker}:{self.port}")
-        print(f"Topic Prefix: {self.prefix}/")
-        print("-" * 70)
+        """Print test results in a formatted output.
 
-        passed = 0
-        failed = 0
+        The report is assembled in memory and written to stdout in one call.
+        """
+        lines = [
+            "",
+            "=" * 70,
+            "INTEGRATION TEST RESULTS",
+            "=" * 70,
+            f"Broker: {self.broker}:{self.port}",
+            f"Topic Prefix: {self.prefix}/",
+            "-" * 70,
+        ]
+
+        failed = self._fail_count
 
         for result in self.results:
             status_icon = "[PASS]" if result.status == TestStatus.PASSED else "[FAIL]"
-            print(f"\n{status_icon} {result.name}")
-            print(f"       Topic: {result.topic}")
-            print(f"       Duration: {result.duration_ms:.1f}ms")
+            lines.append(f"\n{status_icon} {result.name}")
+            lines.append(f"       Topic: {result.topic}")
+            lines.append(f"       Duration: {result.duration_ms:.1f}ms")
 
             if result.status == TestStatus.PASSED:
-                passed += 1
                 # Print payload for manual Discord verification
-                print("       Payload:")
-                payload_formatted = json.dumps(result.payload, indent=8)
-                for line in payload_formatted.split("\n"):
-                    print(f"         {line}")
+                lines.append("       Payload:")
+                payload_formatted = json.dumps(json.loads(result.payload), indent=8)
+                lines.append(textwrap.indent(payload_formatted, " " * 9))
             else:
-                failed += 1
-                print(f"       Error: {result.error}")
+                lines.append(f"       Error: {result.error}")
 
-        print("\n" + "-" * 70)
-        print("SUMMARY")
-        print("-" * 70)
-        print(f"Total Tests: {len(self.results)}")
-        print(f"Passed: {passed}")
-        print(f"Failed: {failed}")
+        lines.extend([
+            "\n" + "-" * 70,
+            "SUMMARY",
+            "-" * 70,
+            f"Total Tests: {len(self.results)}",
+            f"Passed: {len(self.results) - failed}",
+            f"Failed: {failed}",
+        ])
 
         if failed == 0:
-            print("\nAll tests passed! Bot is ready to connect to the broker.")
+            lines.append("\nAll tests passed! Bot is ready to connect to the broker.")
         else:
-            print(f"\n{failed} test(s) failed. Check broker connectivity and configuration.")
+            lines.append(f"\n{failed} test(s) failed. Check broker connectivity and configuration.")
+
+        lines.append("=" * 70)
 
-        print("=" * 70)
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
     def get_exit_code(self) -> int:
         """Get exit code based on test results.
@@ -407,7 +609,7 @@ class MQTTIntegrationTester:
         Returns:
             0 if all tests passed, 1 otherwise.
         """
-        return 0 if all(r.status == TestStatus.PASSED for r in self.results) else 1
+        return 0 if self._fail_count == 0 else 1
 
 
 def parse_args() -> argparse.Namespace:
@@ -425,6 +627,7 @@ Examples:
   %(prog)s --broker 192.168.1.100    Connect to remote broker
   %(prog)s --prefix mybot            Use custom topic prefix
   %(prog)s --port 8883               Use non-standard port
+  %(prog)s --resolve-once            Look up the broker address only once
         """,
     )
 
@@ -449,6 +652,26 @@ Examples:
         help="MQTT topic prefix (default: polyspike)",
     )
 
+    parser.add_argument(
+        "--resolve-once",
+        action="store_true",
+        help="Resolve the broker hostname once and connect by IP address",
+    )
+
+    parser.add_argument(
+        "--keepalive",
+        type=int,
+        default=5,
+        help="MQTT keepalive interval in seconds (default: 5)",
+    )
+
+    parser.add_argument(
+        "--reconnect-max-delay",
+        type=int,
+        default=8,
+        help="Maximum reconnect backoff in seconds (default: 8)",
+    )
+
     return parser.parse_args()
 
 
@@ -467,6 +690,9 @@ def main() -> int:
         broker=args.broker,
         port=args.port,
         prefix=args.prefix,
+        resolve_once=args.resolve_once,
+        keepalive=args.keepalive,
+        reconnect_max_delay=args.reconnect_max_delay,
     )
 
     if not tester.connect():
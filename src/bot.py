@@ -15,7 +15,9 @@ import discord
 from discord import app_commands
 
 from src.config import Config
+from src.handlers import balance_handler, trading_handler
 from src.handlers.heartbeat_monitor import HeartbeatMonitor
+from src.utils.embed_batcher import EmbedBatcher, SendResult
 from src.utils.logger import get_logger
 
 
@@ -61,8 +63,22 @@ class PolySpikeBot(discord.Client):
         # Discord channel cache
         self.notification_channel: Optional[discord.TextChannel] = None
 
-        # Shutdown flag
-        self._shutdown_requested = False
+        # Notifications ready within 500ms of each other share one message;
+        # sends are paced to Discord's 5 messages / 5s per-channel limit
+        self._embed_batcher = EmbedBatcher(
+            self._send_to_channel,
+            max_size=10,
+            wait=0.5,
+            min_interval=1.0,
+            max_pending=500,
+        )
+
+        # Shutdown serialization (concurrent callers wait for the first)
+        self._shutdown_lock = asyncio.Lock()
+        self._shutdown_done = asyncio.Event()
+
+        # Task awaiting a shutdown signal (set by setup_signal_handlers)
+        self._shutdown_watcher: Optional[asyncio.Task] = None
 
         self.logger.info("PolySpikeBot initialized")
 
@@ -178,9 +194,32 @@ class PolySpikeBot(discord.Client):
         self,
         embed: discord.Embed,
         content: Optional[str] = None,
+        urgent: bool = False,
     ) -> bool:
         """Safely send message to notification channel with error handling.
 
+        Embeds sent without text content are batched: those submitted within
+        500ms of each other (up to 10) go out as a single multi-embed message.
+
+        Args:
+            embed: Discord embed to send.
+            content: Optional text content to send with embed (bypasses batching).
+            urgent: Send the pending batch immediately (e.g. critical alerts).
+
+        Returns:
+            True if message was sent successfully, False otherwise.
+        """
+        if content is None:
+            return await self._embed_batcher.submit(embed, urgent=urgent)
+        return await self._send_to_channel([embed], content=content) is SendResult.SENT
+
+    async def _send_to_channel(
+        self,
+        embeds: list[discord.Embed],
+        content: Optional[str] = None,
+    ) -> SendResult:
+        """Send embeds to notification channel as one message.
+
         Handles common Discord errors:
         - Channel not found (deleted or bot removed from server)
         - Permission errors (missing Send Messages permission)
@@ -188,22 +227,23 @@ class PolySpikeBot(discord.Client):
         - Other Discord API errors
 
         Args:
-            embed: Discord embed to send.
-            content: Optional text content to send with embed.
+            embeds: Discord embeds to send (at most 10).
+            content: Optional text content to send with embeds.
 
         Returns:
-            True if message was sent successfully, False otherwise.
+            SendResult.SENT on success, SendResult.REJECTED if Discord refused
+            the payload itself (HTTP 400), SendResult.FAILED otherwise.
         """
         if self.notification_channel is None:
             self.logger.error(
                 "Cannot send message: notification channel not set. "
                 "Channel may not exist or bot lacks access."
             )
-            return False
+            return SendResult.FAILED
 
         try:
-            await self.notification_channel.send(content=content, embed=embed)
-            return True
+            await self.notification_channel.send(content=content, embeds=embeds)
+            return SendResult.SENT
 
         except discord.Forbidden as e:
             self.logger.error(
@@ -212,7 +252,7 @@ class PolySpikeBot(discord.Client):
                 f"Error: {e}. "
                 "Bot may be missing 'Send Messages' or 'Embed Links' permission."
             )
-            return False
+            return SendResult.FAILED
 
         except discord.NotFound as e:
             self.logger.error(
@@ -221,7 +261,7 @@ class PolySpikeBot(discord.Client):
             )
             # Clear cached channel since it no longer exists
             self.notification_channel = None
-            return False
+            return SendResult.FAILED
 
         except discord.HTTPException as e:
             if e.status == 429:  # Rate limited
@@ -233,47 +273,64 @@ class PolySpikeBot(discord.Client):
                 self.logger.error(
                     f"HTTP error when sending to Discord: {e.status} - {e.text}"
                 )
-            return False
+            if e.status == 400:  # Invalid form body: the payload itself was refused
+                return SendResult.REJECTED
+            return SendResult.FAILED
 
         except Exception as e:
             self.logger.error(
                 f"Unexpected error when sending message to Discord: {e}",
                 exc_info=True,
             )
-            return False
+            return SendResult.FAILED
 
     async def shutdown(self) -> None:
         """Gracefully shutdown bot and all components.
 
-        Stops:
-        - Heartbeat monitor
+        Stops, in order:
         - MQTT client
+        - Heartbeat monitor
+        - Balance and trade notification tasks (pending ones are sent first)
+        - Notification batcher (pending embeds are sent first)
         - Discord connection
 
-        Should be called before application exit.
+        Should be called before application exit. Safe to call concurrently:
+        later callers wait until the first shutdown has finished.
         """
-        if self._shutdown_requested:
+        if self._shutdown_lock.locked():
             self.logger.info("Shutdown already in progress")
-            return
 
-        self._shutdown_requested = True
-        self.logger.info("Initiating graceful shutdown...")
+        async with self._shutdown_lock:
+            if self._shutdown_done.is_set():
+                return
 
-        # Stop heartbeat monitor
-        if self.heartbeat_monitor is not None:
-            await self.heartbeat_monitor.stop_monitoring()
-            self.logger.info("Heartbeat monitor stopped")
+            self.logger.info("Initiating graceful shutdown...")
 
-        # Disconnect MQTT client (handled by main.py)
-        if self.mqtt_client is not None:
-            await self.mqtt_client.disconnect()
-            self.logger.info("MQTT client disconnected")
+            try:
+                # Stop the event sources first so no new notification can be
+                # submitted once the batcher is closed
+                if self.mqtt_client is not None:
+                    await self.mqtt_client.disconnect()
+                    self.logger.info("MQTT client disconnected")
 
-        # Close Discord connection
-        await self.close()
-        self.logger.info("Discord connection closed")
+                if self.heartbeat_monitor is not None:
+                    await self.heartbeat_monitor.stop_monitoring()
+                    self.logger.info("Heartbeat monitor stopped")
 
-        self.logger.info("Shutdown complete")
+                # Send notifications still waiting in the handlers' windows
+                await balance_handler.cancel_active_tasks()
+                await trading_handler.cancel_active_tasks()
+
+                # Flush pending notifications while the channel is still open
+                await self._embed_batcher.close()
+
+                # Close Discord connection
+                await self.close()
+                self.logger.info("Discord connection closed")
+            finally:
+                self._shutdown_done.set()
+
+            self.logger.info("Shutdown complete")
 
 
 def create_discord_bot(config: Config) -> PolySpikeBot:
@@ -298,6 +355,47 @@ def create_discord_bot(config: Config) -> PolySpikeBot:
     return bot
 
 
+def enable_eager_tasks() -> bool:
+    """Run new tasks on the current loop eagerly, where supported.
+
+    With asyncio.eager_task_factory (Python 3.12+), handler coroutines
+    scheduled via asyncio.create_task() run synchronously up to their first
+    real suspension point, and those that finish without suspending never
+    get scheduled on the loop at all. On older Pythons this is a no-op.
+
+    Returns:
+        True if the eager task factory was installed.
+    """
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is None:
+        return False
+
+    asyncio.get_running_loop().set_task_factory(eager_task_factory)
+    return True
+
+
+def _on_shutdown_signal(sig: signal.Signals, shutdown_event: asyncio.Event) -> None:
+    """Record a shutdown signal and wake the shutdown watcher.
+
+    Args:
+        sig: Signal that was received.
+        shutdown_event: Event awaited by the shutdown watcher.
+    """
+    get_logger().info(f"Received {sig.name}, initiating shutdown...")
+    shutdown_event.set()
+
+
+async def _shutdown_watcher(bot: PolySpikeBot, shutdown_event: asyncio.Event) -> None:
+    """Wait for a shutdown signal, then shut the bot down.
+
+    Args:
+        bot: Discord bot instance to shutdown.
+        shutdown_event: Event set by the signal handlers.
+    """
+    await shutdown_event.wait()
+    await bot.shutdown()
+
+
 async def setup_signal_handlers(bot: PolySpikeBot) -> None:
     """Set up signal handlers for graceful shutdown.
 
@@ -305,24 +403,20 @@ async def setup_signal_handlers(bot: PolySpikeBot) -> None:
     - SIGINT (Ctrl+C)
     - SIGTERM (kill command)
 
+    Both signals set a single event; one watcher task awaits it and runs
+    the shutdown, so repeated signals never spawn extra tasks.
+
     Args:
         bot: Discord bot instance to shutdown on signal.
     """
     logger = get_logger()
-
-    def signal_handler(sig: int) -> None:
-        """Handle shutdown signals."""
-        signal_name = signal.Signals(sig).name
-        logger.info(f"Received {signal_name}, initiating shutdown...")
-        asyncio.create_task(bot.shutdown())
-
-    # Register signal handlers
     loop = asyncio.get_running_loop()
+    shutdown_event = asyncio.Event()
 
+    # Register signal handlers
     for sig in (signal.SIGINT, signal.SIGTERM):
-        loop.add_signal_handler(
-            sig,
-            lambda s=sig: signal_handler(s)
-        )
+        loop.add_signal_handler(sig, _on_shutdown_signal, sig, shutdown_event)
+
+    bot._shutdown_watcher = asyncio.create_task(_shutdown_watcher(bot, shutdown_event))
 
     logger.info("Signal handlers registered (SIGINT, SIGTERM)")
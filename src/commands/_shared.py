@@ -0,0 +1,143 @@
+"""Helpers shared by the slash command modules."""
+
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+import discord
+
+from src.utils.logger import get_logger
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Error embed template; the description and timestamp are filled per call
+_ERROR_EMBED_TEMPLATE = discord.Embed(
+    title="Error",
+    color=discord.Color.red(),
+)
+
+
+# (embed color, emoji) keyed by the sign of a P&L value
+_PNL_STYLE = {
+    1: (discord.Color.green(), "📈"),
+    -1: (discord.Color.red(), "📉"),
+    0: (discord.Color.light_gray(), "⚪"),
+}
+
+
+def pnl_style(value: float) -> tuple[discord.Color, str]:
+    """Get the embed color and emoji for a P&L value.
+
+    Args:
+        value: Profit (positive) or loss (negative) amount.
+
+    Returns:
+        Tuple of (color, emoji): green/📈 for profit, red/📉 for loss,
+        light gray/⚪ for break-even.
+    """
+    return _PNL_STYLE[(value > 0) - (value < 0)]
+
+
+class EmbedDebouncer:
+    """Per-user cache of the last embed a command sent.
+
+    Lets a command answer repeated invocations from the same user within a
+    short window with the embed it just built, instead of rebuilding it and
+    adding to Discord rate-limit pressure.
+    """
+
+    def __init__(self, window: float = 2.0, max_age: float = 60.0):
+        """Initialize the debouncer.
+
+        Args:
+            window: Seconds during which a user's last embed is reused.
+            max_age: Seconds after which stale entries are pruned.
+        """
+        self.window = window
+        self.max_age = max_age
+        self._recent: dict[int, tuple[float, discord.Embed]] = {}
+        self._last_prune = time.monotonic()
+
+    def get(self, user_id: int) -> Optional[discord.Embed]:
+        """Get the embed last sent to a user, if still within the window.
+
+        Args:
+            user_id: Discord user ID.
+
+        Returns:
+            Recently sent embed, or None if there is none to reuse.
+        """
+        cached = self._recent.get(user_id)
+        if cached is not None and time.monotonic() - cached[0] < self.window:
+            return cached[1]
+        return None
+
+    def put(self, user_id: int, embed: discord.Embed) -> None:
+        """Record the embed just sent to a user.
+
+        Call only after the send succeeded, so a reply the user never saw
+        is not reused.
+
+        Args:
+            user_id: Discord user ID.
+            embed: Embed that was sent.
+        """
+        now = time.monotonic()
+        self._recent[user_id] = (now, embed)
+
+        # Opportunistically drop entries nobody will reuse
+        if now - self._last_prune >= self.max_age:
+            self._recent = {
+                uid: entry for uid, entry in self._recent.items()
+                if now - entry[0] < self.max_age
+            }
+            self._last_prune = now
+
+    def clear(self) -> None:
+        """Forget all cached embeds."""
+        self._recent.clear()
+
+
+def utc_from_ts(ts: float) -> datetime:
+    """Convert a Unix timestamp to an aware UTC datetime.
+
+    Pure arithmetic on the epoch, so no platform time conversion is involved.
+    Microsecond precision is preserved.
+
+    Args:
+        ts: Unix timestamp in seconds.
+
+    Returns:
+        Timezone-aware datetime in UTC.
+    """
+    return _EPOCH + timedelta(seconds=ts)
+
+
+async def send_error(
+    interaction: discord.Interaction,
+    description: str,
+    now: Optional[datetime] = None,
+) -> None:
+    """Send an ephemeral error embed in response to a slash command.
+
+    Uses a followup if the interaction was already deferred or answered,
+    otherwise responds directly. Failures to send are logged, not raised.
+
+    Args:
+        interaction: Discord interaction the command was invoked with.
+        description: Error message shown to the user.
+        now: Embed timestamp (defaults to the current UTC time).
+    """
+    error_embed = _ERROR_EMBED_TEMPLATE.copy()
+    error_embed.description = description
+    error_embed.timestamp = now if now is not None else datetime.now(timezone.utc)
+
+    try:
+        if interaction.response.is_done():
+            await interaction.followup.send(embed=error_embed, ephemeral=True)
+        else:
+            await interaction.response.send_message(embed=error_embed, ephemeral=True)
+    except Exception:
+        # If sending error message fails, log it
+        get_logger().error("Failed to send error message to user")
@@ -4,19 +4,49 @@ Displays current trading bot balance and P&L information
 from cached balance data received via MQTT.
 """
 
+import sys
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Optional
 
 import discord
 from discord import app_commands
 
+from src.commands._shared import EmbedDebouncer, pnl_style, send_error, utc_from_ts
 from src.handlers import balance_handler
 from src.utils.logger import get_logger
 
 
+# Repeated /balance calls from the same user within 2s reuse the last embed
+_recent_replies = EmbedDebouncer(window=2.0)
+
+
+# "Total Realized P&L" field names for each P&L emoji, built once
+_TOTAL_PNL_FIELD_NAMES = {
+    emoji: sys.intern(f"{emoji} Total Realized P&L") for emoji in ("📈", "📉", "⚪")
+}
+
+# Static embed, built once and copied per invocation
+_NO_DATA_EMBED = discord.Embed(
+    title="⚪ Balance: No Data",
+    description=(
+        "No balance update received from trading bot yet.\n\n"
+        "**Possible reasons:**\n"
+        "• Trading bot is not running\n"
+        "• No balance update sent yet (sent every 12h or after trades)\n"
+        "• MQTT connection issue"
+    ),
+    color=discord.Color.light_gray(),
+)
+_NO_DATA_EMBED.set_footer(text="Balance updates: every 12h or after trades")
+
+
+@lru_cache(maxsize=2048)
 def format_currency(value: float) -> str:
     """Format currency value with proper sign and 2 decimal places.
 
+    Results are memoized; P&L values repeat often between updates.
+
     Args:
         value: Currency value to format.
 
@@ -31,9 +61,12 @@ def format_currency(value: float) -> str:
         return f"${value:.2f}"
 
 
+@lru_cache(maxsize=2048)
 def format_percentage(value: float) -> str:
     """Format percentage value with proper sign.
 
+    Results are memoized like format_currency().
+
     Args:
         value: Percentage value as decimal (e.g., 0.0523 for 5.23%).
 
@@ -68,9 +101,17 @@ async def balance_command(interaction: discord.Interaction) -> None:
         interaction: Discord interaction object from slash command invocation.
     """
     logger = get_logger()
-    logger.info(f"/balance command invoked by {interaction.user} ({interaction.user.id})")
+    logger.info("/balance command invoked by %s (%s)", interaction.user, interaction.user.id)
+    now = datetime.now(timezone.utc)
 
     try:
+        # Answer spammed invocations with the embed we just sent
+        cached_embed = _recent_replies.get(interaction.user.id)
+        if cached_embed is not None:
+            await interaction.response.send_message(embed=cached_embed)
+            logger.info("/balance: Reused recent reply")
+            return
+
         # Defer response
         await interaction.response.defer(thinking=True)
 
@@ -79,21 +120,11 @@ async def balance_command(interaction: discord.Interaction) -> None:
 
         # Case 1: No balance data available yet
         if balance_data is None:
-            embed = discord.Embed(
-                title="⚪ Balance: No Data",
-                description=(
-                    "No balance update received from trading bot yet.\n\n"
-                    "**Possible reasons:**\n"
-                    "• Trading bot is not running\n"
-                    "• No balance update sent yet (sent every 12h or after trades)\n"
-                    "• MQTT connection issue"
-                ),
-                color=discord.Color.light_gray(),
-                timestamp=datetime.now(timezone.utc),
-            )
-            embed.set_footer(text="Balance updates: every 12h or after trades")
+            embed = _NO_DATA_EMBED.copy()
+            embed.timestamp = now
 
             await interaction.followup.send(embed=embed)
+            _recent_replies.put(interaction.user.id, embed)
             logger.info("/balance: No balance data available")
             return
 
@@ -105,112 +136,72 @@ async def balance_command(interaction: discord.Interaction) -> None:
         unrealized_pnl = balance_data.get("unrealized_pnl", 0.0)
         total_pnl = balance_data.get("total_pnl", 0.0)
         update_reason = balance_data.get("update_reason", "unknown")
-        timestamp = balance_data.get("timestamp", datetime.now(timezone.utc).timestamp())
+        timestamp = balance_data.get("timestamp", now.timestamp())
 
         # Determine embed color and emoji based on total P&L
-        if total_pnl > 0:
-            color = discord.Color.green()
-            pnl_emoji = "📈"
-        elif total_pnl < 0:
-            color = discord.Color.red()
-            pnl_emoji = "📉"
-        else:
-            color = discord.Color.light_gray()
-            pnl_emoji = "⚪"
-
-        # Create embed
-        embed = discord.Embed(
-            title="Trading Bot Balance",
-            description=f"Current account status and P&L",
-            color=color,
-            timestamp=datetime.fromtimestamp(timestamp, tz=timezone.utc),
-        )
+        color, pnl_emoji = pnl_style(total_pnl)
 
-        # Balance section
-        embed.add_field(
-            name="Cash Balance",
-            value=f"**${balance:.2f}**",
-            inline=True,
-        )
-
-        embed.add_field(
-            name="Total Equity",
-            value=f"**${equity:.2f}**",
-            inline=True,
-        )
-
-        embed.add_field(
-            name="Available",
-            value=f"${available_balance:.2f}",
-            inline=True,
-        )
+        fields = [
+            # Balance section
+            {"name": "Cash Balance", "value": f"**${balance:.2f}**", "inline": True},
+            {"name": "Total Equity", "value": f"**${equity:.2f}**", "inline": True},
+            {"name": "Available", "value": f"${available_balance:.2f}", "inline": True},
+        ]
 
         # Position info
         if locked_in_positions > 0:
-            embed.add_field(
-                name="Locked (Open Positions)",
-                value=f"${locked_in_positions:.2f}",
-                inline=True,
-            )
+            fields.append({
+                "name": "Locked (Open Positions)",
+                "value": f"${locked_in_positions:.2f}",
+                "inline": True,
+            })
 
         # P&L section
         if unrealized_pnl != 0:
-            unrealized_display = format_currency(unrealized_pnl)
-            embed.add_field(
-                name="Unrealized P&L",
-                value=f"**{unrealized_display}**",
-                inline=True,
-            )
+            fields.append({
+                "name": "Unrealized P&L",
+                "value": f"**{format_currency(unrealized_pnl)}**",
+                "inline": True,
+            })
 
         # Total P&L (most important metric)
-        total_pnl_display = format_currency(total_pnl)
-
-        # Calculate P&L percentage if we can infer initial balance
-        # Assuming total_pnl is profit/loss from initial balance
-        # We don't have initial balance in the payload, so we can't calculate exact %
-        # But we can show the absolute value prominently
-
-        embed.add_field(
-            name=f"{pnl_emoji} Total Realized P&L",
-            value=f"**{total_pnl_display}**",
-            inline=True,
-        )
+        # We don't have initial balance in the payload, so we can't calculate
+        # an exact %, but we can show the absolute value prominently
+        fields.append({
+            "name": _TOTAL_PNL_FIELD_NAMES[pnl_emoji],
+            "value": f"**{format_currency(total_pnl)}**",
+            "inline": True,
+        })
 
         # Update reason
-        embed.add_field(
-            name="Last Update Reason",
-            value=f"{update_reason.replace('_', ' ').title()}",
-            inline=False,
-        )
-
-        # Footer with update frequency info
-        embed.set_footer(
-            text="Balance updates: every 12h, after trades, or on significant changes"
-        )
+        fields.append({
+            "name": "Last Update Reason",
+            "value": update_reason.replace("_", " ").title(),
+            "inline": False,
+        })
+
+        # Build the whole embed in one pass
+        embed = discord.Embed.from_dict({
+            "title": "Trading Bot Balance",
+            "description": "Current account status and P&L",
+            "color": color.value,
+            "timestamp": utc_from_ts(timestamp).isoformat(),
+            "fields": fields,
+            "footer": {"text": "Balance updates: every 12h, after trades, or on significant changes"},
+        })
 
         await interaction.followup.send(embed=embed)
+        _recent_replies.put(interaction.user.id, embed)
         logger.info(
-            f"/balance: Balance sent successfully (balance=${balance:.2f}, pnl={total_pnl:+.2f})"
+            "/balance: Balance sent successfully (balance=$%.2f, pnl=%+.2f)", balance, total_pnl
         )
 
     except Exception as e:
-        logger.error(f"Error in /balance command: {e}", exc_info=True)
+        logger.error("Error in /balance command: %s", e, exc_info=True)
 
         # Send error message to user
-        error_embed = discord.Embed(
-            title="Error",
-            description=(
-                "An error occurred while fetching balance data. "
-                "Please try again later."
-            ),
-            color=discord.Color.red(),
-            timestamp=datetime.now(timezone.utc),
+        await send_error(
+            interaction,
+            "An error occurred while fetching balance data. Please try again later.",
+            now,
         )
-
-        try:
-            if interaction.response.is_done():
-                await interaction.followup.send(embed=error_embed, ephemeral=True)
-            else:
-                await interaction.response.send_message(embed=error_embed, ephemeral=True)
-        except Exception:
-            logger.error("Failed to send error message to user")
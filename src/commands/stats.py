@@ -4,20 +4,35 @@ Displays trading session statistics from MQTT session stats messages.
 Caches last session stats for display via /stats command.
 """
 
+import sys
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 
 import discord
 from discord import app_commands
 
+from src.commands._shared import EmbedDebouncer, pnl_style, send_error, utc_from_ts
 from src.utils.logger import get_logger
 
 
-# Cache for last session stats (from polyspike/stats/session retained message)
-_last_session_stats: Optional[Dict[str, Any]] = None
+# Repeated /stats calls from the same user within 2s reuse the last embed
+_recent_replies = EmbedDebouncer(window=2.0)
 
 
-def cache_session_stats(payload: Dict[str, Any]) -> None:
+# "Total P&L" field names keyed by whether the session was profitable
+_TOTAL_PNL_FIELD_NAMES = {
+    True: sys.intern("📈 Total P&L"),
+    False: sys.intern("📉 Total P&L"),
+}
+
+# Cache for last session stats (from polyspike/stats/session retained message).
+# Stored as a read-only snapshot so readers can share it without copying.
+_last_session_stats: Optional[Mapping[str, Any]] = None
+
+
+def cache_session_stats(payload: dict[str, Any]) -> None:
     """Cache session stats data for /stats command.
 
     Should be called by MQTT handler when session stats message is received.
@@ -32,19 +47,20 @@ def cache_session_stats(payload: Dict[str, Any]) -> None:
             - max_drawdown, avg_win, avg_loss
     """
     global _last_session_stats
-    _last_session_stats = payload.copy()
+    _last_session_stats = MappingProxyType(dict(payload))
 
     logger = get_logger()
     logger.debug("Cached session stats for /stats command")
 
 
-def get_last_session_stats() -> Optional[Dict[str, Any]]:
+def get_last_session_stats() -> Optional[Mapping[str, Any]]:
     """Get the last cached session stats.
 
     Returns:
-        Copy of last session stats dict, or None if no stats received yet.
+        Read-only view of the last session stats, or None if no stats
+        received yet.
     """
-    return _last_session_stats.copy() if _last_session_stats else None
+    return _last_session_stats if _last_session_stats else None
 
 
 def clear_stats_cache() -> None:
@@ -58,6 +74,7 @@ def clear_stats_cache() -> None:
     logger.info("Cleared session stats cache")
 
 
+@lru_cache(maxsize=4096)
 def format_duration(seconds: int) -> str:
     """Format duration in seconds to human-readable string.
 
@@ -67,19 +84,15 @@ def format_duration(seconds: int) -> str:
     Returns:
         Formatted string (e.g., "2h 15m", "45m 30s").
     """
-    hours = seconds // 3600
-    minutes = (seconds % 3600) // 60
-    secs = seconds % 60
+    hours, rem = divmod(seconds, 3600)
+    minutes, secs = divmod(rem, 60)
 
-    parts = []
+    # Show minutes if we have hours; only show seconds if less than 1 hour
     if hours > 0:
-        parts.append(f"{hours}h")
-    if minutes > 0 or hours > 0:  # Show minutes if we have hours
-        parts.append(f"{minutes}m")
-    if secs > 0 and hours == 0:  # Only show seconds if less than 1 hour
-        parts.append(f"{secs}s")
-
-    return " ".join(parts) if parts else "0s"
+        return f"{hours}h {minutes}m"
+    if minutes > 0:
+        return f"{minutes}m {secs}s" if secs > 0 else f"{minutes}m"
+    return f"{secs}s" if secs > 0 else "0s"
 
 
 @app_commands.command(
@@ -101,9 +114,17 @@ async def stats_command(interaction: discord.Interaction) -> None:
         interaction: Discord interaction object from slash command invocation.
     """
     logger = get_logger()
-    logger.info(f"/stats command invoked by {interaction.user} ({interaction.user.id})")
+    logger.info("/stats command invoked by %s (%s)", interaction.user, interaction.user.id)
+    now = datetime.now(timezone.utc)
 
     try:
+        # Answer spammed invocations with the embed we just sent
+        cached_embed = _recent_replies.get(interaction.user.id)
+        if cached_embed is not None:
+            await interaction.response.send_message(embed=cached_embed)
+            logger.info("/stats: Reused recent reply")
+            return
+
         # Defer response
         await interaction.response.defer(thinking=True)
 
@@ -123,11 +144,12 @@ async def stats_command(interaction: discord.Interaction) -> None:
                     "Stats are published as retained messages when the trading bot stops."
                 ),
                 color=discord.Color.light_gray(),
-                timestamp=datetime.now(timezone.utc),
+                timestamp=now,
             )
             embed.set_footer(text="Session stats are sent when trading bot stops")
 
             await interaction.followup.send(embed=embed)
+            _recent_replies.put(interaction.user.id, embed)
             logger.info("/stats: No session stats data available")
             return
 
@@ -145,139 +167,87 @@ async def stats_command(interaction: discord.Interaction) -> None:
         max_drawdown = stats_data.get("max_drawdown", 0.0)
         avg_win = stats_data.get("avg_win", 0.0)
         avg_loss = stats_data.get("avg_loss", 0.0)
-        timestamp = stats_data.get("timestamp", datetime.now(timezone.utc).timestamp())
+        timestamp = stats_data.get("timestamp", now.timestamp())
 
         # Determine embed color based on total P&L
-        if total_pnl > 0:
-            color = discord.Color.green()
-        elif total_pnl < 0:
-            color = discord.Color.red()
-        else:
-            color = discord.Color.light_gray()
-
-        # Create embed
-        embed = discord.Embed(
-            title="Trading Session Statistics",
-            description=f"Session: `{session_id}`",
-            color=color,
-            timestamp=datetime.fromtimestamp(timestamp, tz=timezone.utc),
-        )
-
-        # Session info
-        duration_str = format_duration(duration_seconds)
-        embed.add_field(
-            name="Session Duration",
-            value=duration_str,
-            inline=True,
-        )
-
-        embed.add_field(
-            name="Initial Balance",
-            value=f"${initial_balance:.2f}",
-            inline=True,
-        )
-
-        embed.add_field(
-            name="Final Balance",
-            value=f"${final_balance:.2f}",
-            inline=True,
-        )
+        color, _ = pnl_style(total_pnl)
 
         # P&L metrics
         pnl_sign = "+" if total_pnl >= 0 else ""
         pnl_pct_sign = "+" if total_pnl_pct >= 0 else ""
-        status_emoji = "📈" if total_pnl >= 0 else "📉"
-
-        embed.add_field(
-            name=f"{status_emoji} Total P&L",
-            value=f"**{pnl_sign}${total_pnl:.2f}** ({pnl_pct_sign}{total_pnl_pct*100:.2f}%)",
-            inline=False,
-        )
-
-        # Trade statistics
-        embed.add_field(
-            name="Total Trades",
-            value=f"**{total_trades}**",
-            inline=True,
-        )
-
-        embed.add_field(
-            name="Winning Trades",
-            value=f"{winning_trades}",
-            inline=True,
-        )
-
-        embed.add_field(
-            name="Losing Trades",
-            value=f"{losing_trades}",
-            inline=True,
-        )
-
-        # Win rate
+        total_pnl_name = _TOTAL_PNL_FIELD_NAMES[total_pnl >= 0]
         win_rate_pct = win_rate * 100
 
-        embed.add_field(
-            name="Win Rate",
-            value=f"**{win_rate_pct:.1f}%**",
-            inline=True,
-        )
-
-        # Average metrics
-        embed.add_field(
-            name="Avg Win",
-            value=f"${avg_win:.2f}",
-            inline=True,
-        )
-
-        embed.add_field(
-            name="Avg Loss",
-            value=f"${abs(avg_loss):.2f}",
-            inline=True,
-        )
-
-        # Risk metrics
-        embed.add_field(
-            name="Max Drawdown",
-            value=f"${max_drawdown:.2f}",
-            inline=True,
-        )
-
-        # Profit factor (if we have data)
-        if avg_loss != 0 and losing_trades > 0:
-            profit_factor = (avg_win * winning_trades) / abs(avg_loss * losing_trades)
-            embed.add_field(
-                name="Profit Factor",
-                value=f"{profit_factor:.2f}",
-                inline=True,
+        def iter_fields():
+            """Yield (name, value, inline) for each field worth showing.
+
+            Zero-valued metrics are skipped so an empty session does not
+            produce a wall of zeros.
+            """
+            # Session info
+            yield "Session Duration", format_duration(duration_seconds), True
+            if initial_balance:
+                yield "Initial Balance", f"${initial_balance:.2f}", True
+            if final_balance:
+                yield "Final Balance", f"${final_balance:.2f}", True
+            yield (
+                total_pnl_name,
+                f"**{pnl_sign}${total_pnl:.2f}** ({pnl_pct_sign}{total_pnl_pct*100:.2f}%)",
+                False,
             )
 
-        # Footer
-        embed.set_footer(text="Last completed trading session")
+            # Trade statistics
+            yield "Total Trades", f"**{total_trades}**", True
+            if total_trades:
+                if winning_trades:
+                    yield "Winning Trades", f"{winning_trades}", True
+                if losing_trades:
+                    yield "Losing Trades", f"{losing_trades}", True
+                yield "Win Rate", f"**{win_rate_pct:.1f}%**", True
+
+                # Average metrics
+                if avg_win:
+                    yield "Avg Win", f"${avg_win:.2f}", True
+                if avg_loss:
+                    yield "Avg Loss", f"${abs(avg_loss):.2f}", True
+
+            # Risk metrics
+            if max_drawdown:
+                yield "Max Drawdown", f"${max_drawdown:.2f}", True
+
+            # Profit factor (if we have data)
+            if avg_loss != 0 and losing_trades > 0:
+                profit_factor = (avg_win * winning_trades) / abs(avg_loss * losing_trades)
+                yield "Profit Factor", f"{profit_factor:.2f}", True
+
+        fields = [
+            {"name": name, "value": value, "inline": inline}
+            for name, value, inline in iter_fields()
+        ]
+
+        # Build the whole embed in one pass
+        embed = discord.Embed.from_dict({
+            "title": "Trading Session Statistics",
+            "description": f"Session: `{session_id}`",
+            "color": color.value,
+            "timestamp": utc_from_ts(timestamp).isoformat(),
+            "fields": fields,
+            "footer": {"text": "Last completed trading session"},
+        })
 
         await interaction.followup.send(embed=embed)
+        _recent_replies.put(interaction.user.id, embed)
         logger.info(
-            f"/stats: Stats sent successfully (session={session_id}, "
-            f"trades={total_trades}, win_rate={win_rate_pct:.1f}%, pnl={total_pnl:+.2f})"
+            "/stats: Stats sent successfully (session=%s, trades=%s, win_rate=%.1f%%, pnl=%+.2f)",
+            session_id, total_trades, win_rate_pct, total_pnl,
         )
 
     except Exception as e:
-        logger.error(f"Error in /stats command: {e}", exc_info=True)
+        logger.error("Error in /stats command: %s", e, exc_info=True)
 
         # Send error message to user
-        error_embed = discord.Embed(
-            title="Error",
-            description=(
-                "An error occurred while fetching session statistics. "
-                "Please try again later."
-            ),
-            color=discord.Color.red(),
-            timestamp=datetime.now(timezone.utc),
+        await send_error(
+            interaction,
+            "An error occurred while fetching session statistics. Please try again later.",
+            now,
         )
-
-        try:
-            if interaction.response.is_done():
-                await interaction.followup.send(embed=error_embed, ephemeral=True)
-            else:
-                await interaction.response.send_message(embed=error_embed, ephemeral=True)
-        except Exception:
-            logger.error("Failed to send error message to user")
@@ -5,64 +5,16 @@ Shows online/offline status, uptime, balance, and trade statistics.
 """
 
 from datetime import datetime, timezone
-from typing import Optional
 
 import discord
 from discord import app_commands
 
+from src.commands._shared import EmbedDebouncer, send_error
 from src.utils.logger import get_logger
 
 
-def format_uptime(seconds: int) -> str:
-    """Format uptime seconds into human-readable string.
-
-    Args:
-        seconds: Uptime in seconds.
-
-    Returns:
-        Formatted uptime string (e.g., "2h 15m 30s").
-    """
-    hours = seconds // 3600
-    minutes = (seconds % 3600) // 60
-    secs = seconds % 60
-
-    parts = []
-    if hours > 0:
-        parts.append(f"{hours}h")
-    if minutes > 0:
-        parts.append(f"{minutes}m")
-    if secs > 0 or not parts:  # Always show seconds if no other parts
-        parts.append(f"{secs}s")
-
-    return " ".join(parts)
-
-
-def format_timestamp_relative(timestamp: float) -> str:
-    """Format timestamp as relative time (e.g., '2 minutes ago').
-
-    Args:
-        timestamp: Unix timestamp.
-
-    Returns:
-        Human-readable relative time string.
-    """
-    from datetime import datetime
-    import time
-
-    now = time.time()
-    diff = int(now - timestamp)
-
-    if diff < 60:
-        return f"{diff} seconds ago"
-    elif diff < 3600:
-        minutes = diff // 60
-        return f"{minutes} minute{'s' if minutes != 1 else ''} ago"
-    elif diff < 86400:
-        hours = diff // 3600
-        return f"{hours} hour{'s' if hours != 1 else ''} ago"
-    else:
-        days = diff // 86400
-        return f"{days} day{'s' if days != 1 else ''} ago"
+# Repeated /status calls from the same user within 2s reuse the last embed
+_recent_replies = EmbedDebouncer(window=2.0)
 
 
 @app_commands.command(
@@ -81,9 +33,17 @@ async def status_command(interaction: discord.Interaction) -> None:
         interaction: Discord interaction object from slash command invocation.
     """
     logger = get_logger()
-    logger.info(f"/status command invoked by {interaction.user} ({interaction.user.id})")
+    logger.info("/status command invoked by %s (%s)", interaction.user, interaction.user.id)
+    now = datetime.now(timezone.utc)
 
     try:
+        # Answer spammed invocations with the embed we just sent
+        cached_embed = _recent_replies.get(interaction.user.id)
+        if cached_embed is not None:
+            await interaction.response.send_message(embed=cached_embed)
+            logger.info("/status: Reused recent reply")
+            return
+
         # Defer response (commands can take a moment to process)
         await interaction.response.defer(thinking=True)
 
@@ -96,17 +56,16 @@ async def status_command(interaction: discord.Interaction) -> None:
                 title="❓ Status Unknown",
                 description="Heartbeat monitor not initialized. Bot may still be starting up.",
                 color=discord.Color.light_gray(),
-                timestamp=datetime.now(timezone.utc),
+                timestamp=now,
             )
             await interaction.followup.send(embed=embed)
+            _recent_replies.put(interaction.user.id, embed)
             return
 
         heartbeat_monitor = bot.heartbeat_monitor
 
-        # Get heartbeat data
-        last_heartbeat_time = heartbeat_monitor.get_last_heartbeat_time()
-        is_online = heartbeat_monitor.is_bot_online()
-        time_since_heartbeat = heartbeat_monitor.get_time_since_last_heartbeat()
+        # Get heartbeat data (one consistent view)
+        last_heartbeat_time, is_online, time_since_heartbeat = heartbeat_monitor.snapshot()
 
         # Case 1: No heartbeat data received yet
         if last_heartbeat_time is None:
@@ -120,17 +79,19 @@ async def status_command(interaction: discord.Interaction) -> None:
                     "• MQTT connection issue"
                 ),
                 color=discord.Color.light_gray(),
-                timestamp=datetime.now(timezone.utc),
+                timestamp=now,
             )
             embed.set_footer(text="Heartbeats are sent every 30 seconds")
 
             await interaction.followup.send(embed=embed)
+            _recent_replies.put(interaction.user.id, embed)
             logger.info("/status: No heartbeat data available")
             return
 
         # Case 2: Bot is offline (heartbeat timeout)
         if not is_online:
-            last_seen = format_timestamp_relative(last_heartbeat_time)
+            # Discord renders relative timestamps client-side, so they stay current
+            last_seen = f"<t:{int(last_heartbeat_time)}:R>"
 
             embed = discord.Embed(
                 title="Trading Bot Status: OFFLINE",
@@ -140,13 +101,10 @@ async def status_command(interaction: discord.Interaction) -> None:
                     f"Timeout threshold: {heartbeat_monitor.timeout_seconds}s"
                 ),
                 color=discord.Color.orange(),
-                timestamp=datetime.now(timezone.utc),
+                timestamp=now,
             )
 
             # Add last heartbeat timestamp
-            last_heartbeat_dt = datetime.fromtimestamp(
-                last_heartbeat_time, tz=timezone.utc
-            )
             embed.add_field(
                 name="Last Seen",
                 value=f"<t:{int(last_heartbeat_time)}:F>",
@@ -158,7 +116,8 @@ async def status_command(interaction: discord.Interaction) -> None:
             )
 
             await interaction.followup.send(embed=embed)
-            logger.info(f"/status: Bot offline (last heartbeat: {last_seen})")
+            _recent_replies.put(interaction.user.id, embed)
+            logger.info("/status: Bot offline (last heartbeat: %.0fs ago)", time_since_heartbeat)
             return
 
         # Case 3: Bot is online - show full status
@@ -169,11 +128,11 @@ async def status_command(interaction: discord.Interaction) -> None:
             title="Trading Bot Status: ONLINE",
             description="Trading bot is active and sending heartbeats",
             color=discord.Color.green(),
-            timestamp=datetime.now(timezone.utc),
+            timestamp=now,
         )
 
         # Last heartbeat time
-        last_seen = format_timestamp_relative(last_heartbeat_time)
+        last_seen = f"<t:{int(last_heartbeat_time)}:R>"
         embed.add_field(
             name="Last Heartbeat",
             value=f"{last_seen}",
@@ -209,27 +168,15 @@ async def status_command(interaction: discord.Interaction) -> None:
         embed.set_footer(text="Heartbeat interval: 30 seconds")
 
         await interaction.followup.send(embed=embed)
+        _recent_replies.put(interaction.user.id, embed)
         logger.info("/status: Bot online, status sent successfully")
 
     except Exception as e:
-        logger.error(f"Error in /status command: {e}", exc_info=True)
+        logger.error("Error in /status command: %s", e, exc_info=True)
 
         # Send error message to user
-        error_embed = discord.Embed(
-            title="Error",
-            description=(
-                "An error occurred while fetching bot status. "
-                "Please try again later."
-            ),
-            color=discord.Color.red(),
-            timestamp=datetime.now(timezone.utc),
+        await send_error(
+            interaction,
+            "An error occurred while fetching bot status. Please try again later.",
+            now,
         )
-
-        try:
-            if interaction.response.is_done():
-                await interaction.followup.send(embed=error_embed, ephemeral=True)
-            else:
-                await interaction.response.send_message(embed=error_embed, ephemeral=True)
-        except Exception:
-            # If sending error message fails, log it
-            logger.error("Failed to send error message to user")
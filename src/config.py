@@ -2,10 +2,11 @@
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from dotenv import load_dotenv
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Config:
     """Bot configuration loaded from environment variables."""
 
@@ -27,10 +28,51 @@ class Config:
     log_level: str
     log_file_path: str | None = None  # Optional file logging path
 
+    # Trade dedup (approximate Bloom filter instead of exact set)
+    trade_dedup_bloom: bool = False
 
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment variable ("1", "true", "yes", "on")."""
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+# (field name, environment variable, default, caster) for each Config field.
+# A default of None means the variable is optional and left as None if unset.
+_SPEC = (
+    # Discord
+    ("discord_bot_token", "DISCORD_BOT_TOKEN", None, str),
+    ("discord_guild_id", "DISCORD_GUILD_ID", None, int),
+    ("discord_channel_id", "DISCORD_CHANNEL_ID", None, int),
+
+    # MQTT
+    ("mqtt_broker_host", "MQTT_BROKER_HOST", "localhost", str),
+    ("mqtt_broker_port", "MQTT_BROKER_PORT", "1883", int),
+    ("mqtt_topic_prefix", "MQTT_TOPIC_PREFIX", "polyspike/", str),
+
+    # Monitoring
+    ("heartbeat_timeout_seconds", "HEARTBEAT_TIMEOUT_SECONDS", "90", int),
+    ("heartbeat_check_interval", "HEARTBEAT_CHECK_INTERVAL", "30", int),
+
+    # Logging
+    ("log_level", "LOG_LEVEL", "INFO", str),
+    ("log_file_path", "LOG_FILE_PATH", None, str),
+
+    # Trade dedup
+    ("trade_dedup_bloom", "TRADE_DEDUP_BLOOM", "false", _parse_bool),
+)
+
+# Environment variables that must be set to a non-empty value
+_REQUIRED = ("DISCORD_BOT_TOKEN", "DISCORD_GUILD_ID", "DISCORD_CHANNEL_ID")
+
+
+@lru_cache(maxsize=1)
 def load_config() -> Config:
     """Load configuration from .env file.
 
+    The result is cached, so .env is read once per process and every caller
+    shares the same (immutable) Config instance.
+
     Returns:
         Config: Configuration object with all settings.
 
@@ -41,37 +83,13 @@ def load_config() -> Config:
     load_dotenv()
 
     # Validate required Discord variables
-    discord_token = os.getenv("DISCORD_BOT_TOKEN")
-    if not discord_token:
-        raise ValueError("DISCORD_BOT_TOKEN is required in .env file")
-
-    guild_id = os.getenv("DISCORD_GUILD_ID")
-    if not guild_id:
-        raise ValueError("DISCORD_GUILD_ID is required in .env file")
-
-    channel_id = os.getenv("DISCORD_CHANNEL_ID")
-    if not channel_id:
-        raise ValueError("DISCORD_CHANNEL_ID is required in .env file")
-
-    # Create config object with defaults
-    config = Config(
-        # Discord
-        discord_bot_token=discord_token,
-        discord_guild_id=int(guild_id),
-        discord_channel_id=int(channel_id),
-
-        # MQTT
-        mqtt_broker_host=os.getenv("MQTT_BROKER_HOST", "localhost"),
-        mqtt_broker_port=int(os.getenv("MQTT_BROKER_PORT", "1883")),
-        mqtt_topic_prefix=os.getenv("MQTT_TOPIC_PREFIX", "polyspike/"),
-
-        # Monitoring
-        heartbeat_timeout_seconds=int(os.getenv("HEARTBEAT_TIMEOUT_SECONDS", "90")),
-        heartbeat_check_interval=int(os.getenv("HEARTBEAT_CHECK_INTERVAL", "30")),
-
-        # Logging
-        log_level=os.getenv("LOG_LEVEL", "INFO"),
-        log_file_path=os.getenv("LOG_FILE_PATH"),  # None if not set
-    )
-
-    return config
+    for env in _REQUIRED:
+        if not os.getenv(env):
+            raise ValueError(f"{env} is required in .env file")
+
+    kwargs = {}
+    for field, env, default, caster in _SPEC:
+        value = os.getenv(env, default)
+        kwargs[field] = None if value is None else caster(value)
+
+    return Config(**kwargs)
@@ -10,7 +10,8 @@ from __future__ import annotations
 
 import asyncio
 import time
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Mapping, Optional
 
 import discord
 
@@ -21,11 +22,19 @@ from src.utils.embeds import create_balance_update_embed
 from src.utils.logger import get_logger
 
 
+logger = get_logger()
+
 # Bot startup time (set when handler is initialized)
 _startup_time: float = time.time()
 
-# Cache for last balance data (used by /balance slash command)
-_last_balance_data: Optional[Dict[str, Any]] = None
+# Cache for last balance data (used by /balance slash command), stored as
+# (version, read-only view of the payload). The writer rebinds the whole
+# tuple, so readers can share the view without copying or locking.
+_latest_balance: Optional[tuple[int, Mapping[str, Any]]] = None
+_balance_version = 0
+
+# Fields a balance update should carry (a warning is logged if any are missing)
+_BALANCE_REQUIRED = frozenset({"balance", "equity", "total_pnl"})
 
 # Time threshold for ignoring old retained messages (5 minutes)
 _OLD_MESSAGE_THRESHOLD = 300  # seconds
@@ -46,14 +55,14 @@ def set_startup_time(timestamp: float) -> None:
     """
     global _startup_time
     _startup_time = timestamp
-    logger = get_logger()
     logger.info(f"Balance handler startup time set to {timestamp}")
 
 
-def handle_balance_update(payload: Dict[str, Any], bot: PolySpikeBot) -> None:
+def handle_balance_update(payload: dict[str, Any], bot: PolySpikeBot) -> None:
     """Handle balance update event with old message filtering.
 
-    Creates async task to send Discord notification when balance updates.
+    Schedules a Discord notification when balance updates; bursts of updates
+    are coalesced into one notification showing the latest balance.
     Filters out old retained messages that were published before bot startup.
     Caches balance data for /balance slash command.
 
@@ -70,8 +79,6 @@ def handle_balance_update(payload: Dict[str, Any], bot: PolySpikeBot) -> None:
             - update_reason (str): Update reason
         bot: Discord bot client instance.
     """
-    logger = get_logger()
-
     # Check if message is old retained message
     msg_timestamp = payload.get("timestamp", 0)
     if msg_timestamp < _startup_time - _OLD_MESSAGE_THRESHOLD:
@@ -83,19 +90,91 @@ def handle_balance_update(payload: Dict[str, Any], bot: PolySpikeBot) -> None:
 
     logger.info("Received balance update event")
 
-    # Cache balance data for /balance command
-    global _last_balance_data
-    _last_balance_data = payload.copy()
+    # Cache balance data for /balance command. The MQTT client decodes a
+    # fresh dict per message and nothing mutates it, so wrap it without copying.
+    global _latest_balance, _balance_version
+    _balance_version += 1
+    _latest_balance = (_balance_version, MappingProxyType(payload))
     logger.debug("Cached balance data for /balance command")
 
-    # Schedule async task on bot's event loop and keep reference
-    task = asyncio.create_task(_send_balance_update_notification(payload, bot))
-    _active_tasks.add(task)
-    task.add_done_callback(lambda t: _active_tasks.discard(t))
+    # Queue notification; bursts within the coalescing window send only the latest
+    _coalescer.submit(payload, bot)
+
+
+class _BalanceCoalescer:
+    """Collapses bursts of balance updates into a single Discord notification.
+
+    Balance is stateful, so only the latest payload matters: updates arriving
+    within the window overwrite each other and one notification is sent when
+    the window closes.
+    """
+
+    def __init__(self, window: float):
+        """Initialize the coalescer.
+
+        Args:
+            window: Seconds to wait after the first update of a burst before
+                sending the notification.
+        """
+        self.window = window
+        self.pending_payload: Optional[dict[str, Any]] = None
+        self._pending_bot: Optional[PolySpikeBot] = None
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._timer_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def submit(self, payload: dict[str, Any], bot: PolySpikeBot) -> None:
+        """Record the latest payload and arm the flush timer if needed.
+
+        Args:
+            payload: MQTT message payload containing balance data.
+            bot: Discord bot client instance.
+        """
+        self.pending_payload = payload
+        self._pending_bot = bot
+
+        loop = asyncio.get_running_loop()
+        if self._timer is None or self._timer_loop is not loop:
+            self._timer = loop.call_later(self.window, self._flush)
+            self._timer_loop = loop
+
+    def _flush(self) -> None:
+        """Send a notification for the latest pending payload."""
+        payload, bot = self.pending_payload, self._pending_bot
+        self.pending_payload = None
+        self._pending_bot = None
+        self._timer = None
+
+        if payload is None:
+            return
+
+        # Keep a reference so the task is not garbage-collected mid-send
+        task = asyncio.create_task(_send_balance_update_notification(payload, bot))
+        _active_tasks.add(task)
+        task.add_done_callback(_active_tasks.discard)
+
+    def flush(self) -> None:
+        """Send the pending update now instead of waiting for the window."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self.pending_payload is not None:
+            self._flush()
+
+    def cancel(self) -> None:
+        """Drop any pending update without sending it."""
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = None
+        self.pending_payload = None
+        self._pending_bot = None
+
+
+# Balance updates within 1s of each other produce one notification
+_coalescer = _BalanceCoalescer(window=1.0)
 
 
 async def _send_balance_update_notification(
-    payload: Dict[str, Any], bot: PolySpikeBot
+    payload: dict[str, Any], bot: PolySpikeBot
 ) -> None:
     """Send balance update notification to Discord channel.
 
@@ -103,18 +182,17 @@ async def _send_balance_update_notification(
         payload: MQTT message payload containing balance data.
         bot: PolySpikeBot instance with safe_send_to_channel method.
     """
-    logger = get_logger()
-
     try:
-        # Validate important fields (warn if missing, but still send notification)
-        important_fields = ["balance", "equity", "total_pnl"]
-        missing_fields = [f for f in important_fields if f not in payload]
+        # Validate important fields (warn if missing, but still send
+        # notification). Skipped under `python -O`.
+        if __debug__:
+            missing_fields = _BALANCE_REQUIRED - payload.keys()
 
-        if missing_fields:
-            logger.warning(
-                f"Balance update payload missing fields: {missing_fields}. "
-                f"Notification will use default values."
-            )
+            if missing_fields:
+                logger.warning(
+                    f"Balance update payload missing fields: {sorted(missing_fields)}. "
+                    f"Notification will use default values."
+                )
 
         # Create embed (embed builder handles missing fields gracefully)
         embed = create_balance_update_embed(payload)
@@ -134,16 +212,29 @@ async def _send_balance_update_notification(
         )
 
 
-def get_last_balance_data() -> Optional[Dict[str, Any]]:
+def get_last_balance_data() -> Optional[Mapping[str, Any]]:
     """Get the last cached balance data.
 
     Used by /balance slash command to display current balance without
     waiting for next MQTT update.
 
     Returns:
-        Copy of last balance data dict, or None if no balance update received yet.
+        Read-only view of the last balance data, or None if no balance
+        update received yet.
     """
-    return _last_balance_data.copy() if _last_balance_data else None
+    latest = _latest_balance
+    return latest[1] if latest and latest[1] else None
+
+
+def get_balance_version() -> int:
+    """Get the version of the cached balance data.
+
+    Returns:
+        Number of balance updates cached so far; changes whenever
+        get_last_balance_data() would return a new snapshot.
+    """
+    latest = _latest_balance
+    return latest[0] if latest else 0
 
 
 def clear_balance_cache() -> None:
@@ -151,9 +242,8 @@ def clear_balance_cache() -> None:
 
     Useful for testing or manual cache reset.
     """
-    global _last_balance_data
-    _last_balance_data = None
-    logger = get_logger()
+    global _latest_balance
+    _latest_balance = None
     logger.info("Cleared balance cache")
 
 
@@ -166,20 +256,29 @@ def get_startup_time() -> float:
     return _startup_time
 
 
-async def cancel_active_tasks() -> None:
-    """Cancel all active background tasks and wait for them to complete.
+async def cancel_active_tasks(timeout: float = 5.0) -> None:
+    """Finish pending balance notifications and stop the background tasks.
+
+    An update still waiting in the coalescing window is sent right away
+    rather than dropped. Running sends get up to ``timeout`` seconds to
+    finish; any still running after that are cancelled. Should be called
+    during bot shutdown, after MQTT is disconnected and before the
+    notification batcher is closed.
 
-    Should be called during bot shutdown to ensure clean shutdown.
+    Args:
+        timeout: Seconds to wait for running sends before cancelling them.
     """
-    logger = get_logger()
-    if _active_tasks:
-        logger.info(f"Cancelling {_active_tasks.__len__()} active balance notification tasks")
-        for task in list(_active_tasks):
-            if not task.done():
-                task.cancel()
-        
-        # Wait for all tasks to be cancelled
-        if _active_tasks:
-            await asyncio.wait(_active_tasks, timeout=5.0)
-        _active_tasks.clear()
-        logger.info("All active balance notification tasks cancelled")
+    _coalescer.flush()
+
+    pending = [task for task in _active_tasks if not task.done()]
+    if not pending:
+        return
+
+    logger.info(f"Waiting for {len(pending)} active balance notification tasks")
+    _, still_running = await asyncio.wait(pending, timeout=timeout)
+    if still_running:
+        logger.warning(f"Cancelling {len(still_running)} balance notification tasks still running")
+        for task in still_running:
+            task.cancel()
+        await asyncio.wait(still_running)
+    _active_tasks.clear()
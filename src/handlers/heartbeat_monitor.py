@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import asyncio
 import time
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 import discord
 
@@ -19,6 +19,9 @@ from src.utils.embeds import create_heartbeat_alert_embed
 from src.utils.logger import get_logger
 
 
+logger = get_logger()
+
+
 class HeartbeatMonitor:
     """Monitor trading bot heartbeat and send alerts on timeout.
 
@@ -37,18 +40,27 @@ class HeartbeatMonitor:
         """
         self.bot: PolySpikeBot = bot
         self.timeout_seconds = timeout_seconds
-        self.logger = get_logger()
+        self.logger = logger
 
         self._last_heartbeat_time: Optional[float] = None
         self._alert_sent = False
-        self._monitoring_task: Optional[asyncio.Task] = None
-        self._stopping = False
 
-    def update(self, payload: Dict[str, Any]) -> None:
+        # Last heartbeat and its timeout deadline on the monotonic clock, so
+        # status queries never read the wall clock
+        self._last_heartbeat_monotonic: Optional[float] = None
+        self._deadline: Optional[float] = None
+
+        # Timeout timer, re-armed on every heartbeat while monitoring
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._timeout_handle: Optional[asyncio.TimerHandle] = None
+        self._alert_task: Optional[asyncio.Task] = None
+
+    def update(self, payload: dict[str, Any]) -> None:
         """Update heartbeat timestamp.
 
         Called when heartbeat message is received from MQTT.
-        Clears alert flag so new alert can be sent if timeout happens again.
+        Clears alert flag so new alert can be sent if timeout happens again,
+        and pushes the timeout deadline back.
 
         Args:
             payload: MQTT heartbeat payload containing timestamp and bot status.
@@ -59,89 +71,91 @@ class HeartbeatMonitor:
                 - open_positions (int): Number of open positions
                 - total_trades (int): Total trades count
         """
-        timestamp = payload.get("timestamp", time.time())
+        now = time.time()
+        timestamp = payload.get("timestamp", now)
         self._last_heartbeat_time = timestamp
+        self._last_heartbeat_monotonic = time.monotonic() - (now - timestamp)
+        self._deadline = self._last_heartbeat_monotonic + self.timeout_seconds
 
         # Clear alert flag - bot is alive again
         if self._alert_sent:
             self.logger.info("Heartbeat received - trading bot is back online")
             self._alert_sent = False
 
+        if self._loop is not None:
+            self._arm_timeout()
+
         self.logger.debug(f"Heartbeat updated: {timestamp}")
 
     async def start_monitoring(self) -> None:
-        """Start the heartbeat monitoring loop.
+        """Start heartbeat monitoring.
 
-        Raises:
-            RuntimeError: If monitoring is already running.
+        Arms a timer that fires once the last heartbeat is older than the
+        timeout; each heartbeat re-arms it, so a healthy bot causes no
+        wakeups at all.
         """
-        if self._monitoring_task is not None:
+        if self._loop is not None:
             self.logger.warning("Heartbeat monitoring already running")
             return
 
         self.logger.info(
             f"Starting heartbeat monitoring (timeout: {self.timeout_seconds}s)"
         )
-        self._stopping = False
-        self._monitoring_task = asyncio.create_task(self._check_heartbeat_loop())
+        self._loop = asyncio.get_running_loop()
+
+        # No alert until the first heartbeat arrives (bot may not be started)
+        if self._deadline is not None:
+            self._arm_timeout()
 
     async def stop_monitoring(self) -> None:
-        """Stop the heartbeat monitoring loop gracefully."""
+        """Stop heartbeat monitoring gracefully."""
         self.logger.info("Stopping heartbeat monitoring")
-        self._stopping = True
+        self._loop = None
 
-        if self._monitoring_task and not self._monitoring_task.done():
-            self._monitoring_task.cancel()
+        if self._timeout_handle is not None:
+            self._timeout_handle.cancel()
+            self._timeout_handle = None
+
+        if self._alert_task and not self._alert_task.done():
+            self._alert_task.cancel()
             try:
-                await self._monitoring_task
+                await self._alert_task
             except asyncio.CancelledError:
                 pass
 
-        self._monitoring_task = None
+        self._alert_task = None
 
-    async def _check_heartbeat_loop(self) -> None:
-        """Background loop that checks heartbeat every 30 seconds.
+    def _arm_timeout(self) -> None:
+        """(Re)schedule the timeout callback for the current heartbeat.
 
-        Runs continuously until stopped. Checks if heartbeat is missing
-        and sends Discord alert if timeout threshold is exceeded.
+        A pending timer therefore always means the deadline is still ahead.
         """
-        check_interval = 30  # seconds
+        if self._timeout_handle is not None:
+            self._timeout_handle.cancel()
+            self._timeout_handle = None
 
-        while not self._stopping:
-            try:
-                await asyncio.sleep(check_interval)
-
-                if self._stopping:
-                    break
-
-                # Check if heartbeat is missing
-                if self._last_heartbeat_time is None:
-                    self.logger.debug("No heartbeat received yet - bot may not be started")
-                    continue
-
-                current_time = time.time()
-                time_since_heartbeat = current_time - self._last_heartbeat_time
-
-                if time_since_heartbeat > self.timeout_seconds:
-                    # Heartbeat timeout - send alert (but only once)
-                    if not self._alert_sent:
-                        self.logger.warning(
-                            f"Heartbeat timeout! Last heartbeat: {time_since_heartbeat:.0f}s ago "
-                            f"(threshold: {self.timeout_seconds}s)"
-                        )
-                        await self._send_heartbeat_alert(time_since_heartbeat)
-                        self._alert_sent = True
-                else:
-                    self.logger.debug(
-                        f"Heartbeat OK (last: {time_since_heartbeat:.0f}s ago)"
-                    )
+        delay = self._deadline - time.monotonic()
+        if delay > 0:
+            self._timeout_handle = self._loop.call_later(delay, self._on_timeout)
+        else:
+            self._on_timeout()
 
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                self.logger.error(
-                    f"Error in heartbeat monitoring loop: {e}", exc_info=True
-                )
+    def _on_timeout(self) -> None:
+        """Timer callback: no heartbeat within the timeout, send one alert."""
+        self._timeout_handle = None
+
+        if self._alert_sent or self._last_heartbeat_monotonic is None:
+            return
+
+        time_since_heartbeat = time.monotonic() - self._last_heartbeat_monotonic
+        self.logger.warning(
+            f"Heartbeat timeout! Last heartbeat: {time_since_heartbeat:.0f}s ago "
+            f"(threshold: {self.timeout_seconds}s)"
+        )
+        self._alert_sent = True
+        self._alert_task = asyncio.create_task(
+            self._send_heartbeat_alert(time_since_heartbeat)
+        )
 
     async def _send_heartbeat_alert(self, missing_seconds: float) -> None:
         """Send heartbeat timeout alert to Discord.
@@ -158,7 +172,7 @@ class HeartbeatMonitor:
             embed = create_heartbeat_alert_embed(alert_data)
 
             # Send using safe send method (handles all error cases)
-            success = await self.bot.safe_send_to_channel(embed)
+            success = await self.bot.safe_send_to_channel(embed, urgent=True)
 
             if success:
                 self.logger.info("Heartbeat timeout alert sent to Discord")
@@ -181,16 +195,18 @@ class HeartbeatMonitor:
     def is_bot_online(self) -> bool:
         """Check if trading bot is online based on heartbeat.
 
+        While monitoring, this is answered from the timer state without
+        reading the clock.
+
         Returns:
             True if heartbeat is recent (within timeout), False otherwise.
         """
-        if self._last_heartbeat_time is None:
+        if self._timeout_handle is not None:
+            return True
+        if self._deadline is None or self._alert_sent:
             return False
 
-        current_time = time.time()
-        time_since_heartbeat = current_time - self._last_heartbeat_time
-
-        return time_since_heartbeat <= self.timeout_seconds
+        return time.monotonic() <= self._deadline
 
     def get_time_since_last_heartbeat(self) -> Optional[float]:
         """Get time elapsed since last heartbeat.
@@ -198,7 +214,25 @@ class HeartbeatMonitor:
         Returns:
             Seconds since last heartbeat, or None if no heartbeat received.
         """
-        if self._last_heartbeat_time is None:
+        if self._last_heartbeat_monotonic is None:
             return None
 
-        return time.time() - self._last_heartbeat_time
+        return time.monotonic() - self._last_heartbeat_monotonic
+
+    def snapshot(self) -> tuple[Optional[float], bool, Optional[float]]:
+        """Get last heartbeat time, online state and elapsed time together.
+
+        All three values are derived from a single clock read, so they
+        always agree with each other.
+
+        Returns:
+            Tuple of (last_heartbeat_time, is_online, time_since_heartbeat).
+            last_heartbeat_time and time_since_heartbeat are None if no
+            heartbeat has been received.
+        """
+        last = self._last_heartbeat_time
+        if last is None:
+            return None, False, None
+
+        elapsed = time.monotonic() - self._last_heartbeat_monotonic
+        return last, elapsed <= self.timeout_seconds, elapsed
@@ -9,7 +9,9 @@ This module handles bot status events from MQTT:
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING, Any, Dict
+import logging
+from collections import deque
+from typing import TYPE_CHECKING, Any, Hashable, Optional
 
 import discord
 
@@ -24,10 +26,64 @@ from src.utils.embeds import (
 from src.utils.logger import get_logger
 
 
-def handle_bot_started(payload: Dict[str, Any], bot: PolySpikeBot) -> None:
+logger = get_logger()
+
+# Fields each event should carry (a warning is logged if any are missing)
+_STARTED_REQUIRED = frozenset({"session_id", "config"})
+_STARTED_CONFIG = frozenset({"initial_balance", "spike_threshold", "position_size"})
+_STOPPED_REQUIRED = frozenset({"session_id", "final_stats"})
+_STOPPED_STATS = frozenset({"total_pnl", "total_trades", "win_rate"})
+_ERROR_REQUIRED = frozenset({"error_type", "error_message"})
+
+# Seen status events (prevents duplicate notifications from QoS 1
+# redelivery), with the same set plus FIFO deque layout as trade IDs
+_seen_events: set[Hashable] = set()
+_seen_order: deque[Hashable] = deque()
+_MAX_SEEN_STATUS = 64
+
+
+def _is_duplicate(key: Optional[Hashable]) -> bool:
+    """Check whether a status event was already handled, recording it if not.
+
+    Args:
+        key: Identity of the event, or None if the payload carries nothing
+            to identify it by (never treated as a duplicate).
+
+    Returns:
+        True if the event was seen before and should be ignored.
+    """
+    if key is None:
+        return False
+
+    if key in _seen_events:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Ignoring duplicate status event: {key}")
+        return True
+
+    # Keep only the last N events (FIFO)
+    if len(_seen_order) >= _MAX_SEEN_STATUS:
+        _seen_events.discard(_seen_order.popleft())
+
+    _seen_order.append(key)
+    _seen_events.add(key)
+    return False
+
+
+def clear_seen_status_events() -> None:
+    """Clear the seen status events set.
+
+    Useful for testing or manual cache clearing.
+    """
+    _seen_events.clear()
+    _seen_order.clear()
+
+
+def handle_bot_started(payload: dict[str, Any], bot: PolySpikeBot) -> None:
     """Handle bot started event.
 
-    Creates async task to send Discord notification when trading bot starts.
+    Builds the notification embed right away and creates an async task
+    that only sends it to Discord. Redeliveries for the same session are
+    ignored.
 
     Args:
         payload: MQTT message payload containing startup data.
@@ -40,17 +96,50 @@ def handle_bot_started(payload: Dict[str, Any], bot: PolySpikeBot) -> None:
             - config.monitored_markets (int): Number of markets
         bot: Discord bot client instance.
     """
-    logger = get_logger()
+    session_id = payload.get("session_id")
+    if _is_duplicate(("started", session_id) if session_id else None):
+        return
+
     logger.info("Received bot started event")
 
-    # Schedule async task on bot's event loop
-    asyncio.create_task(_send_bot_started_notification(payload, bot))
+    try:
+        # Validate important fields (warn if missing, but still send
+        # notification). Skipped under `python -O`.
+        if __debug__:
+            missing_fields = _STARTED_REQUIRED - payload.keys()
+
+            if missing_fields:
+                logger.warning(
+                    f"Bot started payload missing fields: {sorted(missing_fields)}. "
+                    f"Notification will use default values."
+                )
+
+            # Check nested config fields
+            if "config" in payload:
+                missing_config = _STARTED_CONFIG - payload.get("config", {}).keys()
+                if missing_config:
+                    logger.warning(
+                        f"Bot started config missing fields: {sorted(missing_config)}. "
+                        f"Notification will use default values."
+                    )
+
+        # Create embed (embed builder handles missing fields gracefully)
+        embed = create_bot_started_embed(payload)
+
+    except Exception as e:
+        logger.error(f"Unexpected error in handle_bot_started: {e}", exc_info=True)
+        return
+
+    # Schedule the send on bot's event loop
+    asyncio.create_task(_send_notification(bot, embed, "bot started"))
 
 
-def handle_bot_stopped(payload: Dict[str, Any], bot: PolySpikeBot) -> None:
+def handle_bot_stopped(payload: dict[str, Any], bot: PolySpikeBot) -> None:
     """Handle bot stopped event.
 
-    Creates async task to send Discord notification when trading bot stops.
+    Builds the notification embed right away and creates an async task
+    that only sends it to Discord. Redeliveries for the same session are
+    ignored.
 
     Args:
         payload: MQTT message payload containing shutdown data.
@@ -62,17 +151,50 @@ def handle_bot_stopped(payload: Dict[str, Any], bot: PolySpikeBot) -> None:
             - final_stats.win_rate (float): Win rate
         bot: Discord bot client instance.
     """
-    logger = get_logger()
+    session_id = payload.get("session_id")
+    if _is_duplicate(("stopped", session_id) if session_id else None):
+        return
+
     logger.info("Received bot stopped event")
 
-    # Schedule async task on bot's event loop
-    asyncio.create_task(_send_bot_stopped_notification(payload, bot))
+    try:
+        # Validate important fields (warn if missing, but still send
+        # notification). Skipped under `python -O`.
+        if __debug__:
+            missing_fields = _STOPPED_REQUIRED - payload.keys()
 
+            if missing_fields:
+                logger.warning(
+                    f"Bot stopped payload missing fields: {sorted(missing_fields)}. "
+                    f"Notification will use default values."
+                )
 
-def handle_bot_error(payload: Dict[str, Any], bot: PolySpikeBot) -> None:
+            # Check nested final_stats fields
+            if "final_stats" in payload:
+                missing_stats = _STOPPED_STATS - payload.get("final_stats", {}).keys()
+                if missing_stats:
+                    logger.warning(
+                        f"Bot stopped final_stats missing fields: {sorted(missing_stats)}. "
+                        f"Notification will use default values."
+                    )
+
+        # Create embed (embed builder handles missing fields gracefully)
+        embed = create_bot_stopped_embed(payload)
+
+    except Exception as e:
+        logger.error(f"Unexpected error in handle_bot_stopped: {e}", exc_info=True)
+        return
+
+    # Schedule the send on bot's event loop
+    asyncio.create_task(_send_notification(bot, embed, "bot stopped"))
+
+
+def handle_bot_error(payload: dict[str, Any], bot: PolySpikeBot) -> None:
     """Handle bot error event.
 
-    Creates async task to send Discord notification when trading bot encounters an error.
+    Builds the notification embed right away and creates an async task
+    that only sends it to Discord. Critical errors skip the batching delay;
+    redeliveries (same timestamp and error type) are ignored.
 
     Args:
         payload: MQTT message payload containing error data.
@@ -83,154 +205,65 @@ def handle_bot_error(payload: Dict[str, Any], bot: PolySpikeBot) -> None:
             - severity (str): Error severity (critical/error/warning)
         bot: Discord bot client instance.
     """
-    logger = get_logger()
-    severity = payload.get("severity", "error")
+    timestamp = payload.get("timestamp")
+    if _is_duplicate(
+        ("error", timestamp, payload.get("error_type")) if timestamp else None
+    ):
+        return
+
+    # Normalized once here; the embed builder applies the same lowercasing
+    severity = str(payload.get("severity", "error")).lower()
     logger.info(f"Received bot error event (severity: {severity})")
 
-    # Schedule async task on bot's event loop
-    asyncio.create_task(_send_bot_error_notification(payload, bot))
-
-
-async def _send_bot_started_notification(
-    payload: Dict[str, Any], bot: PolySpikeBot
-) -> None:
-    """Send bot started notification to Discord channel.
-
-    Args:
-        payload: MQTT message payload containing startup configuration.
-        bot: PolySpikeBot instance with safe_send_to_channel method.
-    """
-    logger = get_logger()
-
     try:
-        # Validate important fields (warn if missing, but still send notification)
-        important_fields = ["session_id", "config"]
-        missing_fields = [f for f in important_fields if f not in payload]
-
-        if missing_fields:
-            logger.warning(
-                f"Bot started payload missing fields: {missing_fields}. "
-                f"Notification will use default values."
-            )
-
-        # Check nested config fields
-        if "config" in payload:
-            config_fields = ["initial_balance", "spike_threshold", "position_size"]
-            missing_config = [
-                f for f in config_fields if f not in payload.get("config", {})
-            ]
-            if missing_config:
-                logger.warning(
-                    f"Bot started config missing fields: {missing_config}. "
-                    f"Notification will use default values."
-                )
-
-        # Create embed (embed builder handles missing fields gracefully)
-        embed = create_bot_started_embed(payload)
-
-        # Send using safe send method (handles all error cases)
-        success = await bot.safe_send_to_channel(embed)
-
-        if success:
-            logger.info("Bot started notification sent successfully")
-        else:
-            logger.error("Failed to send bot started notification (see errors above)")
-
-    except Exception as e:
-        logger.error(
-            f"Unexpected error in _send_bot_started_notification: {e}",
-            exc_info=True,
-        )
-
-
-async def _send_bot_stopped_notification(
-    payload: Dict[str, Any], bot: PolySpikeBot
-) -> None:
-    """Send bot stopped notification to Discord channel.
-
-    Args:
-        payload: MQTT message payload.
-        bot: Discord bot client instance.
-    """
-    logger = get_logger()
+        # Validate important fields (warn if missing, but still send
+        # notification). Skipped under `python -O`.
+        if __debug__:
+            missing_fields = _ERROR_REQUIRED - payload.keys()
 
-    try:
-        # Validate important fields (warn if missing, but still send notification)
-        important_fields = ["session_id", "final_stats"]
-        missing_fields = [f for f in important_fields if f not in payload]
-
-        if missing_fields:
-            logger.warning(
-                f"Bot stopped payload missing fields: {missing_fields}. "
-                f"Notification will use default values."
-            )
-
-        # Check nested final_stats fields
-        if "final_stats" in payload:
-            stats_fields = ["total_pnl", "total_trades", "win_rate"]
-            missing_stats = [
-                f for f in stats_fields if f not in payload.get("final_stats", {})
-            ]
-            if missing_stats:
+            if missing_fields:
                 logger.warning(
-                    f"Bot stopped final_stats missing fields: {missing_stats}. "
+                    f"Bot error payload missing fields: {sorted(missing_fields)}. "
                     f"Notification will use default values."
                 )
 
         # Create embed (embed builder handles missing fields gracefully)
-        embed = create_bot_stopped_embed(payload)
-
-        # Send using safe send method (handles all error cases)
-        success = await bot.safe_send_to_channel(embed)
-
-        if success:
-            logger.info("Bot stopped notification sent successfully")
-        else:
-            logger.error("Failed to send bot stopped notification (see errors above)")
+        embed = create_bot_error_embed(payload)
 
     except Exception as e:
-        logger.error(
-            f"Unexpected error in _send_bot_stopped_notification: {e}",
-            exc_info=True,
-        )
+        logger.error(f"Unexpected error in handle_bot_error: {e}", exc_info=True)
+        return
+
+    # Schedule the send on bot's event loop; critical errors flush the
+    # pending batch instead of waiting
+    send_kwargs = {"urgent": True} if severity == "critical" else {}
+    asyncio.create_task(
+        _send_notification(bot, embed, f"bot error ({severity})", **send_kwargs)
+    )
 
 
-async def _send_bot_error_notification(
-    payload: Dict[str, Any], bot: PolySpikeBot
+async def _send_notification(
+    bot: PolySpikeBot, embed: discord.Embed, event: str, **send_kwargs: Any
 ) -> None:
-    """Send bot error notification to Discord channel.
+    """Send a prebuilt status notification to Discord channel.
 
     Args:
-        payload: MQTT message payload containing error details.
         bot: PolySpikeBot instance with safe_send_to_channel method.
+        embed: Notification embed.
+        event: Lowercase event description used in log messages.
+        **send_kwargs: Extra keyword arguments for safe_send_to_channel.
     """
-    logger = get_logger()
-    severity = payload.get("severity", "error")
-
     try:
-        # Validate important fields (warn if missing, but still send notification)
-        important_fields = ["error_type", "error_message"]
-        missing_fields = [f for f in important_fields if f not in payload]
-
-        if missing_fields:
-            logger.warning(
-                f"Bot error payload missing fields: {missing_fields}. "
-                f"Notification will use default values."
-            )
-
-        # Create embed (embed builder handles missing fields gracefully)
-        embed = create_bot_error_embed(payload)
-
         # Send using safe send method (handles all error cases)
-        success = await bot.safe_send_to_channel(embed)
+        success = await bot.safe_send_to_channel(embed, **send_kwargs)
 
         if success:
-            logger.info(f"Bot error notification ({severity}) sent successfully")
+            logger.info(f"{event.capitalize()} notification sent successfully")
         else:
-            logger.error("Failed to send bot error notification (see errors above)")
+            logger.error(f"Failed to send {event} notification (see errors above)")
 
     except Exception as e:
         logger.error(
-            f"Unexpected error in _send_bot_error_notification: {e}",
+            f"Unexpected error sending {event} notification: {e}",
             exc_info=True,
         )
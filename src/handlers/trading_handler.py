@@ -8,29 +8,75 @@ This module handles trading-related events from MQTT:
 from __future__ import annotations
 
 import asyncio
-from collections import OrderedDict
-from typing import TYPE_CHECKING, Any, Dict
+from collections import deque
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 import discord
 
 if TYPE_CHECKING:
     from src.bot import PolySpikeBot
 
+from src.utils.bloom import RotatingBloomFilter
 from src.utils.embeds import (
+    MAX_EMBED_FIELDS,
     create_position_opened_embed,
     create_trade_completed_embed,
+    create_trades_digest_embed,
 )
 from src.utils.logger import get_logger
 
 
-# Global ordered dict to track seen trade IDs (prevents duplicates from QoS 1)
-# Using OrderedDict for FIFO eviction when max size exceeded
-_seen_trade_ids: OrderedDict[str, None] = OrderedDict()
+logger = get_logger()
+
+# Seen trade IDs (prevents duplicates from QoS 1): a set for membership
+# checks plus a deque of the same IDs in arrival order for FIFO eviction
+_seen_trade_ids: set[str] = set()
+_seen_order: deque[str] = deque()
 # Limit size to prevent unbounded memory growth
 _MAX_SEEN_TRADES = 1000
 
+# Approximate dedup for high trade volumes (replaces the exact set when enabled)
+_seen_bloom: Optional[RotatingBloomFilter] = None
+
+# Set of active background tasks for trade notifications
+_active_tasks: set[asyncio.Task] = set()
+
+# Embed builder for each notification type
+_EMBED_FACTORIES: dict[str, Callable[[Any], discord.Embed]] = {
+    "position opened": create_position_opened_embed,
+    "trade completed": create_trade_completed_embed,
+    "trades digest": create_trades_digest_embed,
+}
+
+# Fields each event should carry (a warning is logged if any are missing)
+_REQUIRED_FIELDS = {
+    "position opened": frozenset({"market_name", "entry_price", "position_size"}),
+    "trade completed": frozenset({"market_name", "pnl", "pnl_pct"}),
+}
+
+
+def enable_bloom_dedup(capacity: int = 100_000, error_rate: float = 0.01) -> None:
+    """Switch trade deduplication to a rotating Bloom filter.
+
+    Remembers far more trade IDs in fixed memory than the exact set, at the
+    cost of occasionally dropping a new trade as a false-positive duplicate.
+    Should be called at startup, before MQTT messages arrive.
 
-def handle_position_opened(payload: Dict[str, Any], bot: PolySpikeBot) -> None:
+    Args:
+        capacity: Trade IDs per filter generation (at least this many of the
+            most recent IDs are remembered).
+        error_rate: Target rate of new trades dropped as false duplicates.
+    """
+    global _seen_bloom
+    _seen_bloom = RotatingBloomFilter(capacity, error_rate)
+    _seen_trade_ids.clear()
+    _seen_order.clear()
+    logger.info(
+        f"Trade dedup using Bloom filter (capacity: {capacity}, error rate: {error_rate})"
+    )
+
+
+def handle_position_opened(payload: dict[str, Any], bot: PolySpikeBot) -> None:
     """Handle position opened event from MQTT.
 
     Creates an async task to send a Discord notification when a trading
@@ -52,17 +98,20 @@ def handle_position_opened(payload: Dict[str, Any], bot: PolySpikeBot) -> None:
     Returns:
         None. The notification is sent asynchronously.
     """
-    logger = get_logger()
     logger.info("Received position opened event")
 
+    # Validate important fields (warn if missing, but still send notification)
+    _check_fields(payload, "position opened")
+
     # Schedule async task on bot's event loop
-    asyncio.create_task(_send_position_opened_notification(payload, bot))
+    _start_notification(bot, "position opened", payload)
 
 
-def handle_trade_completed(payload: Dict[str, Any], bot: PolySpikeBot) -> None:
+def handle_trade_completed(payload: dict[str, Any], bot: PolySpikeBot) -> None:
     """Handle trade completed event with duplicate detection.
 
-    Creates an async task to send a Discord notification when a trade is completed.
+    Queues a Discord notification when a trade is completed; trades arriving
+    within the digest window are sent together as one digest embed.
     Implements duplicate detection using trade_id to prevent notification spam
     from MQTT QoS 1 message redelivery.
 
@@ -85,107 +134,161 @@ def handle_trade_completed(payload: Dict[str, Any], bot: PolySpikeBot) -> None:
     Returns:
         None. The notification is sent asynchronously, or skipped if duplicate.
     """
-    logger = get_logger()
-
     # Check for duplicate trade_id (QoS 1 may deliver duplicates)
     trade_id = payload.get("trade_id")
-    if trade_id:
+    if trade_id and _seen_bloom is not None:
+        if trade_id in _seen_bloom:
+            logger.debug("Ignoring duplicate trade_id: %s", trade_id)
+            return
+        _seen_bloom.add(trade_id)
+    elif trade_id:
         if trade_id in _seen_trade_ids:
-            logger.debug(f"Ignoring duplicate trade_id: {trade_id}")
+            logger.debug("Ignoring duplicate trade_id: %s", trade_id)
             return
 
-        # Add to seen dict (move to end if already exists)
-        _seen_trade_ids[trade_id] = None
-
         # Prevent unbounded memory growth - keep only last N trades
-        if len(_seen_trade_ids) > _MAX_SEEN_TRADES:
+        if len(_seen_order) >= _MAX_SEEN_TRADES:
             # Remove oldest entry (FIFO)
-            _seen_trade_ids.popitem(last=False)
-            logger.debug(f"Pruned seen_trade_ids cache (size: {len(_seen_trade_ids)})")
+            _seen_trade_ids.discard(_seen_order.popleft())
+            logger.debug("Pruned seen_trade_ids cache (size: %d)", len(_seen_trade_ids))
+
+        _seen_order.append(trade_id)
+        _seen_trade_ids.add(trade_id)
 
     logger.info("Received trade completed event")
 
-    # Schedule async task on bot's event loop
-    asyncio.create_task(_send_trade_completed_notification(payload, bot))
+    # Validate important fields (warn if missing, but still send notification)
+    _check_fields(payload, "trade completed")
 
+    # Queue notification; bursts within the digest window share one embed
+    _trade_digest.submit(payload, bot)
 
-async def _send_position_opened_notification(
-    payload: Dict[str, Any], bot: PolySpikeBot
-) -> None:
-    """Send position opened notification to Discord channel.
 
-    Args:
-        payload: MQTT message payload.
-        bot: Discord bot client instance.
+class _TradeDigest:
+    """Collects bursts of completed trades into a single Discord notification.
+
+    Unlike balance updates every trade matters, so trades arriving within
+    the window are accumulated and sent together as one digest embed (a
+    lone trade still gets the full trade completed embed).
     """
-    logger = get_logger()
 
-    try:
-        # Validate important fields (warn if missing, but still send notification)
-        important_fields = ["market_name", "entry_price", "position_size"]
-        missing_fields = [f for f in important_fields if f not in payload]
+    def __init__(self, window: float):
+        """Initialize the digest.
+
+        Args:
+            window: Seconds to wait after the first trade of a burst before
+                sending the notification.
+        """
+        self.window = window
+        self.pending_payloads: list[dict[str, Any]] = []
+        self._pending_bot: Optional[PolySpikeBot] = None
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._timer_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def submit(self, payload: dict[str, Any], bot: PolySpikeBot) -> None:
+        """Add a trade to the pending digest and arm the flush timer if needed.
+
+        Args:
+            payload: MQTT message payload containing trade data.
+            bot: Discord bot client instance.
+        """
+        self.pending_payloads.append(payload)
+        self._pending_bot = bot
+
+        loop = asyncio.get_running_loop()
+        if self._timer is None or self._timer_loop is not loop:
+            self._timer = loop.call_later(self.window, self._flush)
+            self._timer_loop = loop
+
+    def _flush(self) -> None:
+        """Send the pending trades as one notification per embed's worth."""
+        payloads, bot = self.pending_payloads, self._pending_bot
+        self.pending_payloads = []
+        self._pending_bot = None
+        self._timer = None
+
+        if len(payloads) == 1:
+            _start_notification(bot, "trade completed", payloads[0])
+            return
+
+        for start in range(0, len(payloads), MAX_EMBED_FIELDS):
+            _start_notification(bot, "trades digest", payloads[start:start + MAX_EMBED_FIELDS])
+
+    def flush(self) -> None:
+        """Send the pending trades now instead of waiting for the window."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self.pending_payloads:
+            self._flush()
+
+    def cancel(self) -> None:
+        """Drop any pending trades without sending them."""
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = None
+        self.pending_payloads = []
+        self._pending_bot = None
+
 
-        if missing_fields:
-            logger.warning(
-                f"Position opened payload missing fields: {missing_fields}. "
-                f"Notification will use default values."
-            )
+# Trades completed within 0.5s of each other are sent as one digest
+_trade_digest = _TradeDigest(window=0.5)
 
-        # Create embed (embed builder handles missing fields gracefully)
-        embed = create_position_opened_embed(payload)
+
+async def _send_notification(bot: PolySpikeBot, event: str, data: Any) -> None:
+    """Build a trading notification embed and send it to Discord channel.
+
+    Args:
+        bot: PolySpikeBot instance with safe_send_to_channel method.
+        event: Notification type (key of _EMBED_FACTORIES), also used in
+            log messages.
+        data: Payload (or list of payloads) passed to the embed factory.
+    """
+    try:
+        # Create embed (embed builders handle missing fields gracefully)
+        embed = _EMBED_FACTORIES[event](data)
 
         # Send using safe send method (handles all error cases)
         success = await bot.safe_send_to_channel(embed)
 
         if success:
-            logger.info("Position opened notification sent successfully")
+            logger.info(f"{event.capitalize()} notification sent successfully")
         else:
-            logger.error("Failed to send position opened notification (see errors above)")
+            logger.error(f"Failed to send {event} notification (see errors above)")
 
     except Exception as e:
         logger.error(
-            f"Unexpected error in _send_position_opened_notification: {e}",
+            f"Unexpected error sending {event} notification: {e}",
             exc_info=True,
         )
 
 
-async def _send_trade_completed_notification(
-    payload: Dict[str, Any], bot: PolySpikeBot
-) -> None:
-    """Send trade completed notification to Discord channel.
+def _start_notification(bot: PolySpikeBot, event: str, data: Any) -> None:
+    """Schedule a notification send and track its task until it finishes.
 
     Args:
-        payload: MQTT message payload containing trade data.
         bot: PolySpikeBot instance with safe_send_to_channel method.
+        event: Notification type (key of _EMBED_FACTORIES).
+        data: Payload (or list of payloads) passed to the embed factory.
     """
-    logger = get_logger()
+    task = asyncio.create_task(_send_notification(bot, event, data))
+    _active_tasks.add(task)
+    task.add_done_callback(_active_tasks.discard)
 
-    try:
-        # Validate important fields (warn if missing, but still send notification)
-        important_fields = ["market_name", "pnl", "pnl_pct"]
-        missing_fields = [f for f in important_fields if f not in payload]
-
-        if missing_fields:
-            logger.warning(
-                f"Trade completed payload missing fields: {missing_fields}. "
-                f"Notification will use default values."
-            )
-
-        # Create embed (embed builder handles missing fields gracefully)
-        embed = create_trade_completed_embed(payload)
 
-        # Send using safe send method (handles all error cases)
-        success = await bot.safe_send_to_channel(embed)
+def _check_fields(payload: dict[str, Any], event: str) -> None:
+    """Log a warning if a payload lacks fields important for its embed.
 
-        if success:
-            logger.info("Trade completed notification sent successfully")
-        else:
-            logger.error("Failed to send trade completed notification (see errors above)")
+    Args:
+        payload: MQTT message payload.
+        event: Notification type (key of _REQUIRED_FIELDS).
+    """
+    missing_fields = _REQUIRED_FIELDS[event] - payload.keys()
 
-    except Exception as e:
-        logger.error(
-            f"Unexpected error in _send_trade_completed_notification: {e}",
-            exc_info=True,
+    if missing_fields:
+        logger.warning(
+            f"{event.capitalize()} payload missing fields: {sorted(missing_fields)}. "
+            f"Notification will use default values."
         )
 
 
@@ -194,9 +297,10 @@ def clear_seen_trades() -> None:
 
     Useful for testing or manual cache clearing.
     """
-    global _seen_trade_ids
     _seen_trade_ids.clear()
-    logger = get_logger()
+    _seen_order.clear()
+    if _seen_bloom is not None:
+        _seen_bloom.clear()
     logger.info("Cleared seen trade IDs cache")
 
 
@@ -204,6 +308,36 @@ def get_seen_trades_count() -> int:
     """Get the number of tracked trade IDs.
 
     Returns:
-        Number of trade IDs currently in the seen set.
+        Number of trade IDs currently in the seen set (or Bloom filter).
     """
+    if _seen_bloom is not None:
+        return len(_seen_bloom)
     return len(_seen_trade_ids)
+
+
+async def cancel_active_tasks(timeout: float = 5.0) -> None:
+    """Finish pending trade notifications and stop the background tasks.
+
+    Trades still waiting in the digest window are sent right away
+    rather than dropped. Running sends get up to ``timeout`` seconds to
+    finish; any still running after that are cancelled. Should be called
+    during bot shutdown, after MQTT is disconnected and before the
+    notification batcher is closed.
+
+    Args:
+        timeout: Seconds to wait for running sends before cancelling them.
+    """
+    _trade_digest.flush()
+
+    pending = [task for task in _active_tasks if not task.done()]
+    if not pending:
+        return
+
+    logger.info(f"Waiting for {len(pending)} active trade notification tasks")
+    _, still_running = await asyncio.wait(pending, timeout=timeout)
+    if still_running:
+        logger.warning(f"Cancelling {len(still_running)} trade notification tasks still running")
+        for task in still_running:
+            task.cancel()
+        await asyncio.wait(still_running)
+    _active_tasks.clear()
@@ -9,76 +9,78 @@ This module orchestrates the startup and shutdown of all bot components:
 - Signal handling for graceful shutdown
 """
 
+from __future__ import annotations
+
 import asyncio
 import sys
 import time
-from typing import Any, Dict
+from functools import partial
+from typing import TYPE_CHECKING, Any
 
-from src.bot import create_discord_bot, setup_signal_handlers
-from src.commands import stats
+# Modules importing discord.py or paho-mqtt are imported inside the functions
+# that need them, so a configuration error exits before paying for them
 from src.config import Config, load_config
-from src.handlers import balance_handler, status_handler, trading_handler
-from src.mqtt_client import MQTTClient
-from src.utils.embeds import create_mqtt_connection_alert_embed
 from src.utils.logger import get_logger, setup_logger
 
+if TYPE_CHECKING:
+    from src.mqtt_client import MQTTClient
+
+
+logger = get_logger()
+
+# Strong references to in-flight alert sends (the loop only keeps weak ones)
+_alert_tasks: set[asyncio.Task] = set()
+
+
+def _update_heartbeat(payload: dict[str, Any], bot) -> None:
+    """Forward a heartbeat payload to the bot's heartbeat monitor.
+
+    The monitor is created in on_ready, so it is looked up per message.
+
+    Args:
+        payload: MQTT heartbeat payload.
+        bot: Discord bot instance owning the heartbeat monitor.
+    """
+    if bot.heartbeat_monitor:
+        bot.heartbeat_monitor.update(payload)
+
 
 def register_mqtt_handlers(mqtt_client: MQTTClient, bot) -> None:
     """Register all MQTT event handlers.
 
-    Maps MQTT topic patterns to handler functions.
+    Maps MQTT topics to handler functions.
     Handlers are called when matching messages arrive from trading bot.
 
     Args:
         mqtt_client: MQTT client instance to register handlers with.
         bot: Discord bot instance to pass to handlers.
     """
-    logger = get_logger()
+    from src.commands import stats
+    from src.handlers import balance_handler, status_handler, trading_handler
+
     logger.info("Registering MQTT event handlers")
 
-    # Status event handlers
-    mqtt_client.register_handler(
-        "polyspike/status/bot/started",
-        lambda payload: status_handler.handle_bot_started(payload, bot),
-    )
-    mqtt_client.register_handler(
-        "polyspike/status/bot/stopped",
-        lambda payload: status_handler.handle_bot_stopped(payload, bot),
-    )
-    mqtt_client.register_handler(
-        "polyspike/status/bot/error",
-        lambda payload: status_handler.handle_bot_error(payload, bot),
-    )
-
-    # Heartbeat handler (updates heartbeat monitor)
-    mqtt_client.register_handler(
-        "polyspike/status/bot/heartbeat",
-        lambda payload: bot.heartbeat_monitor.update(payload)
-        if bot.heartbeat_monitor
-        else None,
-    )
-
-    # Trading event handlers
-    mqtt_client.register_handler(
-        "polyspike/trading/position/opened",
-        lambda payload: trading_handler.handle_position_opened(payload, bot),
-    )
-    mqtt_client.register_handler(
-        "polyspike/trading/trade/completed",
-        lambda payload: trading_handler.handle_trade_completed(payload, bot),
-    )
-
-    # Balance event handler
-    mqtt_client.register_handler(
-        "polyspike/balance/update",
-        lambda payload: balance_handler.handle_balance_update(payload, bot),
-    )
-
-    # Session stats handler (for /stats command cache)
-    mqtt_client.register_handler(
-        "polyspike/stats/session",
-        lambda payload: stats.cache_session_stats(payload),
-    )
+    # All topics are literal, so the client routes them with a dict lookup
+    handlers = {
+        # Status event handlers
+        "polyspike/status/bot/started": partial(status_handler.handle_bot_started, bot=bot),
+        "polyspike/status/bot/stopped": partial(status_handler.handle_bot_stopped, bot=bot),
+        "polyspike/status/bot/error": partial(status_handler.handle_bot_error, bot=bot),
+
+        # Heartbeat handler (updates heartbeat monitor)
+        "polyspike/status/bot/heartbeat": partial(_update_heartbeat, bot=bot),
+
+        # Trading event handlers
+        "polyspike/trading/position/opened": partial(trading_handler.handle_position_opened, bot=bot),
+        "polyspike/trading/trade/completed": partial(trading_handler.handle_trade_completed, bot=bot),
+
+        # Balance event handler
+        "polyspike/balance/update": partial(balance_handler.handle_balance_update, bot=bot),
+
+        # Session stats handler (for /stats command cache)
+        "polyspike/stats/session": stats.cache_session_stats,
+    }
+    mqtt_client.register_handlers_bulk(handlers)
 
     # Log registered handlers
     registered_topics = mqtt_client.list_handlers()
@@ -87,6 +89,20 @@ def register_mqtt_handlers(mqtt_client: MQTTClient, bot) -> None:
         logger.info(f"  - {topic}")
 
 
+async def _send_mqtt_alert(bot, embed, message: str) -> None:
+    """Send an MQTT connection alert embed and log the outcome.
+
+    Args:
+        bot: Discord bot instance with safe_send_to_channel method.
+        embed: Prebuilt MQTT connection alert embed.
+        message: Alert message (for logging).
+    """
+    if await bot.safe_send_to_channel(embed, urgent=True):
+        logger.info(f"MQTT alert sent to Discord: {message}")
+    else:
+        logger.error("Failed to send MQTT connection alert to Discord (see errors above)")
+
+
 def setup_mqtt_alert_callback(mqtt_client: MQTTClient, bot) -> None:
     """Setup MQTT connection alert callback.
 
@@ -97,7 +113,7 @@ def setup_mqtt_alert_callback(mqtt_client: MQTTClient, bot) -> None:
         mqtt_client: MQTT client instance to register alert callback with.
         bot: Discord bot instance for sending alerts.
     """
-    logger = get_logger()
+    from src.utils.embeds import create_mqtt_connection_alert_embed
 
     def mqtt_alert_callback(message: str, downtime_seconds: float) -> None:
         """Callback function for MQTT connection alerts.
@@ -113,13 +129,11 @@ def setup_mqtt_alert_callback(mqtt_client: MQTTClient, bot) -> None:
 
             embed = create_mqtt_connection_alert_embed(message, downtime_seconds)
 
-            # Send alert synchronously (callback is called from MQTT thread)
-            asyncio.run_coroutine_threadsafe(
-                bot.notification_channel.send(embed=embed),
-                bot.loop
-            )
-
-            logger.info(f"MQTT alert sent to Discord: {message}")
+            # Called on the loop by the MQTT client's alert task; send through
+            # the notification batcher, flushing it immediately
+            task = asyncio.create_task(_send_mqtt_alert(bot, embed, message))
+            _alert_tasks.add(task)
+            task.add_done_callback(_alert_tasks.discard)
 
         except Exception as e:
             logger.error(f"Failed to send MQTT connection alert to Discord: {e}", exc_info=True)
@@ -169,6 +183,15 @@ async def main() -> None:
             f"(check interval: {config.heartbeat_check_interval}s)"
         )
 
+        # 2a. Import the heavy modules only now that configuration is valid
+        from src.bot import create_discord_bot, enable_eager_tasks, setup_signal_handlers
+        from src.handlers import balance_handler, trading_handler
+        from src.mqtt_client import MQTTClient
+
+        # 2b. Run MQTT handler tasks eagerly (Python 3.12+)
+        if enable_eager_tasks():
+            logger.info("✓ Eager task factory enabled")
+
         # 3. Create Discord bot
         logger.info("Creating Discord bot...")
         bot = create_discord_bot(config)
@@ -194,6 +217,10 @@ async def main() -> None:
         balance_handler.set_startup_time(startup_time)
         logger.info(f"✓ Startup time set: {startup_time}")
 
+        # 6a. Optional approximate trade dedup for high trade volumes
+        if config.trade_dedup_bloom:
+            trading_handler.enable_bloom_dedup()
+
         # 7. Connect to MQTT broker
         logger.info(
             f"Connecting to MQTT broker at {config.mqtt_broker_host}:{config.mqtt_broker_port}..."
@@ -1,15 +1,149 @@
 """MQTT client for PolySpike trading bot integration."""
 
 import asyncio
-import json
 import logging
+import re
 import time
-from collections import defaultdict, deque
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Mapping, Optional
 
+import orjson
 import paho.mqtt.client as mqtt
 from src.config import Config
 from src.utils.logger import get_logger
+from src.utils.topic_matcher import TopicMatcher
+
+
+# Retained messages published this long before startup are ignored
+_OLD_MESSAGE_THRESHOLD = 300  # seconds
+
+# Publishers put "timestamp" first, so it can be read from the head of the
+# raw payload without parsing the whole JSON document
+_TIMESTAMP_PEEK_BYTES = 64
+_TIMESTAMP_RE = re.compile(rb'"timestamp"\s*:\s*(-?[0-9][0-9.eE+-]*)')
+
+
+def _peek_timestamp(payload: bytes) -> Optional[float]:
+    """Read the "timestamp" field from the head of a raw JSON payload.
+
+    Args:
+        payload: Raw MQTT message payload.
+
+    Returns:
+        Timestamp value, or None if it is not within the first
+        _TIMESTAMP_PEEK_BYTES bytes or is not a number.
+    """
+    match = _TIMESTAMP_RE.search(payload, 0, _TIMESTAMP_PEEK_BYTES)
+    if match is None:
+        return None
+    try:
+        return float(match.group(1))
+    except ValueError:
+        return None
+
+
+# Messages waiting for the event loop before on_message starts dropping
+_MAX_PENDING_MESSAGES = 1000
+
+# Seconds between summary log lines of received/routed message counts
+_MESSAGE_STATS_INTERVAL = 30.0
+
+# Message rate window: 12 buckets of 5s cover the last minute
+_RATE_BUCKET_SECONDS = 5
+_RATE_BUCKETS = 12
+
+# Beyond this many topic filters, subscribe to the whole prefix instead
+_MAX_SUBSCRIPTIONS = 256
+
+# Seconds the broker may stay unreachable before the alert callback fires
+_DISCONNECT_ALERT_SECONDS = 300.0
+
+# Topics tracked for rate detection; the oldest is evicted beyond this
+_MAX_RATE_TOPICS = 4096
+
+# Expected high-frequency topics (stats, heartbeat) exempt from rate warnings
+_HIGH_FREQUENCY_SUFFIXES = ("stats/periodic", "heartbeat")
+
+
+def _filter_covers(broad: str, narrow: str) -> bool:
+    """Check whether every topic matched by one filter is matched by another.
+
+    paho's topic_matches_sub() treats its second argument as a concrete
+    topic, so it can't compare two filters: it reports "a/+" and "a/#" as
+    matching each other.
+
+    Args:
+        broad: Topic filter that may cover the other.
+        narrow: Topic filter to check.
+
+    Returns:
+        True if broad matches every topic narrow matches.
+    """
+    broad_parts = broad.split("/")
+    narrow_parts = narrow.split("/")
+    last = len(broad_parts) - 1
+
+    for i, level in enumerate(broad_parts):
+        if level == "#" and i == last:
+            # Covers the parent level and everything below it
+            return len(narrow_parts) >= i
+        if i >= len(narrow_parts):
+            return False
+        if level == "+":
+            # One level exactly, so never a multi-level '#'
+            if narrow_parts[i] == "#":
+                return False
+        elif level != narrow_parts[i]:
+            return False
+
+    return len(broad_parts) == len(narrow_parts)
+
+
+class _RateWindow:
+    """Approximate sliding-window message counter for one topic.
+
+    Counts messages in fixed-width time buckets with a running total, so
+    memory per topic is constant and recording a message is a couple of
+    integer operations. The window covers the current bucket plus the
+    previous ones, i.e. between 55 and 60 seconds.
+    """
+
+    __slots__ = ("buckets", "epoch", "total")
+
+    def __init__(self) -> None:
+        """Initialize an empty window."""
+        self.buckets = [0] * _RATE_BUCKETS
+        self.epoch = 0
+        self.total = 0
+
+    def add(self, now: float) -> int:
+        """Record one message and get the count within the window.
+
+        Args:
+            now: Time of the message, in seconds.
+
+        Returns:
+            Number of messages in the window, including this one.
+        """
+        buckets = self.buckets
+        epoch = int(now // _RATE_BUCKET_SECONDS)
+        steps = epoch - self.epoch
+
+        if steps >= _RATE_BUCKETS:
+            # Whole window expired
+            buckets[:] = [0] * _RATE_BUCKETS
+            self.total = 0
+            self.epoch = epoch
+        elif steps > 0:
+            # Expire the buckets the window moved past
+            for e in range(self.epoch + 1, epoch + 1):
+                index = e % _RATE_BUCKETS
+                self.total -= buckets[index]
+                buckets[index] = 0
+            self.epoch = epoch
+
+        buckets[self.epoch % _RATE_BUCKETS] += 1
+        self.total += 1
+        return self.total
 
 
 class MQTTClient:
@@ -18,11 +152,16 @@ class MQTTClient:
     Provides an asynchronous interface to the paho-mqtt client with automatic
     reconnection, rate limiting detection, and topic-based message routing.
 
+    Messages arrive on paho's network thread. Once connect() has been awaited,
+    they are handed to that event loop for parsing and routing, so handlers
+    run on the loop and can create tasks and await Discord calls without
+    crossing threads themselves.
+
     Attributes:
         config: Bot configuration containing MQTT connection settings.
         connected: Whether the client is currently connected to the broker.
         startup_time: Unix timestamp when the client was initialized.
-        message_handlers: List of registered (pattern, handler) tuples.
+        message_handlers: Tuple of registered (pattern, handler) pairs.
 
     Example:
         >>> client = MQTTClient(config)
@@ -48,20 +187,51 @@ class MQTTClient:
         self.client.on_connect = self.on_connect
         self.client.on_disconnect = self.on_disconnect
         self.client.on_message = self.on_message
+        # paho's network loop reconnects by itself after a connection loss;
+        # cap its backoff and route its log output to ours
+        self.client.reconnect_delay_set(min_delay=1, max_delay=60)
+        self.client.enable_logger(self.logger)
 
         self.connected = False
         self.startup_time = time.time()
-        self._retry_task: Optional[asyncio.Task] = None
-        self._retry_count = 0
+        self._alert_task: Optional[asyncio.Task] = None
+        # Set (from paho's thread, via the loop) on connect and disconnect so
+        # the alert task can sleep until the connection state changes
+        self._connection_event = asyncio.Event()
+        self._stats_task: Optional[asyncio.Task] = None
         self._stopping = False
         self._loop_running = False
         self._disconnect_time: Optional[float] = None
         self._disconnect_alert_sent = False
         self._alert_callback: Optional[Callable] = None
-        self.message_handlers: list[tuple[str, Callable]] = []
-
-        # Rate limiting detection (for spam prevention)
-        self._message_timestamps: dict[str, deque] = defaultdict(lambda: deque(maxlen=100))
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Replaced (never mutated) on register/unregister, so a reader always
+        # sees a consistent snapshot
+        self.message_handlers: tuple[tuple[str, Callable], ...] = ()
+
+        # Routing index derived from message_handlers: literal (wildcard-free)
+        # topics map straight to their routes, and only wildcard patterns go
+        # into the trie. Routes are (registration index, pattern, handler).
+        self._literal_routes: dict[str, tuple[tuple[int, str, Callable], ...]] = {}
+        self._wildcard_matcher: Optional[TopicMatcher] = None
+
+        # Topic filters currently subscribed on the broker
+        self._subscriptions: set[str] = set()
+
+        # Messages handed from paho's thread to the loop: each counter has a
+        # single writer thread, and their difference is the backlog
+        self._queued_messages = 0
+        self._processed_messages = 0
+        self._dropped_messages = 0
+
+        # Message counts since the last summary log line (per-message
+        # logging is DEBUG only)
+        self._message_count = 0
+        self._route_counts: dict[str, int] = {}
+
+        # Rate limiting detection (for spam prevention): per topic, a
+        # bucketed message count over the last minute
+        self._message_counts: dict[str, _RateWindow] = {}
         self._rate_limit_warnings: dict[str, float] = {}
         self._rate_limit_threshold = 50  # messages per minute (for non-periodic topics)
         self._rate_warning_cooldown = 300  # seconds (5 min between warnings)
@@ -77,7 +247,7 @@ class MQTTClient:
         """Handle MQTT connection callback.
 
         Called by paho-mqtt when the client connects to the broker.
-        Subscribes to the configured topic prefix on successful connection.
+        Subscribes to the registered topic patterns on successful connection.
 
         Args:
             client: MQTT client instance that triggered the callback.
@@ -98,11 +268,13 @@ class MQTTClient:
             else:
                 self.logger.info("Connected to MQTT broker successfully")
 
-            client.subscribe(f"{self.config.mqtt_topic_prefix}#")
+            filters = self._subscription_filters()
+            client.subscribe([(topic_filter, 0) for topic_filter in sorted(filters)])
+            self._subscriptions = filters
             self.connected = True
-            self._retry_count = 0
             self._disconnect_time = None
             self._disconnect_alert_sent = False
+            self._signal_connection_change()
         else:
             error_messages = {
                 1: "Connection refused - incorrect protocol version",
@@ -125,7 +297,8 @@ class MQTTClient:
         """Handle MQTT disconnection callback.
 
         Called by paho-mqtt when the client disconnects from the broker.
-        Logs the disconnection reason and initiates reconnection if unexpected.
+        Logs the disconnection reason and wakes the alert task if unexpected.
+        Reconnection is handled by paho's network loop.
 
         Args:
             client: MQTT client instance that triggered the callback.
@@ -157,7 +330,19 @@ class MQTTClient:
             self.logger.warning(f"Disconnected from MQTT broker unexpectedly: {reason}")
 
         if not self._stopping:
-            self.logger.info("Will attempt to reconnect via retry task...")
+            self.logger.info("paho will reconnect automatically...")
+            self._signal_connection_change()
+
+    def _signal_connection_change(self) -> None:
+        """Wake the alert task after a connect or disconnect (thread-safe)."""
+        loop = self._loop
+        if loop is None:
+            return
+        try:
+            loop.call_soon_threadsafe(self._connection_event.set)
+        except RuntimeError:
+            # Event loop already closed (shutdown in progress)
+            pass
 
     def on_message(
         self,
@@ -168,7 +353,10 @@ class MQTTClient:
         """Handle incoming MQTT messages.
 
         Called by paho-mqtt when a message is received on a subscribed topic.
-        Parses JSON payload and routes to registered handlers based on topic pattern.
+        Does only the minimum on paho's network thread: once connect() has
+        bound an event loop, the message is handed to that loop, where
+        _process_message parses and routes it. At most _MAX_PENDING_MESSAGES
+        can wait there; newer messages are dropped until it catches up.
 
         Args:
             client: MQTT client instance that received the message.
@@ -178,17 +366,95 @@ class MQTTClient:
         Returns:
             None
         """
-        topic = msg.topic
-        self.logger.info(f"Received message on topic: {topic}")
+        loop = self._loop
+        if loop is None or self._on_loop(loop):
+            self._process_message(msg.topic, msg.payload, msg.retain)
+            return
+
+        # Single-writer counters (this thread / the loop), so no lock needed
+        if self._queued_messages - self._processed_messages >= _MAX_PENDING_MESSAGES:
+            if not self._dropped_messages:
+                self.logger.warning(
+                    f"MQTT message backlog full ({_MAX_PENDING_MESSAGES} pending), "
+                    "dropping new messages"
+                )
+            self._dropped_messages += 1
+            return
 
+        # Count before scheduling, so the loop never sees more processed
+        # than queued messages
+        self._queued_messages += 1
         try:
-            payload = msg.payload.decode("utf-8")
-            data = json.loads(payload)
+            loop.call_soon_threadsafe(
+                self._process_queued_message, msg.topic, msg.payload, msg.retain
+            )
+        except RuntimeError as e:
+            # Event loop already closed (shutdown in progress)
+            self._queued_messages -= 1
+            self.logger.warning(f"Dropping message on topic {msg.topic}: {e}")
 
-            try:
-                self.logger.debug(f"Payload: {str(data)}")
-            except Exception:
-                pass
+    @staticmethod
+    def _on_loop(loop: asyncio.AbstractEventLoop) -> bool:
+        """Check whether the calling thread is running the given loop.
+
+        Args:
+            loop: Event loop to check against.
+
+        Returns:
+            True if called from a coroutine or callback on that loop.
+        """
+        try:
+            return asyncio.get_running_loop() is loop
+        except RuntimeError:
+            return False
+
+    def _process_queued_message(self, topic: str, payload: bytes, retain: bool) -> None:
+        """Process a message handed over by on_message on the event loop.
+
+        Args:
+            topic: Topic the message arrived on.
+            payload: Raw message payload.
+            retain: Whether the broker delivered it as a retained message.
+        """
+        self._processed_messages += 1
+        if self._dropped_messages and self._queued_messages == self._processed_messages:
+            self.logger.warning(
+                f"MQTT message backlog cleared; {self._dropped_messages} messages were dropped"
+            )
+            self._dropped_messages = 0
+
+        self._process_message(topic, payload, retain)
+
+    def _process_message(self, topic: str, payload: bytes, retain: bool) -> None:
+        """Parse a message and route it to the registered handlers.
+
+        Args:
+            topic: Topic the message arrived on.
+            payload: Raw message payload.
+            retain: Whether the broker delivered it as a retained message.
+        """
+        self._message_count += 1
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self.logger.debug("Received message on topic: %s", topic)
+
+        # Messages timestamped before this are leftovers from before startup
+        stale_before = self.startup_time - _OLD_MESSAGE_THRESHOLD
+
+        try:
+            # Drop stale retained messages before paying for a full parse
+            if retain:
+                peeked = _peek_timestamp(payload)
+                if peeked is not None and peeked < stale_before:
+                    self.logger.debug(f"Ignoring old retained message on topic: {topic}")
+                    return
+
+            # orjson parses the raw bytes directly (validating UTF-8 itself)
+            data = orjson.loads(payload)
+
+            # Stringifying the whole payload is skipped unless DEBUG is on
+            if debug:
+                self.logger.debug("Payload: %s", data)
 
             # Validate critical fields
             if "timestamp" not in data:
@@ -196,42 +462,72 @@ class MQTTClient:
                     f"MQTT payload missing critical field 'timestamp' on topic {topic}. "
                     f"Message may be malformed."
                 )
-            elif data.get("timestamp", 0) < self.startup_time - 300:
+            elif data.get("timestamp", 0) < stale_before:
                 self.logger.debug(f"Ignoring old retained message on topic: {topic}")
                 return
 
             # Rate limiting detection (spam prevention)
-            self._check_message_rate(topic)
-
-            matched = False
-            for pattern, handler in self.message_handlers:
-                if self._match_topic(topic, pattern):
-                    matched = True
-                    try:
-                        self.logger.info(f"Routing topic '{topic}' to handler for pattern '{pattern}'")
-                        handler(data)
-                    except Exception as e:
-                        self.logger.error(f"Handler error for pattern {pattern} on topic {topic}: {e}", exc_info=True)
-
-            if not matched:
+            self._check_message_rate(topic, time.monotonic())
+
+            # Literal patterns are one dict lookup; the trie only holds wildcards
+            routes = self._literal_routes.get(topic, ())
+            if self._wildcard_matcher is not None:
+                wildcard = self._wildcard_matcher.match(topic)
+                if wildcard:
+                    # Merge back into registration order
+                    routes = sorted((*routes, *wildcard)) if routes else wildcard
+
+            route_counts = self._route_counts
+            for _, pattern, handler in routes:
+                route_counts[pattern] = route_counts.get(pattern, 0) + 1
+                if debug:
+                    self.logger.debug("Routing topic '%s' to handler for pattern '%s'", topic, pattern)
+                self._run_handler(handler, data, pattern, topic)
+
+            if not routes:
                 self.logger.debug(f"No handler matched for topic: {topic}")
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
+            # Also raised for payloads that are not valid UTF-8
             self.logger.error(f"JSON decode error on topic {topic}: {e}")
-        except UnicodeDecodeError as e:
-            self.logger.error(f"Unicode decode error on topic {topic}: {e}")
         except Exception as e:
             self.logger.error(f"Unexpected error processing message on topic {topic}: {e}", exc_info=True)
 
+    def _run_handler(
+        self,
+        handler: Callable[[dict[str, Any]], None],
+        data: dict[str, Any],
+        pattern: str,
+        topic: str,
+    ) -> None:
+        """Call a handler, logging any exception it raises.
+
+        Args:
+            handler: Handler registered for the matching pattern.
+            data: Parsed JSON payload.
+            pattern: Pattern the topic matched.
+            topic: Topic the message arrived on.
+        """
+        try:
+            handler(data)
+        except Exception as e:
+            self.logger.error(f"Handler error for pattern {pattern} on topic {topic}: {e}", exc_info=True)
+
     async def connect(self) -> None:
         """Connect to MQTT broker asynchronously.
 
         Establishes connection to the MQTT broker, starts the network loop,
-        and initiates the background retry task for automatic reconnection.
+        and starts the background task that alerts on long outages. After
+        this initial connection, paho's network loop reconnects on its own.
+        The running event loop is bound as the target for message handlers.
 
         Raises:
             ConnectionError: If initial connection fails or times out after 10 seconds.
         """
+        self._loop = asyncio.get_running_loop()
+        if self._stats_task is None or self._stats_task.done():
+            self._stats_task = asyncio.create_task(self._message_stats_task())
+
         try:
             await asyncio.wait_for(
                 asyncio.to_thread(
@@ -251,24 +547,27 @@ class MQTTClient:
         except Exception as e:
             raise ConnectionError(f"Failed to connect to MQTT broker: {e}")
 
-        self._retry_task = asyncio.create_task(self._retry_connection_task())
+        self._alert_task = asyncio.create_task(self._connection_alert_task())
 
     async def disconnect(self) -> None:
         """Disconnect from MQTT broker gracefully.
 
-        Stops the retry task, unsubscribes from topics, disconnects from
+        Stops the background tasks, unsubscribes from topics, disconnects from
         the broker, and stops the network loop. Safe to call multiple times.
         """
         self._stopping = True
 
-        if self._retry_task and not self._retry_task.done():
-            self._retry_task.cancel()
-            try:
-                await self._retry_task
-            except asyncio.CancelledError:
-                pass
+        for task in (self._alert_task, self._stats_task):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
 
-        self.client.unsubscribe(f"{self.config.mqtt_topic_prefix}#")
+        if self._subscriptions:
+            self.client.unsubscribe(sorted(self._subscriptions))
+            self._subscriptions = set()
 
         try:
             await asyncio.to_thread(self.client.disconnect)
@@ -280,71 +579,102 @@ class MQTTClient:
         self.connected = False
         self.logger.info("MQTT client disconnected")
 
-    async def _retry_connection_task(self) -> None:
-        """Background task for connection retry with exponential backoff.
+    async def _connection_alert_task(self) -> None:
+        """Background task alerting when the broker stays unreachable.
 
-        Continuously monitors the connection state and attempts reconnection
-        when disconnected. Uses exponential backoff with 1-60 second delays.
-        Sends Discord alert if MQTT is down for more than 5 minutes.
+        Reconnection itself is left to paho's network loop. This task sleeps
+        until on_disconnect signals a state change, then fires the alert
+        callback once if the connection is not back within
+        _DISCONNECT_ALERT_SECONDS.
 
         Note:
             This is an internal method started by connect() and should not
             be called directly.
         """
-        base_delay = 1.0
-        max_delay = 60.0
-        alert_threshold = 300.0  # 5 minutes
+        event = self._connection_event
 
         while not self._stopping:
-            if not self.connected:
-                # Check if we should send a Discord alert
-                if (self._disconnect_time is not None and
-                    not self._disconnect_alert_sent and
-                    self._alert_callback is not None):
-
-                    downtime = time.time() - self._disconnect_time
-
-                    if downtime >= alert_threshold:
-                        self.logger.warning(
-                            f"MQTT broker down for {downtime:.0f}s (>{alert_threshold:.0f}s threshold). "
-                            "Sending Discord alert..."
-                        )
-                        try:
-                            self._alert_callback(
-                                f"MQTT broker unreachable for {downtime:.0f}s",
-                                downtime
-                            )
-                            self._disconnect_alert_sent = True
-                            self.logger.info("Discord alert sent successfully")
-                        except Exception as e:
-                            self.logger.error(f"Failed to send Discord alert: {e}", exc_info=True)
-
-                # Retry connection with exponential backoff
-                delay = min(base_delay * (2 ** self._retry_count), max_delay)
-                self.logger.info(f"Retry connection in {delay:.1f}s (attempt {self._retry_count + 1})")
-                await asyncio.sleep(delay)
+            # Clear before checking, so a state change right after the check
+            # still wakes the waits below
+            event.clear()
+            if (self.connected or self._disconnect_time is None or
+                    self._disconnect_alert_sent or self._alert_callback is None):
+                await event.wait()
+                continue
 
+            downtime = time.time() - self._disconnect_time
+            if downtime < _DISCONNECT_ALERT_SECONDS:
                 try:
-                    await asyncio.to_thread(
-                        self.client.connect,
-                        self.config.mqtt_broker_host,
-                        self.config.mqtt_broker_port,
-                        keepalive=60
-                    )
-                    if not self._loop_running:
-                        self.client.loop_start()
-                        self._loop_running = True
-                    self.logger.info("Reconnected to MQTT broker")
-                except Exception as e:
-                    self._retry_count += 1
-                    self.logger.error(f"Reconnection attempt {self._retry_count} failed: {e}")
-
-            if self._stopping:
-                break
-
-            await asyncio.sleep(5.0)
-
-    def _check_message_rate(self, topic: str) -> None:
+                    await asyncio.wait_for(event.wait(), timeout=_DISCONNECT_ALERT_SECONDS - downtime)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            self.logger.warning(
+                f"MQTT broker down for {downtime:.0f}s (>{_DISCONNECT_ALERT_SECONDS:.0f}s threshold). "
+                "Sending Discord alert..."
+            )
+            self._disconnect_alert_sent = True
+            try:
+                self._alert_callback(
+                    f"MQTT broker unreachable for {downtime:.0f}s",
+                    downtime
+                )
+                self.logger.info("Discord alert sent successfully")
+            except Exception as e:
+                self.logger.error(f"Failed to send Discord alert: {e}", exc_info=True)
+
+    async def _message_stats_task(self) -> None:
+        """Background task logging message counts every _MESSAGE_STATS_INTERVAL.
+
+        Replaces per-message INFO logging: one line summarizes how many
+        messages arrived and how many were routed to each pattern.
+
+        Note:
+            This is an internal method started by connect() and should not
+            be called directly.
+        """
+        while not self._stopping:
+            await asyncio.sleep(_MESSAGE_STATS_INTERVAL)
+            self._log_message_stats()
+            self._prune_rate_tracking(time.monotonic())
+
+    def _log_message_stats(self) -> None:
+        """Log and reset the received/routed message counts."""
+        # Like _process_message, this runs on the loop once connect() has
+        # bound it, so a plain swap is enough
+        count, self._message_count = self._message_count, 0
+        routes, self._route_counts = self._route_counts, {}
+        if not count:
+            return
+
+        routed = ", ".join(f"{pattern}: {n}" for pattern, n in routes.items())
+        self.logger.info(
+            f"Received {count} MQTT messages in the last {_MESSAGE_STATS_INTERVAL:.0f}s"
+            + (f" (routed: {routed})" if routed else "")
+        )
+
+    def _prune_rate_tracking(self, now: float) -> None:
+        """Drop rate state for topics that have gone quiet.
+
+        Topics can carry per-trade or per-device IDs, so without pruning the
+        per-topic dicts would grow for as long as the bot runs.
+
+        Args:
+            now: Current time.monotonic() reading.
+        """
+        expired_epoch = int(now // _RATE_BUCKET_SECONDS) - _RATE_BUCKETS
+        stale = [t for t, w in self._message_counts.items() if w.epoch <= expired_epoch]
+        for topic in stale:
+            del self._message_counts[topic]
+
+        # A warning older than the cooldown no longer suppresses anything
+        cutoff = now - self._rate_warning_cooldown
+        stale = [t for t, ts in self._rate_limit_warnings.items() if ts < cutoff]
+        for topic in stale:
+            del self._rate_limit_warnings[topic]
+
+    def _check_message_rate(self, topic: str, now: float) -> None:
         """Check message rate for spam detection.
 
         Tracks message timestamps and logs warning if rate exceeds threshold.
@@ -352,77 +682,35 @@ class MQTTClient:
 
         Args:
             topic: MQTT topic of the message.
+            now: Current time.monotonic() reading (only deltas matter, so
+                wall-clock jumps don't distort the window).
         """
         # Skip rate limiting for expected high-frequency topics
-        high_frequency_topics = ["stats/periodic", "heartbeat"]
-        if any(freq_topic in topic for freq_topic in high_frequency_topics):
+        if topic.endswith(_HIGH_FREQUENCY_SUFFIXES):
             return
 
-        current_time = time.time()
-        topic_queue = self._message_timestamps[topic]
-
-        # Add current timestamp
-        topic_queue.append(current_time)
+        counts = self._message_counts
+        window = counts.get(topic)
+        if window is None:
+            if len(counts) >= _MAX_RATE_TOPICS:
+                # Evict the topic tracked the longest (dicts keep insertion order)
+                del counts[next(iter(counts))]
+            window = counts[topic] = _RateWindow()
 
         # Count messages in last 60 seconds
-        cutoff_time = current_time - 60
-        recent_messages = sum(1 for ts in topic_queue if ts >= cutoff_time)
+        recent_messages = window.add(now)
 
         # Check if rate exceeds threshold
         if recent_messages > self._rate_limit_threshold:
             # Only log warning if we haven't warned recently (cooldown)
-            last_warning = self._rate_limit_warnings.get(topic, 0)
-            if current_time - last_warning > self._rate_warning_cooldown:
+            last_warning = self._rate_limit_warnings.get(topic)
+            if last_warning is None or now - last_warning > self._rate_warning_cooldown:
                 self.logger.warning(
                     f"High message rate detected on topic '{topic}': "
                     f"{recent_messages} messages in last 60s (threshold: {self._rate_limit_threshold}/min). "
                     f"Possible spam or bot malfunction."
                 )
-                self._rate_limit_warnings[topic] = current_time
-
-    def _match_topic(self, topic: str, pattern: str) -> bool:
-        """Check if a topic matches an MQTT wildcard pattern.
-
-        Implements MQTT topic matching with single-level (+) and
-        multi-level (#) wildcards according to the MQTT specification.
-
-        Args:
-            topic: Actual MQTT topic string received from broker.
-            pattern: MQTT topic pattern with optional wildcards.
-                '+' matches exactly one level, '#' matches any remaining levels.
-
-        Returns:
-            True if topic matches the pattern, False otherwise.
-
-        Examples:
-            _match_topic("a/b/c", "a/+/c") -> True
-            _match_topic("a/b/c", "a/#") -> True
-            _match_topic("a/b", "a/b/c") -> False
-        """
-        topic_parts = topic.split('/')
-        pattern_parts = pattern.split('/')
-
-        if not pattern_parts:
-            return False
-
-        if pattern_parts[-1] == '#':
-            if len(topic_parts) < len(pattern_parts) - 1:
-                return False
-            for i in range(len(pattern_parts) - 1):
-                if pattern_parts[i] != '+' and pattern_parts[i] != topic_parts[i]:
-                    return False
-            return True
-
-        if len(topic_parts) != len(pattern_parts):
-            return False
-
-        for topic_part, pattern_part in zip(topic_parts, pattern_parts):
-            if pattern_part == '+':
-                continue
-            if pattern_part != topic_part:
-                return False
-
-        return True
+                self._rate_limit_warnings[topic] = now
 
     def register_handler(
         self,
@@ -444,9 +732,26 @@ class MQTTClient:
         Example:
             >>> mqtt.register_handler("polyspike/trade/#", handle_trade)
         """
-        self.message_handlers.append((topic_pattern, handler_func))
+        self.message_handlers = self.message_handlers + ((topic_pattern, handler_func),)
+        self._rebuild_routes()
         self.logger.info(f"Registered handler for topic pattern: {topic_pattern}")
 
+    def register_handlers_bulk(
+        self,
+        handlers: Mapping[str, Callable[[dict[str, Any]], None]],
+    ) -> None:
+        """Register handlers for several topic patterns at once.
+
+        Equivalent to calling register_handler() for each item, but rebuilds
+        the routing index only once.
+
+        Args:
+            handlers: Mapping of topic pattern to handler callback.
+        """
+        self.message_handlers = self.message_handlers + tuple(handlers.items())
+        self._rebuild_routes()
+        self.logger.info(f"Registered handlers for {len(handlers)} topic patterns")
+
     def unregister_handler(
         self,
         topic_pattern: str,
@@ -461,9 +766,65 @@ class MQTTClient:
             topic_pattern: MQTT topic pattern that was used during registration.
             handler_func: Callback function to remove.
         """
-        self.message_handlers = [(p, h) for p, h in self.message_handlers if not (p == topic_pattern and h == handler_func)]
+        self.message_handlers = tuple(
+            (p, h) for p, h in self.message_handlers if not (p == topic_pattern and h == handler_func)
+        )
+        self._rebuild_routes()
         self.logger.info(f"Unregistered handler for topic pattern: {topic_pattern}")
 
+    def _rebuild_routes(self) -> None:
+        """Rebuild the routing index from message_handlers.
+
+        Literal patterns are grouped by topic and wildcard patterns go into a
+        TopicMatcher trie. Each route carries its registration index so
+        on_message can merge matches from both back into registration order.
+        """
+        literal: dict[str, list[tuple[int, str, Callable]]] = {}
+        matcher = TopicMatcher()
+        for index, (pattern, handler) in enumerate(self.message_handlers):
+            route = (index, pattern, handler)
+            if "+" in pattern or "#" in pattern:
+                matcher.add(pattern, route)
+            else:
+                literal.setdefault(pattern, []).append(route)
+
+        self._literal_routes = {topic: tuple(routes) for topic, routes in literal.items()}
+        self._wildcard_matcher = matcher if len(matcher) else None
+
+        if self.connected:
+            self._update_subscriptions()
+
+    def _subscription_filters(self) -> set[str]:
+        """Compute the topic filters needed for the registered handlers.
+
+        Subscribing to the registered patterns instead of the whole prefix
+        keeps the broker from sending topics no handler would match.
+        Patterns covered by a broader one are left out so overlapping
+        subscriptions don't deliver a message twice.
+
+        Returns:
+            Set of topic filters to subscribe to.
+        """
+        patterns = {pattern for pattern, _ in self.message_handlers}
+        if not patterns or len(patterns) > _MAX_SUBSCRIPTIONS:
+            return {f"{self.config.mqtt_topic_prefix}#"}
+
+        return {
+            pattern for pattern in patterns
+            if not any(other != pattern and _filter_covers(other, pattern) for other in patterns)
+        }
+
+    def _update_subscriptions(self) -> None:
+        """Subscribe to new topic filters and drop ones no longer needed."""
+        filters = self._subscription_filters()
+        added = filters - self._subscriptions
+        removed = self._subscriptions - filters
+        if added:
+            self.client.subscribe([(topic_filter, 0) for topic_filter in sorted(added)])
+        if removed:
+            self.client.unsubscribe(sorted(removed))
+        self._subscriptions = filters
+
     def list_handlers(self) -> list[str]:
         """List all registered topic patterns.
 
@@ -489,11 +850,12 @@ class MQTTClient:
     def stop(self) -> None:
         """Stop the MQTT client and cancel background tasks.
 
-        Sets the stopping flag and cancels the retry task. Does not
+        Sets the stopping flag and cancels the alert and stats tasks. Does not
         disconnect from the broker - use disconnect() for that.
         This method is synchronous and can be called from signal handlers.
         """
         self._stopping = True
 
-        if self._retry_task and not self._retry_task.done():
-            self._retry_task.cancel()
+        for task in (self._alert_task, self._stats_task):
+            if task and not task.done():
+                task.cancel()
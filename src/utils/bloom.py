@@ -0,0 +1,109 @@
+"""Rotating Bloom filter for approximate, memory-bounded deduplication."""
+
+import hashlib
+import math
+from typing import Any
+
+
+class RotatingBloomFilter:
+    """Bloom filter with two generations for time-windowed eviction.
+
+    New keys go into the current generation. Once it holds ``capacity``
+    keys it becomes the previous generation and a fresh one is started, so
+    the filter always remembers at least the last ``capacity`` keys (and at
+    most the last ``2 * capacity``) in fixed memory.
+
+    Membership checks can report false positives at roughly ``error_rate``
+    (each generation is sized for half of it, since a lookup checks both),
+    but never false negatives for remembered keys.
+    """
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.01):
+        """Initialize the filter.
+
+        Args:
+            capacity: Keys per generation.
+            error_rate: Target false positive rate of a lookup.
+
+        Raises:
+            ValueError: If capacity is not positive or error_rate is not
+                between 0 and 1.
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+
+        # Optimal bit count and number of hash functions for the targets; a
+        # lookup can hit in either generation, so each gets half the rate
+        generation_rate = error_rate / 2
+        self.num_bits = math.ceil(-capacity * math.log(generation_rate) / math.log(2) ** 2)
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+
+        self._current = bytearray((self.num_bits + 7) // 8)
+        self._previous = bytearray(len(self._current))
+        self._current_count = 0
+        self._previous_count = 0
+
+    def _positions(self, key: Any) -> list[int]:
+        """Get the bit positions for a key (double hashing).
+
+        Args:
+            key: Key to hash (non-strings, e.g. integer IDs, are hashed
+                by their str() form).
+
+        Returns:
+            List of num_hashes bit indexes.
+        """
+        digest = hashlib.blake2b(str(key).encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    @staticmethod
+    def _test(bits: bytearray, positions: list[int]) -> bool:
+        """Check whether all positions are set in a generation."""
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in positions)
+
+    def __contains__(self, key: Any) -> bool:
+        """Check whether a key was (probably) added recently.
+
+        Args:
+            key: Key to look up.
+
+        Returns:
+            True if the key is in either generation (or a false positive).
+        """
+        positions = self._positions(key)
+        return self._test(self._current, positions) or self._test(self._previous, positions)
+
+    def add(self, key: Any) -> None:
+        """Add a key, rotating generations when the current one is full.
+
+        Args:
+            key: Key to add.
+        """
+        if self._current_count >= self.capacity:
+            self._previous = self._current
+            self._previous_count = self._current_count
+            self._current = bytearray(len(self._previous))
+            self._current_count = 0
+
+        bits = self._current
+        for pos in self._positions(key):
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self._current_count += 1
+
+    def clear(self) -> None:
+        """Forget all keys."""
+        self._current = bytearray(len(self._current))
+        self._previous = bytearray(len(self._current))
+        self._current_count = 0
+        self._previous_count = 0
+
+    def __len__(self) -> int:
+        """Get the number of keys added across both generations."""
+        return self._current_count + self._previous_count
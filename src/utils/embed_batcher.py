@@ -0,0 +1,204 @@
+"""Batching of Discord notification embeds.
+
+Discord accepts up to 10 embeds (6000 characters in total) per message, so
+notifications that become ready close together are collected and sent as a
+single multi-embed message instead of one HTTP request each.
+"""
+
+import asyncio
+import enum
+from typing import Awaitable, Callable, Optional
+
+import discord
+
+from src.utils.logger import get_logger
+
+
+# (embed, urgent, future resolved with the send result)
+_Item = tuple[discord.Embed, bool, asyncio.Future]
+
+class SendResult(enum.Enum):
+    """Outcome of sending one batch of embeds."""
+
+    SENT = "sent"
+    # Rate limited, missing permissions, channel gone, ...: retrying the
+    # same embeds right away would fail the same way
+    FAILED = "failed"
+    # Discord refused the payload itself (HTTP 400), e.g. one invalid embed
+    REJECTED = "rejected"
+
+
+# Discord's limit on embeds per message
+MAX_EMBEDS_PER_MESSAGE = 10
+
+# Discord's limit on the combined len() of all embeds in one message
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
+
+
+class EmbedBatcher:
+    """Collects embeds and sends them in batches from a single flusher task.
+
+    A batch is flushed when it reaches ``max_size`` embeds, when the next
+    embed would push it over MAX_EMBED_CHARS_PER_MESSAGE, when ``wait``
+    seconds have passed since its first embed arrived, or as soon as an
+    urgent embed is added to it. Non-urgent batches are also held until
+    ``min_interval`` seconds after the previous send, pacing sends under
+    Discord's per-channel rate limit; embeds arriving meanwhile join the
+    batch instead of becoming extra requests.
+    """
+
+    def __init__(
+        self,
+        send_batch: Callable[[list[discord.Embed]], Awaitable[SendResult]],
+        max_size: int = MAX_EMBEDS_PER_MESSAGE,
+        wait: float = 0.5,
+        min_interval: float = 0.0,
+        max_pending: int = 0,
+    ):
+        """Initialize the batcher.
+
+        Args:
+            send_batch: Coroutine function sending a list of embeds as one
+                message and returning its SendResult.
+            max_size: Maximum number of embeds per batch.
+            wait: Seconds to wait for more embeds after the first one.
+            min_interval: Minimum seconds between sends (urgent batches
+                are exempt).
+            max_pending: Maximum queued embeds; further submissions are
+                dropped. 0 means unbounded.
+        """
+        self.max_size = min(max_size, MAX_EMBEDS_PER_MESSAGE)
+        self.wait = wait
+        self.min_interval = min_interval
+        self.max_pending = max_pending
+        self._send_batch = send_batch
+        self._next_send = 0.0
+        self._queue: Optional[asyncio.Queue] = None
+        self._flusher: Optional[asyncio.Task] = None
+
+    async def submit(self, embed: discord.Embed, urgent: bool = False) -> bool:
+        """Queue an embed and wait until the batch containing it is sent.
+
+        Args:
+            embed: Discord embed to send.
+            urgent: Flush the current batch immediately instead of waiting.
+
+        Returns:
+            True if the batch was sent successfully, False otherwise
+            (including when the queue is full and the embed is dropped).
+        """
+        loop = asyncio.get_running_loop()
+
+        # Start the flusher on first use (and after close())
+        if self._flusher is None or self._flusher.done():
+            self._queue = asyncio.Queue()
+            self._flusher = loop.create_task(self._run(self._queue))
+
+        # Bounded by hand so close() can always enqueue its sentinel
+        if self.max_pending and self._queue.qsize() >= self.max_pending:
+            get_logger().warning(
+                f"Notification queue full ({self.max_pending} pending), dropping embed"
+            )
+            return False
+
+        future = loop.create_future()
+        self._queue.put_nowait((embed, urgent, future))
+        return await future
+
+    async def close(self) -> None:
+        """Send any queued embeds and stop the flusher task."""
+        if self._flusher is None or self._flusher.done():
+            return
+
+        self._queue.put_nowait(None)
+        await self._flusher
+        self._flusher = None
+
+    async def _run(self, queue: asyncio.Queue) -> None:
+        """Flusher loop: collect batches from the queue and send them.
+
+        Args:
+            queue: Queue of pending items; a None item stops the loop after
+                flushing what was collected so far.
+        """
+        loop = asyncio.get_running_loop()
+        closing = False
+        # Item that did not fit in the previous batch and starts the next one
+        carry: Optional[_Item] = None
+
+        while not closing:
+            item = carry if carry is not None else await queue.get()
+            carry = None
+            if item is None:
+                break
+
+            batch = [item]
+            chars = len(item[0])
+            deadline = max(loop.time() + self.wait, self._next_send)
+
+            # Keep collecting until full, timed out, or an urgent embed arrives
+            while len(batch) < self.max_size and not item[1]:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    closing = True
+                    break
+                if chars + len(item[0]) > MAX_EMBED_CHARS_PER_MESSAGE:
+                    carry = item
+                    break
+                batch.append(item)
+                chars += len(item[0])
+
+            await self._flush(batch)
+            self._next_send = loop.time() + self.min_interval
+
+    async def _flush(self, batch: list[_Item]) -> None:
+        """Send one batch and resolve its submitters' futures.
+
+        If Discord rejects the batch's payload, its embeds are retried one
+        by one (paced like any other send) so a single invalid embed does
+        not take the others down with it. Other failures are not retried.
+
+        Args:
+            batch: Items collected for this batch.
+        """
+        try:
+            result = await self._send([embed for embed, _, _ in batch])
+            if result is not SendResult.REJECTED or len(batch) == 1:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_result(result is SendResult.SENT)
+                return
+
+            get_logger().warning(f"Batch of {len(batch)} embeds rejected, retrying them one by one")
+            for embed, _, future in batch:
+                # Each retry is a send of its own, so keep min_interval apart
+                await asyncio.sleep(self.min_interval)
+                result = await self._send([embed])
+                if not future.done():
+                    future.set_result(result is SendResult.SENT)
+        finally:
+            # Only reached with unresolved futures if the flusher is cancelled
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_result(False)
+
+    async def _send(self, embeds: list[discord.Embed]) -> SendResult:
+        """Send embeds as one message, logging instead of raising on error.
+
+        Args:
+            embeds: Embeds to send together.
+
+        Returns:
+            Result of the send; FAILED if send_batch raised.
+        """
+        try:
+            return await self._send_batch(embeds)
+        except Exception as e:
+            get_logger().error(f"Failed to send batch of {len(embeds)} embeds: {e}", exc_info=True)
+            return SendResult.FAILED
@@ -5,12 +5,19 @@ MQTT events from the PolySpike Hunter trading bot.
 """
 
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any
 
 import discord
 
 
-def _get_market_name(payload: Dict[str, Any]) -> str:
+# Discord rejects embeds whose description is longer than this
+_MAX_DESCRIPTION_LENGTH = 4096
+
+# Discord rejects embeds with more fields than this
+MAX_EMBED_FIELDS = 25
+
+
+def _get_market_name(payload: dict[str, Any]) -> str:
     """Get market name from payload with fallback to truncated token_id.
 
     According to MQTT API spec, market_name may be missing if the API failed.
@@ -37,7 +44,7 @@ def _get_market_name(payload: Dict[str, Any]) -> str:
     return "Unknown Market"
 
 
-def create_position_opened_embed(payload: Dict[str, Any]) -> discord.Embed:
+def create_position_opened_embed(payload: dict[str, Any]) -> discord.Embed:
     """Create embed for position opened event.
 
     Args:
@@ -94,7 +101,7 @@ def create_position_opened_embed(payload: Dict[str, Any]) -> discord.Embed:
     return embed
 
 
-def create_trade_completed_embed(payload: Dict[str, Any]) -> discord.Embed:
+def create_trade_completed_embed(payload: dict[str, Any]) -> discord.Embed:
     """Create embed for trade completed event.
 
     Args:
@@ -167,7 +174,47 @@ def create_trade_completed_embed(payload: Dict[str, Any]) -> discord.Embed:
     return embed
 
 
-def create_balance_update_embed(payload: Dict[str, Any]) -> discord.Embed:
+def create_trades_digest_embed(payloads: list[dict[str, Any]]) -> discord.Embed:
+    """Create one embed summarizing several trade completed events.
+
+    Args:
+        payloads: Trade completed payloads (see create_trade_completed_embed),
+            in arrival order. At most MAX_EMBED_FIELDS are listed.
+
+    Returns:
+        Discord Embed with one field per trade and color based on the
+        combined P&L (green=profit, red=loss).
+    """
+    payloads = payloads[:MAX_EMBED_FIELDS]
+    total_pnl = sum(payload.get("pnl", 0.0) for payload in payloads)
+    timestamp = max(
+        (payload.get("timestamp", 0.0) for payload in payloads),
+        default=0.0,
+    ) or datetime.now().timestamp()
+
+    # Color based on combined P&L
+    color = 0x00FF00 if total_pnl >= 0 else 0xFF0000
+
+    embed = discord.Embed(
+        title=f"💰 {len(payloads)} Trades Completed",
+        description=f"Total P&L: ${total_pnl:+.2f}",
+        color=color,
+        timestamp=datetime.fromtimestamp(timestamp)
+    )
+
+    for payload in payloads:
+        pnl = payload.get("pnl", 0.0)
+        pnl_pct = payload.get("pnl_pct", 0.0)
+        embed.add_field(
+            name=_get_market_name(payload)[:256],
+            value=f"${pnl:+.2f} ({pnl_pct * 100:+.2f}%)",
+            inline=False
+        )
+
+    return embed
+
+
+def create_balance_update_embed(payload: dict[str, Any]) -> discord.Embed:
     """Create embed for balance update event.
 
     Args:
@@ -235,7 +282,7 @@ def create_balance_update_embed(payload: Dict[str, Any]) -> discord.Embed:
     return embed
 
 
-def create_bot_started_embed(payload: Dict[str, Any]) -> discord.Embed:
+def create_bot_started_embed(payload: dict[str, Any]) -> discord.Embed:
     """Create embed for bot started event.
 
     Args:
@@ -290,7 +337,7 @@ def create_bot_started_embed(payload: Dict[str, Any]) -> discord.Embed:
     return embed
 
 
-def create_bot_stopped_embed(payload: Dict[str, Any]) -> discord.Embed:
+def create_bot_stopped_embed(payload: dict[str, Any]) -> discord.Embed:
     """Create embed for bot stopped event.
 
     Args:
@@ -338,7 +385,7 @@ def create_bot_stopped_embed(payload: Dict[str, Any]) -> discord.Embed:
     return embed
 
 
-def create_bot_error_embed(payload: Dict[str, Any]) -> discord.Embed:
+def create_bot_error_embed(payload: dict[str, Any]) -> discord.Embed:
     """Create embed for bot error event.
 
     Args:
@@ -351,10 +398,15 @@ def create_bot_error_embed(payload: Dict[str, Any]) -> discord.Embed:
 
     Returns:
         Discord Embed with color based on severity (red/orange/yellow).
+        Error messages over 4096 characters are truncated.
     """
     error_type = payload.get("error_type", "UnknownError")
     error_message = payload.get("error_message", "No error message provided")
     severity = payload.get("severity", "error").lower()
+
+    # Long messages (e.g. full tracebacks) are cut so the send is not rejected
+    if len(error_message) > _MAX_DESCRIPTION_LENGTH:
+        error_message = error_message[: _MAX_DESCRIPTION_LENGTH - 1] + "…"
     timestamp = payload.get("timestamp", datetime.now().timestamp())
 
     # Color based on severity
@@ -381,7 +433,7 @@ def create_bot_error_embed(payload: Dict[str, Any]) -> discord.Embed:
     return embed
 
 
-def create_heartbeat_alert_embed(data: Dict[str, Any]) -> discord.Embed:
+def create_heartbeat_alert_embed(data: dict[str, Any]) -> discord.Embed:
     """Create embed for heartbeat timeout alert.
 
     Args:
@@ -0,0 +1,142 @@
+"""Trie-based MQTT topic matching for message routing."""
+
+from dataclasses import dataclass, field
+from operator import itemgetter
+from typing import Any, Optional
+
+
+@dataclass(slots=True)
+class _TrieNode:
+    """One node of the pattern trie.
+
+    Runs of literal levels are compressed into a single edge: ``children``
+    maps the first level of each edge to ``(levels, child)``, where
+    ``levels`` is the tuple of literal levels the edge spans. Routes are
+    stored as (registration index, route) pairs so matches from different
+    branches can be returned in registration order.
+    """
+
+    children: dict[str, tuple[tuple[str, ...], "_TrieNode"]] = field(default_factory=dict)
+    plus: Optional["_TrieNode"] = None
+    # Patterns ending here ("a/b")
+    routes: list[tuple[int, Any]] = field(default_factory=list)
+    # Patterns ending in "#" just below here ("a/b/#")
+    hash_routes: list[tuple[int, Any]] = field(default_factory=list)
+
+
+class TopicMatcher:
+    """Matches MQTT topics against many wildcard patterns in one pass.
+
+    Patterns are split into levels once, when added, and stored in a radix
+    trie: chains of literal levels such as ``polyspike/trading/position``
+    share a single edge, so matching a topic compares them with one tuple
+    slice instead of one node per level. Matching descends the literal and
+    '+' branches, collecting '#' routes along the way, so the cost depends
+    on the topic depth and number of matches rather than on the number of
+    patterns.
+
+    Matching follows the MQTT specification: '+' matches exactly one level
+    and a trailing '#' matches the parent level and everything below it. A
+    '#' anywhere else (not a valid filter) is treated as a literal level.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty matcher."""
+        self._root = _TrieNode()
+        self._count = 0
+
+    def add(self, pattern: str, route: Any) -> None:
+        """Add a route for a topic pattern.
+
+        Args:
+            pattern: MQTT topic pattern with optional '+' and '#' wildcards.
+            route: Value returned by match() for topics matching the pattern.
+        """
+        parts = pattern.split("/")
+        multi = parts[-1] == "#"
+        if multi:
+            parts.pop()
+
+        node = self._root
+        i = 0
+        while i < len(parts):
+            part = parts[i]
+            if part == "+":
+                if node.plus is None:
+                    node.plus = _TrieNode()
+                node = node.plus
+                i += 1
+                continue
+
+            edge = node.children.get(part)
+            if edge is None:
+                # New edge spanning every literal level up to the next '+'
+                end = i + 1
+                while end < len(parts) and parts[end] != "+":
+                    end += 1
+                child = _TrieNode()
+                node.children[part] = (tuple(parts[i:end]), child)
+                node = child
+                i = end
+                continue
+
+            # Follow the existing edge as far as the pattern agrees with it
+            levels, child = edge
+            common = 1
+            while (common < len(levels) and i + common < len(parts)
+                   and parts[i + common] == levels[common]):
+                common += 1
+            if common < len(levels):
+                # Split the edge where the pattern diverges
+                middle = _TrieNode()
+                middle.children[levels[common]] = (levels[common:], child)
+                node.children[part] = (levels[:common], middle)
+                child = middle
+            node = child
+            i += common
+
+        entry = (self._count, route)
+        self._count += 1
+        if multi:
+            node.hash_routes.append(entry)
+        else:
+            node.routes.append(entry)
+
+    def match(self, topic: str) -> list[Any]:
+        """Find the routes whose patterns match a topic.
+
+        Args:
+            topic: MQTT topic received from the broker.
+
+        Returns:
+            Matching routes in the order they were added.
+        """
+        parts = tuple(topic.split("/"))
+        depth = len(parts)
+        found: list[tuple[int, Any]] = []
+        stack = [(self._root, 0)]
+
+        while stack:
+            node, i = stack.pop()
+            # "a/#" matches "a" itself as well as anything below it
+            found.extend(node.hash_routes)
+            if i == depth:
+                found.extend(node.routes)
+                continue
+
+            edge = node.children.get(parts[i])
+            if edge is not None:
+                levels, child = edge
+                end = i + len(levels)
+                if end == i + 1 or parts[i:end] == levels:
+                    stack.append((child, end))
+            if node.plus is not None:
+                stack.append((node.plus, i + 1))
+
+        if len(found) > 1:
+            found.sort(key=itemgetter(0))
+        return [route for _, route in found]
+
+    def __len__(self) -> int:
+        """Get the number of routes added."""
+        return self._count
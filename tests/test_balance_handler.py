@@ -7,8 +7,10 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import discord
 
+from src.handlers import balance_handler
 from src.handlers.balance_handler import (
     clear_balance_cache,
+    get_balance_version,
     get_last_balance_data,
     get_startup_time,
     handle_balance_update,
@@ -25,6 +27,11 @@ class TestBalanceHandler(unittest.IsolatedAsyncioTestCase):
         clear_balance_cache()
         set_startup_time(time.time())
 
+        # Send coalesced notifications on the next loop iteration
+        window_patcher = patch.object(balance_handler._coalescer, "window", 0.0)
+        window_patcher.start()
+        self.addCleanup(window_patcher.stop)
+
         # Create mock Discord bot
         self.mock_bot = Mock(spec=discord.Client)
         self.mock_bot.config = Mock()
@@ -118,24 +125,21 @@ class TestBalanceHandler(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(cached_data["equity"], 100.45)
         self.assertEqual(cached_data["total_pnl"], 0.20)
 
-    async def test_handle_balance_update_cache_is_copy(self):
-        """Test that cached data is a copy, not reference."""
+    async def test_handle_balance_update_cache_is_read_only(self):
+        """Test that cached data is a read-only view of the payload."""
         # Send balance update
         handle_balance_update(self.balance_payload, self.mock_bot)
         await asyncio.sleep(0.1)
 
-        # Get cached data
+        # Cached data cannot be modified by readers
         cached_data = get_last_balance_data()
+        with self.assertRaises(TypeError):
+            cached_data["balance"] = 999.99
 
-        # Modify cached data
-        cached_data["balance"] = 999.99
-
-        # Get cached data again
-        cached_data2 = get_last_balance_data()
-
-        # Verify original cache was not modified
-        self.assertEqual(cached_data2["balance"], 100.20)
-        self.assertNotEqual(cached_data2["balance"], 999.99)
+        # Verify cache was not modified and is shared between readers
+        self.assertEqual(cached_data["balance"], 100.20)
+        self.assertEqual(dict(cached_data), self.balance_payload)
+        self.assertIs(get_last_balance_data(), cached_data)
 
     async def test_handle_balance_update_channel_not_found(self):
         """Test balance update handler when channel is not found."""
@@ -231,15 +235,13 @@ class TestBalanceHandler(unittest.IsolatedAsyncioTestCase):
         error_msg = self.mock_bot.logger.error.call_args[0][0]
         self.assertIn("Failed to send", error_msg)
 
+    @unittest.skipUnless(__debug__, "payload validation is skipped under python -O")
     async def test_handle_balance_update_with_missing_fields(self):
         """Test balance update handler with missing important fields."""
         # Payload with missing fields
         minimal_payload = {"timestamp": time.time()}
 
-        with patch("src.handlers.balance_handler.get_logger") as mock_logger:
-            logger_instance = Mock()
-            mock_logger.return_value = logger_instance
-
+        with patch("src.handlers.balance_handler.logger") as logger_instance:
             handle_balance_update(minimal_payload, self.mock_bot)
             await asyncio.sleep(0.1)
 
@@ -255,10 +257,7 @@ class TestBalanceHandler(unittest.IsolatedAsyncioTestCase):
         """Test balance update handler with unexpected exception."""
         self.mock_bot.safe_send_to_channel = AsyncMock(side_effect=Exception("test error"))
 
-        with patch("src.handlers.balance_handler.get_logger") as mock_logger:
-            logger_instance = Mock()
-            mock_logger.return_value = logger_instance
-
+        with patch("src.handlers.balance_handler.logger") as logger_instance:
             handle_balance_update(self.balance_payload, self.mock_bot)
             await asyncio.sleep(0.1)
 
@@ -267,6 +266,32 @@ class TestBalanceHandler(unittest.IsolatedAsyncioTestCase):
             error_msg = logger_instance.error.call_args[0][0]
             self.assertIn("Unexpected error", error_msg)
 
+    async def test_burst_of_updates_coalesced_into_one_send(self):
+        """Test that updates within the window send one notification."""
+        balance_handler._coalescer.window = 0.05
+
+        for balance in (100.0, 101.0, 102.0):
+            payload = dict(self.balance_payload, balance=balance)
+            handle_balance_update(payload, self.mock_bot)
+
+        await asyncio.sleep(0.2)
+
+        # Only one send, reflecting the latest balance
+        self.mock_bot.safe_send_to_channel.assert_called_once()
+        embed = self.mock_bot.safe_send_to_channel.call_args[0][0]
+        self.assertIn("102.00", str(embed.to_dict()))
+
+    async def test_cancel_active_tasks_sends_pending_update(self):
+        """Test shutdown sends the update still waiting in the coalescing window."""
+        balance_handler._coalescer.window = 10.0
+        handle_balance_update(self.balance_payload, self.mock_bot)
+
+        await asyncio.wait_for(balance_handler.cancel_active_tasks(), timeout=1.0)
+
+        self.mock_bot.safe_send_to_channel.assert_called_once()
+        self.assertIsNone(balance_handler._coalescer.pending_payload)
+        self.assertEqual(balance_handler._active_tasks, set())
+
     async def test_handler_is_non_blocking(self):
         """Test that handler returns immediately (non-blocking)."""
         # Create slow mock
@@ -291,6 +316,10 @@ class TestBalanceHandlerUtilities(unittest.IsolatedAsyncioTestCase):
         """Set up test fixtures."""
         clear_balance_cache()
 
+        window_patcher = patch.object(balance_handler._coalescer, "window", 0.0)
+        window_patcher.start()
+        self.addCleanup(window_patcher.stop)
+
         self.mock_bot = Mock(spec=discord.Client)
         self.mock_bot.config = Mock()
         self.mock_bot.config.discord_channel_id = 123456789
@@ -306,10 +335,7 @@ class TestBalanceHandlerUtilities(unittest.IsolatedAsyncioTestCase):
         """Test setting the startup time."""
         test_time = 1735833600.0
 
-        with patch("src.handlers.balance_handler.get_logger") as mock_logger:
-            logger_instance = Mock()
-            mock_logger.return_value = logger_instance
-
+        with patch("src.handlers.balance_handler.logger") as logger_instance:
             set_startup_time(test_time)
 
             # Verify startup time was set
@@ -343,10 +369,7 @@ class TestBalanceHandlerUtilities(unittest.IsolatedAsyncioTestCase):
         self.assertIsNotNone(get_last_balance_data())
 
         # Clear cache
-        with patch("src.handlers.balance_handler.get_logger") as mock_logger:
-            logger_instance = Mock()
-            mock_logger.return_value = logger_instance
-
+        with patch("src.handlers.balance_handler.logger") as logger_instance:
             clear_balance_cache()
 
             # Verify cache is empty
@@ -394,6 +417,20 @@ class TestBalanceHandlerUtilities(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(cached["balance"], 105.50)
         self.assertEqual(cached["total_pnl"], 5.50)
 
+    async def test_balance_version_increments_on_update(self):
+        """Test that each cached balance update bumps the version."""
+        payload = {"timestamp": time.time(), "balance": 100.0}
+        handle_balance_update(payload, self.mock_bot)
+        first_version = get_balance_version()
+
+        handle_balance_update(payload, self.mock_bot)
+        await asyncio.sleep(0.1)
+
+        self.assertEqual(get_balance_version(), first_version + 1)
+
+        clear_balance_cache()
+        self.assertEqual(get_balance_version(), 0)
+
 
 class TestBalanceHandlerLogging(unittest.IsolatedAsyncioTestCase):
     """Test cases for logging in balance handler."""
@@ -401,6 +438,10 @@ class TestBalanceHandlerLogging(unittest.IsolatedAsyncioTestCase):
     def setUp(self):
         """Set up test fixtures."""
         clear_balance_cache()
+
+        window_patcher = patch.object(balance_handler._coalescer, "window", 0.0)
+        window_patcher.start()
+        self.addCleanup(window_patcher.stop)
         set_startup_time(time.time())
 
         self.mock_bot = Mock(spec=discord.Client)
@@ -416,10 +457,7 @@ class TestBalanceHandlerLogging(unittest.IsolatedAsyncioTestCase):
 
     async def test_handle_balance_update_logs_event(self):
         """Test that balance update handler logs the event."""
-        with patch("src.handlers.balance_handler.get_logger") as mock_logger:
-            logger_instance = Mock()
-            mock_logger.return_value = logger_instance
-
+        with patch("src.handlers.balance_handler.logger") as logger_instance:
             handle_balance_update(self.balance_payload, self.mock_bot)
             await asyncio.sleep(0.01)
 
@@ -439,10 +477,7 @@ class TestBalanceHandlerLogging(unittest.IsolatedAsyncioTestCase):
         old_payload = self.balance_payload.copy()
         old_payload["timestamp"] = current_time - 600
 
-        with patch("src.handlers.balance_handler.get_logger") as mock_logger:
-            logger_instance = Mock()
-            mock_logger.return_value = logger_instance
-
+        with patch("src.handlers.balance_handler.logger") as logger_instance:
             handle_balance_update(old_payload, self.mock_bot)
             await asyncio.sleep(0.01)
 
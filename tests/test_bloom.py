@@ -0,0 +1,79 @@
+"""Unit tests for the rotating Bloom filter."""
+
+import unittest
+
+from src.utils.bloom import RotatingBloomFilter
+
+
+class TestRotatingBloomFilter(unittest.TestCase):
+    """Test cases for RotatingBloomFilter class."""
+
+    def test_added_keys_are_found(self):
+        """Test that every added key is reported as present."""
+        bloom = RotatingBloomFilter(capacity=1000, error_rate=0.01)
+        keys = [f"trade-{i}" for i in range(1000)]
+        for key in keys:
+            bloom.add(key)
+
+        self.assertTrue(all(key in bloom for key in keys))
+        self.assertEqual(len(bloom), 1000)
+
+    def test_false_positive_rate_near_target(self):
+        """Test that unseen keys are rarely reported as present."""
+        bloom = RotatingBloomFilter(capacity=1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"trade-{i}")
+
+        false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+
+        self.assertLess(false_positives / 10000, 0.03)
+
+    def test_false_positive_rate_with_both_generations_full(self):
+        """Test the lookup rate stays near the target when both generations hold keys."""
+        bloom = RotatingBloomFilter(capacity=1000, error_rate=0.01)
+        for i in range(2000):
+            bloom.add(f"trade-{i}")
+
+        false_positives = sum(f"other-{i}" in bloom for i in range(20000))
+
+        self.assertLess(false_positives / 20000, 0.015)
+
+    def test_integer_keys(self):
+        """Test integer keys (e.g. numeric trade IDs from JSON) are accepted."""
+        bloom = RotatingBloomFilter(capacity=10)
+        bloom.add(12345)
+
+        self.assertIn(12345, bloom)
+        self.assertNotIn(54321, bloom)
+
+    def test_rotation_forgets_oldest_generation(self):
+        """Test that keys older than two generations are evicted."""
+        bloom = RotatingBloomFilter(capacity=10, error_rate=0.001)
+        for i in range(10):
+            bloom.add(f"old-{i}")
+        for i in range(20):
+            bloom.add(f"new-{i}")
+
+        self.assertTrue(all(f"new-{i}" in bloom for i in range(10, 20)))
+        self.assertLessEqual(sum(f"old-{i}" in bloom for i in range(10)), 1)
+        self.assertEqual(len(bloom), 20)
+
+    def test_clear(self):
+        """Test clearing the filter."""
+        bloom = RotatingBloomFilter(capacity=10)
+        bloom.add("trade-1")
+        bloom.clear()
+
+        self.assertNotIn("trade-1", bloom)
+        self.assertEqual(len(bloom), 0)
+
+    def test_invalid_arguments(self):
+        """Test invalid capacity or error rate raise ValueError."""
+        with self.assertRaises(ValueError):
+            RotatingBloomFilter(capacity=0)
+        with self.assertRaises(ValueError):
+            RotatingBloomFilter(error_rate=1.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,184 @@
+"""Unit tests for notification embed batching."""
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock
+
+import discord
+
+from src.utils.embed_batcher import EmbedBatcher, SendResult
+
+
+class TestEmbedBatcher(unittest.IsolatedAsyncioTestCase):
+    """Test cases for EmbedBatcher class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.send_batch = AsyncMock(return_value=SendResult.SENT)
+        self.embeds = [discord.Embed(title=f"Embed {i}") for i in range(12)]
+
+    async def asyncTearDown(self):
+        """Stop the flusher task."""
+        await self.batcher.close()
+
+    async def test_embeds_submitted_together_share_one_send(self):
+        """Test embeds submitted within the wait window are sent as one batch."""
+        self.batcher = EmbedBatcher(self.send_batch, wait=0.05)
+
+        results = await asyncio.gather(
+            *(self.batcher.submit(embed) for embed in self.embeds[:3])
+        )
+
+        self.assertEqual(results, [True, True, True])
+        self.send_batch.assert_awaited_once_with(self.embeds[:3])
+
+    async def test_batch_capped_at_max_size(self):
+        """Test more than max_size embeds are split across sends."""
+        self.batcher = EmbedBatcher(self.send_batch, max_size=10, wait=0.05)
+
+        await asyncio.gather(*(self.batcher.submit(embed) for embed in self.embeds))
+
+        self.assertEqual(self.send_batch.await_count, 2)
+        self.assertEqual(self.send_batch.await_args_list[0].args[0], self.embeds[:10])
+        self.assertEqual(self.send_batch.await_args_list[1].args[0], self.embeds[10:])
+
+    async def test_batch_split_by_total_characters(self):
+        """Test a large embed is sent alone once the 6000-char total would be exceeded."""
+        self.batcher = EmbedBatcher(self.send_batch, wait=0.05)
+        large = discord.Embed(title="Large", description="x" * 5990)
+        embeds = [self.embeds[0], self.embeds[1], large, self.embeds[2], self.embeds[3]]
+
+        results = await asyncio.gather(*(self.batcher.submit(embed) for embed in embeds))
+
+        self.assertEqual(results, [True] * 5)
+        self.assertEqual(
+            [call.args[0] for call in self.send_batch.await_args_list],
+            [self.embeds[:2], [large], self.embeds[2:4]],
+        )
+
+    async def test_large_embed_split_from_full_batch(self):
+        """Test an embed that would overflow a batch is carried into the next one."""
+        self.batcher = EmbedBatcher(self.send_batch, wait=0.05)
+        big = [discord.Embed(title=f"Big {i}", description="x" * 2500) for i in range(3)]
+
+        await asyncio.gather(*(self.batcher.submit(embed) for embed in big + self.embeds[:2]))
+
+        self.assertEqual(self.send_batch.await_count, 2)
+        self.assertEqual(self.send_batch.await_args_list[0].args[0], big[:2])
+        self.assertEqual(self.send_batch.await_args_list[1].args[0], [big[2], *self.embeds[:2]])
+
+    async def test_urgent_embed_flushes_immediately(self):
+        """Test an urgent embed does not wait for the batch window."""
+        self.batcher = EmbedBatcher(self.send_batch, wait=10.0)
+
+        pending = asyncio.create_task(self.batcher.submit(self.embeds[0]))
+        await asyncio.sleep(0)
+        result = await asyncio.wait_for(
+            self.batcher.submit(self.embeds[1], urgent=True), timeout=1.0
+        )
+
+        self.assertTrue(result)
+        self.assertTrue(await pending)
+        self.send_batch.assert_awaited_once_with(self.embeds[:2])
+
+    async def test_send_failure_reported_to_all_submitters(self):
+        """Test a failed send resolves every embed in the batch to False."""
+        self.send_batch.side_effect = Exception("HTTP error")
+        self.batcher = EmbedBatcher(self.send_batch, wait=0.05)
+
+        results = await asyncio.gather(
+            *(self.batcher.submit(embed) for embed in self.embeds[:2])
+        )
+
+        self.assertEqual(results, [False, False])
+
+    async def test_rejected_batch_retried_one_by_one(self):
+        """Test a batch Discord rejects is resent per embed so only the bad embed fails."""
+        bad = self.embeds[1]
+
+        def send(embeds):
+            if len(embeds) > 1 or embeds[0] is bad:
+                return SendResult.REJECTED
+            return SendResult.SENT
+
+        self.send_batch.side_effect = send
+        self.batcher = EmbedBatcher(self.send_batch, wait=0.05)
+
+        results = await asyncio.gather(
+            *(self.batcher.submit(embed) for embed in self.embeds[:3])
+        )
+
+        self.assertEqual(results, [True, False, True])
+        self.assertEqual(self.send_batch.await_count, 4)
+
+    async def test_rejected_batch_retries_paced_by_min_interval(self):
+        """Test per-embed retries keep min_interval between sends."""
+        loop = asyncio.get_running_loop()
+        send_times = []
+
+        def send(embeds):
+            send_times.append(loop.time())
+            return SendResult.REJECTED if len(embeds) > 1 else SendResult.SENT
+
+        self.send_batch.side_effect = send
+        self.batcher = EmbedBatcher(self.send_batch, wait=0.01, min_interval=0.05)
+
+        await asyncio.gather(*(self.batcher.submit(embed) for embed in self.embeds[:3]))
+
+        gaps = [later - earlier for earlier, later in zip(send_times, send_times[1:])]
+        self.assertEqual(len(gaps), 3)
+        self.assertTrue(all(gap >= 0.04 for gap in gaps), gaps)
+
+    async def test_failed_batch_not_split(self):
+        """Test failures other than a rejected payload (e.g. 429) are not retried."""
+        self.send_batch.return_value = SendResult.FAILED
+        self.batcher = EmbedBatcher(self.send_batch, wait=0.05)
+
+        results = await asyncio.gather(
+            *(self.batcher.submit(embed) for embed in self.embeds[:3])
+        )
+
+        self.assertEqual(results, [False, False, False])
+        self.send_batch.assert_awaited_once()
+
+    async def test_sends_paced_by_min_interval(self):
+        """Test embeds arriving right after a send wait for min_interval."""
+        self.batcher = EmbedBatcher(self.send_batch, wait=0.01, min_interval=0.2)
+        loop = asyncio.get_running_loop()
+
+        await self.batcher.submit(self.embeds[0])
+        first_done = loop.time()
+        await asyncio.gather(
+            self.batcher.submit(self.embeds[1]),
+            self.batcher.submit(self.embeds[2]),
+        )
+
+        self.assertGreaterEqual(loop.time() - first_done, 0.15)
+        self.assertEqual(self.send_batch.await_count, 2)
+        self.assertEqual(self.send_batch.await_args_list[1].args[0], self.embeds[1:3])
+
+    async def test_full_queue_drops_embed(self):
+        """Test submissions beyond max_pending are dropped."""
+        self.batcher = EmbedBatcher(self.send_batch, wait=0.05, max_pending=2)
+
+        results = await asyncio.gather(
+            *(self.batcher.submit(embed) for embed in self.embeds[:3])
+        )
+
+        self.assertEqual(results, [True, True, False])
+        self.send_batch.assert_awaited_once_with(self.embeds[:2])
+
+    async def test_close_flushes_pending_embeds(self):
+        """Test close() sends embeds still waiting in the batch window."""
+        self.batcher = EmbedBatcher(self.send_batch, wait=10.0)
+
+        pending = asyncio.create_task(self.batcher.submit(self.embeds[0]))
+        await asyncio.sleep(0)
+        await asyncio.wait_for(self.batcher.close(), timeout=1.0)
+
+        self.assertTrue(await pending)
+        self.send_batch.assert_awaited_once_with(self.embeds[:1])
+
+
+if __name__ == "__main__":
+    unittest.main()
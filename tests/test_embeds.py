@@ -14,6 +14,7 @@ from src.utils.embeds import (
     create_heartbeat_alert_embed,
     create_position_opened_embed,
     create_trade_completed_embed,
+    create_trades_digest_embed,
 )
 
 
@@ -137,6 +138,25 @@ class TestTradeCompletedEmbed(unittest.TestCase):
         self.assertIn("1h 1m 5s", embed.fields[4].value)
 
 
+class TestTradesDigestEmbed(unittest.TestCase):
+    """Test cases for create_trades_digest_embed()."""
+
+    def test_trades_digest_lists_each_trade(self):
+        """Test digest has one field per trade and sums the P&L."""
+        payloads = [
+            {"timestamp": 1735833745.0, "market_name": "Market A", "pnl": 0.50, "pnl_pct": 0.10},
+            {"timestamp": 1735833746.0, "market_name": "Market B", "pnl": -1.00, "pnl_pct": -0.20},
+        ]
+
+        embed = create_trades_digest_embed(payloads)
+
+        self.assertEqual(embed.title, "💰 2 Trades Completed")
+        self.assertEqual(embed.color.value, 0xFF0000)  # Red for combined loss
+        self.assertIn("-0.50", embed.description)
+        self.assertEqual([field.name for field in embed.fields], ["Market A", "Market B"])
+        self.assertEqual(embed.fields[0].value, "$+0.50 (+10.00%)")
+
+
 class TestBalanceUpdateEmbed(unittest.TestCase):
     """Test cases for create_balance_update_embed()."""
 
@@ -308,6 +328,15 @@ class TestBotErrorEmbed(unittest.TestCase):
         self.assertIn("UnknownError", embed.fields[0].value)
         self.assertIn("No error message provided", embed.description)
 
+    def test_bot_error_long_message_truncated(self):
+        """Test error messages longer than Discord's limit are truncated."""
+        payload = {"error_message": "x" * 10000}
+
+        embed = create_bot_error_embed(payload)
+
+        self.assertEqual(len(embed.description), 4096)
+        self.assertTrue(embed.description.endswith("…"))
+
 
 class TestHeartbeatAlertEmbed(unittest.TestCase):
     """Test cases for create_heartbeat_alert_embed()."""
@@ -55,10 +55,7 @@ class TestHeartbeatMonitor(unittest.IsolatedAsyncioTestCase):
 
     def test_update_heartbeat_clears_alert_flag(self):
         """Test that receiving heartbeat clears alert flag."""
-        with patch("src.handlers.heartbeat_monitor.get_logger") as mock_logger:
-            logger_instance = Mock()
-            mock_logger.return_value = logger_instance
-
+        with patch("src.handlers.heartbeat_monitor.logger") as logger_instance:
             monitor = HeartbeatMonitor(self.mock_bot)
 
             # Simulate alert was sent
@@ -126,6 +123,33 @@ class TestHeartbeatMonitor(unittest.IsolatedAsyncioTestCase):
         self.assertIsNotNone(time_since)
         self.assertLess(time_since, 1.0)
 
+    def test_snapshot_no_heartbeat(self):
+        """Test snapshot when no heartbeat received."""
+        monitor = HeartbeatMonitor(self.mock_bot)
+
+        self.assertEqual(monitor.snapshot(), (None, False, None))
+
+    def test_snapshot_recent_heartbeat(self):
+        """Test snapshot with recent heartbeat."""
+        monitor = HeartbeatMonitor(self.mock_bot, timeout_seconds=90)
+        monitor.update(self.heartbeat_payload)
+
+        last_time, is_online, time_since = monitor.snapshot()
+
+        self.assertEqual(last_time, monitor.get_last_heartbeat_time())
+        self.assertTrue(is_online)
+        self.assertLess(time_since, 1.0)
+
+    def test_snapshot_old_heartbeat(self):
+        """Test snapshot with heartbeat older than the timeout."""
+        monitor = HeartbeatMonitor(self.mock_bot, timeout_seconds=90)
+        monitor.update({"timestamp": time.time() - 100})
+
+        _, is_online, time_since = monitor.snapshot()
+
+        self.assertFalse(is_online)
+        self.assertGreaterEqual(time_since, 100)
+
     async def test_start_monitoring(self):
         """Test starting heartbeat monitoring."""
         monitor = HeartbeatMonitor(self.mock_bot)
@@ -133,9 +157,9 @@ class TestHeartbeatMonitor(unittest.IsolatedAsyncioTestCase):
         # Start monitoring
         await monitor.start_monitoring()
 
-        # Verify monitoring task was created
-        self.assertIsNotNone(monitor._monitoring_task)
-        self.assertFalse(monitor._stopping)
+        # Verify monitoring is bound to the loop; no timer before first heartbeat
+        self.assertIsNotNone(monitor._loop)
+        self.assertIsNone(monitor._timeout_handle)
 
         # Clean up
         await monitor.stop_monitoring()
@@ -144,22 +168,22 @@ class TestHeartbeatMonitor(unittest.IsolatedAsyncioTestCase):
         """Test stopping heartbeat monitoring."""
         monitor = HeartbeatMonitor(self.mock_bot)
 
-        # Start monitoring
+        # Start monitoring and arm the timeout timer
         await monitor.start_monitoring()
+        monitor.update(self.heartbeat_payload)
+        handle = monitor._timeout_handle
 
         # Stop monitoring
         await monitor.stop_monitoring()
 
-        # Verify monitoring stopped
-        self.assertTrue(monitor._stopping)
-        self.assertIsNone(monitor._monitoring_task)
+        # Verify monitoring stopped and timer cancelled
+        self.assertIsNone(monitor._loop)
+        self.assertIsNone(monitor._timeout_handle)
+        self.assertTrue(handle.cancelled())
 
     async def test_start_monitoring_already_running(self):
         """Test starting monitoring when already running."""
-        with patch("src.handlers.heartbeat_monitor.get_logger") as mock_logger:
-            logger_instance = Mock()
-            mock_logger.return_value = logger_instance
-
+        with patch("src.handlers.heartbeat_monitor.logger") as logger_instance:
             monitor = HeartbeatMonitor(self.mock_bot)
 
             # Start monitoring
@@ -194,6 +218,48 @@ class TestHeartbeatMonitor(unittest.IsolatedAsyncioTestCase):
         self.assertIsInstance(embed, discord.Embed)
         self.assertIn("Heartbeat Alert", embed.title)
 
+    async def test_heartbeat_update_rearms_timer(self):
+        """Test that each heartbeat replaces the pending timeout timer."""
+        monitor = HeartbeatMonitor(self.mock_bot, timeout_seconds=90)
+        await monitor.start_monitoring()
+
+        monitor.update(self.heartbeat_payload)
+        first_handle = monitor._timeout_handle
+        monitor.update(self.heartbeat_payload)
+
+        self.assertTrue(first_handle.cancelled())
+        self.assertFalse(monitor._timeout_handle.cancelled())
+
+        await monitor.stop_monitoring()
+
+    async def test_timeout_sends_single_alert(self):
+        """Test that a missed heartbeat fires one alert without polling."""
+        monitor = HeartbeatMonitor(self.mock_bot, timeout_seconds=0.05)
+        self.mock_bot.safe_send_to_channel = AsyncMock(return_value=True)
+        await monitor.start_monitoring()
+
+        monitor.update({"timestamp": time.time()})
+        await asyncio.sleep(0.2)
+
+        self.mock_bot.safe_send_to_channel.assert_awaited_once()
+        self.assertTrue(monitor._alert_sent)
+        self.assertIsNone(monitor._timeout_handle)
+
+        await monitor.stop_monitoring()
+
+    async def test_is_bot_online_reads_timer_while_monitoring(self):
+        """Test is_bot_online uses the pending timer instead of the clock."""
+        monitor = HeartbeatMonitor(self.mock_bot, timeout_seconds=90)
+        await monitor.start_monitoring()
+        monitor.update(self.heartbeat_payload)
+
+        with patch("src.handlers.heartbeat_monitor.time") as mock_time:
+            self.assertTrue(monitor.is_bot_online())
+            mock_time.monotonic.assert_not_called()
+            mock_time.time.assert_not_called()
+
+        await monitor.stop_monitoring()
+
     def test_heartbeat_timeout_detection(self):
         """Test that timeout is correctly detected."""
         monitor = HeartbeatMonitor(self.mock_bot, timeout_seconds=90)
@@ -228,10 +294,7 @@ class TestHeartbeatMonitor(unittest.IsolatedAsyncioTestCase):
 
     async def test_alert_channel_not_found(self):
         """Test alert when channel is not found."""
-        with patch("src.handlers.heartbeat_monitor.get_logger") as mock_logger:
-            logger_instance = Mock()
-            mock_logger.return_value = logger_instance
-
+        with patch("src.handlers.heartbeat_monitor.logger") as logger_instance:
             monitor = HeartbeatMonitor(self.mock_bot, timeout_seconds=1)
             self.mock_bot.safe_send_to_channel = AsyncMock(return_value=False)
 
@@ -1,16 +1,19 @@
 """Unit tests for MQTT client message routing."""
 
+import asyncio
 import json
+import threading
 import time
 import unittest
 from unittest.mock import MagicMock, Mock, patch
 
 from src.config import Config
 from src.mqtt_client import MQTTClient
+from src.utils.topic_matcher import TopicMatcher
 
 
 class TestMQTTTopicMatching(unittest.TestCase):
-    """Test cases for _match_topic() helper method."""
+    """Test cases for topic pattern matching in message routing."""
 
     def setUp(self):
         """Set up test configuration and MQTT client."""
@@ -27,60 +30,68 @@ class TestMQTTTopicMatching(unittest.TestCase):
         )
         self.mqtt_client = MQTTClient(self.config)
 
+    def _routes(self, topic, pattern):
+        """Check whether a message on topic reaches a handler for pattern."""
+        handler = Mock()
+        self.mqtt_client.register_handler(pattern, handler)
+        payload = json.dumps({"timestamp": time.time()}).encode('utf-8')
+        self.mqtt_client._process_message(topic, payload, False)
+        return handler.called
+
     def test_exact_topic_match(self):
         """Test exact topic match."""
         topic = "polyspike/status/bot/started"
         pattern = "polyspike/status/bot/started"
-        result = self.mqtt_client._match_topic(topic, pattern)
+        result = self._routes(topic, pattern)
         self.assertTrue(result)
 
     def test_single_wildcard_match(self):
         """Test single wildcard + match."""
         topic = "polyspike/status/bot"
         pattern = "polyspike/status/+"
-        result = self.mqtt_client._match_topic(topic, pattern)
+        result = self._routes(topic, pattern)
         self.assertTrue(result)
 
     def test_multi_wildcard_match(self):
         """Test multi wildcard # match."""
         topic = "polyspike/status/bot/started"
         pattern = "polyspike/#"
-        result = self.mqtt_client._match_topic(topic, pattern)
+        result = self._routes(topic, pattern)
         self.assertTrue(result)
 
     def test_multiple_single_wildcards_match(self):
         """Test multiple single wildcards match."""
         topic = "polyspike/status/bot/started"
         pattern = "polyspike/+/+/started"
-        result = self.mqtt_client._match_topic(topic, pattern)
+        result = self._routes(topic, pattern)
         self.assertTrue(result)
 
     def test_non_matching_pattern(self):
         """Test non-matching patterns."""
         topic = "polyspike/status/bot/started"
         pattern = "polyspike/trading/+"
-        result = self.mqtt_client._match_topic(topic, pattern)
+        result = self._routes(topic, pattern)
         self.assertFalse(result)
 
     def test_complex_pattern_match(self):
         """Test complex patterns."""
         topic = "polyspike/trading/position/opened"
         pattern = "polyspike/trading/+/+"
-        result = self.mqtt_client._match_topic(topic, pattern)
+        result = self._routes(topic, pattern)
         self.assertTrue(result)
 
     def test_multi_wildcard_requires_minimum_parts(self):
         """Test # wildcard requires minimum topic parts."""
         topic = "polyspike/status"
         pattern = "polyspike/status/bot/#"
-        result = self.mqtt_client._match_topic(topic, pattern)
+        result = self._routes(topic, pattern)
         self.assertFalse(result)
 
     def test_single_wildcard_wrong_length(self):
         """Test + wildcard requires exact same number of parts."""
         topic = "polyspike/status/bot"
         pattern = "polyspike/status/+/+/extra"
-        result = self.mqtt_client._match_topic(topic, pattern)
+        result = self._routes(topic, pattern)
         self.assertFalse(result)
 
 
@@ -115,6 +126,16 @@ class TestHandlerRegistration(unittest.TestCase):
         self.mqtt_client.register_handler(pattern, self.mock_handler)
         self.assertIn((pattern, self.mock_handler), self.mqtt_client.message_handlers)
 
+    def test_register_handlers_bulk(self):
+        """Test registering several handlers at once."""
+        handler2 = Mock()
+        self.mqtt_client.register_handlers_bulk({
+            "polyspike/a": self.mock_handler,
+            "polyspike/b": handler2,
+        })
+        self.assertEqual(self.mqtt_client.list_handlers(), ["polyspike/a", "polyspike/b"])
+        self.assertIn(("polyspike/b", handler2), self.mqtt_client.message_handlers)
+
     def test_list_handlers(self):
         """Test list_handlers returns registered patterns."""
         patterns = ["polyspike/status/+", "polyspike/trading/#"]
@@ -143,6 +164,62 @@ class TestHandlerRegistration(unittest.TestCase):
         self.assertEqual(len(self.mqtt_client.message_handlers), 1)
         self.assertIn((pattern, handler2), self.mqtt_client.message_handlers)
 
+    def test_registration_replaces_handler_snapshot(self):
+        """Test register/unregister swap in a new tuple instead of mutating it."""
+        self.mqtt_client.register_handler("polyspike/a", self.mock_handler)
+        snapshot = self.mqtt_client.message_handlers
+        self.mqtt_client.register_handler("polyspike/b", self.mock_handler)
+        self.mqtt_client.unregister_handler("polyspike/a", self.mock_handler)
+
+        self.assertEqual(snapshot, (("polyspike/a", self.mock_handler),))
+        self.assertEqual(self.mqtt_client.message_handlers, (("polyspike/b", self.mock_handler),))
+
+    def test_on_connect_subscribes_registered_patterns(self):
+        """Test on_connect subscribes to registered patterns, skipping covered ones."""
+        self.mqtt_client.register_handlers_bulk({
+            "polyspike/balance/update": self.mock_handler,
+            "polyspike/trading/#": self.mock_handler,
+            "polyspike/trading/trade/completed": self.mock_handler,
+        })
+        client = Mock()
+        self.mqtt_client.on_connect(client, None, {}, 0)
+        client.subscribe.assert_called_once_with(
+            [("polyspike/balance/update", 0), ("polyspike/trading/#", 0)]
+        )
+
+    def test_overlapping_plus_and_hash_patterns_subscribe_broadest(self):
+        """Test '+' never counts as covering '#', so overlapping patterns keep one filter."""
+        self.mqtt_client.register_handlers_bulk({
+            "polyspike/a/+": self.mock_handler,
+            "polyspike/a/#": self.mock_handler,
+            "polyspike/b/+": self.mock_handler,
+            "polyspike/b/x": self.mock_handler,
+        })
+        client = Mock()
+        self.mqtt_client.on_connect(client, None, {}, 0)
+        client.subscribe.assert_called_once_with(
+            [("polyspike/a/#", 0), ("polyspike/b/+", 0)]
+        )
+
+    def test_on_connect_without_handlers_subscribes_prefix(self):
+        """Test the whole prefix is subscribed when no handler is registered."""
+        client = Mock()
+        self.mqtt_client.on_connect(client, None, {}, 0)
+        client.subscribe.assert_called_once_with([("polyspike/#", 0)])
+
+    def test_registration_while_connected_updates_subscriptions(self):
+        """Test handler changes while connected subscribe and unsubscribe the difference."""
+        self.mqtt_client.register_handler("polyspike/balance/update", self.mock_handler)
+        self.mqtt_client.client = Mock()
+        self.mqtt_client.on_connect(self.mqtt_client.client, None, {}, 0)
+        self.mqtt_client.client.reset_mock()
+
+        self.mqtt_client.register_handler("polyspike/status/+", self.mock_handler)
+        self.mqtt_client.client.subscribe.assert_called_once_with([("polyspike/status/+", 0)])
+
+        self.mqtt_client.unregister_handler("polyspike/balance/update", self.mock_handler)
+        self.mqtt_client.client.unsubscribe.assert_called_once_with(["polyspike/balance/update"])
+
 
 class TestMessageRouting(unittest.TestCase):
     """Test cases for message routing functionality."""
@@ -188,6 +265,63 @@ class TestMessageRouting(unittest.TestCase):
         handler1.assert_called_once()
         handler2.assert_called_once()
 
+    def test_literal_routes_skip_pattern_matching(self):
+        """Test literal-only registrations are routed without pattern matching."""
+        handler = Mock()
+        other = Mock()
+        self.mqtt_client.register_handlers_bulk({
+            "polyspike/balance/update": handler,
+            "polyspike/stats/session": other,
+        })
+        msg = self.create_mock_message("polyspike/balance/update", {"timestamp": time.time()})
+        with patch("src.mqtt_client.TopicMatcher.match") as mock_match:
+            self.mqtt_client.on_message(None, None, msg)
+        mock_match.assert_not_called()
+        handler.assert_called_once()
+        other.assert_not_called()
+
+    def test_mixed_routes_dispatch_in_registration_order(self):
+        """Test literal and wildcard matches run in the order they were registered."""
+        calls = []
+        self.mqtt_client.register_handler("polyspike/#", lambda data: calls.append("all"))
+        self.mqtt_client.register_handler("polyspike/balance/update", lambda data: calls.append("literal"))
+        self.mqtt_client.register_handler("polyspike/+/update", lambda data: calls.append("plus"))
+        msg = self.create_mock_message("polyspike/balance/update", {"timestamp": time.time()})
+        self.mqtt_client.on_message(None, None, msg)
+        self.assertEqual(calls, ["all", "literal", "plus"])
+
+    def test_wildcard_routes_use_topic_matcher(self):
+        """Test wildcard registrations are routed through the topic matcher."""
+        handler1 = Mock()
+        handler2 = Mock()
+        self.mqtt_client.register_handler("polyspike/#", handler1)
+        self.mqtt_client.register_handler("polyspike/status/+", handler2)
+        msg = self.create_mock_message("polyspike/trading/position/opened", {"timestamp": time.time()})
+        with patch("src.mqtt_client.TopicMatcher.match", autospec=True,
+                   side_effect=TopicMatcher.match) as mock_match:
+            self.mqtt_client.on_message(None, None, msg)
+        mock_match.assert_called_once()
+        handler1.assert_called_once()
+        handler2.assert_not_called()
+
+    def test_routed_messages_counted_for_summary(self):
+        """Test messages are counted per pattern and summarized in one log line."""
+        self.mqtt_client.register_handler("polyspike/balance/update", Mock())
+        self.mqtt_client.logger = Mock()
+        self.mqtt_client.logger.isEnabledFor.return_value = False
+        msg = self.create_mock_message("polyspike/balance/update", {"timestamp": time.time()})
+        for _ in range(3):
+            self.mqtt_client.on_message(None, None, msg)
+
+        self.mqtt_client.logger.info.assert_not_called()
+        self.mqtt_client._log_message_stats()
+
+        summary = self.mqtt_client.logger.info.call_args[0][0]
+        self.assertIn("Received 3 MQTT messages", summary)
+        self.assertIn("polyspike/balance/update: 3", summary)
+        self.assertEqual(self.mqtt_client._message_count, 0)
+        self.assertEqual(self.mqtt_client._route_counts, {})
+
     def test_no_matching_handler(self):
         """Test message with no matching handler."""
         handler = Mock()
@@ -205,6 +339,27 @@ class TestMessageRouting(unittest.TestCase):
         self.mqtt_client.on_message(None, None, msg)
         handler.assert_not_called()
 
+    def test_old_retained_message_skips_json_parse(self):
+        """Test stale retained messages are dropped before JSON parsing."""
+        handler = Mock()
+        self.mqtt_client.register_handler("polyspike/+", handler)
+        old_timestamp = self.mqtt_client.startup_time - 400
+        msg = self.create_mock_message("polyspike/test", {"timestamp": old_timestamp, "data": "x"})
+        msg.retain = True
+        with patch("src.mqtt_client.orjson.loads") as mock_loads:
+            self.mqtt_client.on_message(None, None, msg)
+        mock_loads.assert_not_called()
+        handler.assert_not_called()
+
+    def test_recent_retained_message_not_filtered(self):
+        """Test recent retained messages still reach handlers."""
+        handler = Mock()
+        self.mqtt_client.register_handler("polyspike/+", handler)
+        msg = self.create_mock_message("polyspike/test", {"timestamp": time.time()})
+        msg.retain = True
+        self.mqtt_client.on_message(None, None, msg)
+        handler.assert_called_once()
+
     def test_recent_message_not_filtered(self):
         """Test recent messages are not filtered out."""
         handler = Mock()
@@ -336,15 +491,19 @@ class TestEdgeCases(unittest.TestCase):
         self.mqtt_client.on_message(None, None, msg)
         handler.assert_called_once_with(payload)
 
-    def test_match_topic_empty_pattern(self):
-        """Test _match_topic with empty pattern."""
-        result = self.mqtt_client._match_topic("polyspike/test", "")
-        self.assertFalse(result)
+    def test_empty_pattern_matches_nothing(self):
+        """Test a handler registered for an empty pattern is not routed to."""
+        handler = Mock()
+        self.mqtt_client.register_handler("", handler)
+        self.mqtt_client.on_message(None, None, self.create_mock_message("polyspike/test", {"timestamp": time.time()}))
+        handler.assert_not_called()
 
-    def test_match_topic_empty_topic(self):
-        """Test _match_topic with empty topic."""
-        result = self.mqtt_client._match_topic("", "polyspike/+")
-        self.assertFalse(result)
+    def test_empty_topic_matches_nothing(self):
+        """Test a message on an empty topic is not routed to a wildcard handler."""
+        handler = Mock()
+        self.mqtt_client.register_handler("polyspike/+", handler)
+        self.mqtt_client.on_message(None, None, self.create_mock_message("", {"timestamp": time.time()}))
+        handler.assert_not_called()
 
     @patch('src.mqtt_client.get_logger')
     def test_unexpected_error_logged(self, mock_get_logger):
@@ -360,5 +519,271 @@ class TestEdgeCases(unittest.TestCase):
         mock_logger.error.assert_called()
 
 
+class TestRateLimitDetection(unittest.TestCase):
+    """Test cases for per-topic message rate detection."""
+
+    def setUp(self):
+        """Set up test configuration and MQTT client."""
+        self.config = Config(
+            discord_bot_token="test_token",
+            discord_guild_id=123456789,
+            discord_channel_id=987654321,
+            mqtt_broker_host="localhost",
+            mqtt_broker_port=1883,
+            mqtt_topic_prefix="polyspike/",
+            heartbeat_timeout_seconds=90,
+            heartbeat_check_interval=30,
+            log_level="INFO"
+        )
+        self.mqtt_client = MQTTClient(self.config)
+        self.mqtt_client.logger = Mock()
+
+    def test_warning_when_rate_exceeds_threshold(self):
+        """Test a burst above the per-minute threshold logs one warning."""
+        for _ in range(60):
+            self.mqtt_client._check_message_rate("polyspike/trading/trade/completed", 1000.0)
+
+        self.mqtt_client.logger.warning.assert_called_once()
+        self.assertIn("51 messages", self.mqtt_client.logger.warning.call_args[0][0])
+
+    def test_old_messages_expire_from_window(self):
+        """Test messages older than 60s no longer count towards the rate."""
+        topic = "polyspike/trading/trade/completed"
+        for _ in range(50):
+            self.mqtt_client._check_message_rate(topic, 1000.0)
+        self.mqtt_client._check_message_rate(topic, 1061.0)
+
+        self.assertEqual(self.mqtt_client._message_counts[topic].total, 1)
+        self.mqtt_client.logger.warning.assert_not_called()
+
+    def test_window_slides_bucket_by_bucket(self):
+        """Test only buckets that left the window stop counting."""
+        topic = "polyspike/trading/trade/completed"
+        for now, count in [(1000.0, 30), (1030.0, 30)]:
+            for _ in range(count):
+                self.mqtt_client._check_message_rate(topic, now)
+
+        # First burst still inside the window: 60 messages
+        self.mqtt_client.logger.warning.assert_called_once()
+
+        self.mqtt_client._check_message_rate(topic, 1062.0)
+
+        # First burst expired, second one still counted
+        self.assertEqual(self.mqtt_client._message_counts[topic].total, 31)
+
+    def test_rate_tracking_capped(self):
+        """Test the oldest topic is evicted once the topic cap is reached."""
+        with patch("src.mqtt_client._MAX_RATE_TOPICS", 3):
+            for i in range(4):
+                self.mqtt_client._check_message_rate(f"polyspike/trade/{i}", 1000.0)
+
+        self.assertEqual(
+            list(self.mqtt_client._message_counts),
+            ["polyspike/trade/1", "polyspike/trade/2", "polyspike/trade/3"],
+        )
+
+    def test_prune_drops_quiet_topics(self):
+        """Test pruning removes expired windows and warnings but keeps active ones."""
+        self.mqtt_client._check_message_rate("polyspike/trade/old", 1000.0)
+        self.mqtt_client._check_message_rate("polyspike/trade/new", 1100.0)
+        self.mqtt_client._rate_limit_warnings = {"old": 700.0, "new": 1000.0}
+
+        self.mqtt_client._prune_rate_tracking(1100.0)
+
+        self.assertEqual(list(self.mqtt_client._message_counts), ["polyspike/trade/new"])
+        self.assertEqual(self.mqtt_client._rate_limit_warnings, {"new": 1000.0})
+
+    def test_first_warning_not_suppressed_early(self):
+        """Test a burst right after the monotonic clock starts still warns."""
+        for _ in range(60):
+            self.mqtt_client._check_message_rate("polyspike/trading/trade/completed", 10.0)
+
+        self.mqtt_client.logger.warning.assert_called_once()
+
+    def test_high_frequency_topics_not_tracked(self):
+        """Test stats and heartbeat topics are exempt from rate tracking."""
+        self.mqtt_client._check_message_rate("polyspike/stats/periodic", 1000.0)
+        self.mqtt_client._check_message_rate("polyspike/status/bot/heartbeat", 1000.0)
+        self.mqtt_client._check_message_rate("polyspike/heartbeat/extra", 1000.0)
+
+        self.assertEqual(list(self.mqtt_client._message_counts), ["polyspike/heartbeat/extra"])
+
+
+class TestConnectionAlert(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the connection alert task."""
+
+    def setUp(self):
+        """Set up test configuration and MQTT client."""
+        self.config = Config(
+            discord_bot_token="test_token",
+            discord_guild_id=123456789,
+            discord_channel_id=987654321,
+            mqtt_broker_host="localhost",
+            mqtt_broker_port=1883,
+            mqtt_topic_prefix="polyspike/",
+            heartbeat_timeout_seconds=90,
+            heartbeat_check_interval=30,
+            log_level="INFO"
+        )
+        self.mqtt_client = MQTTClient(self.config)
+        self.mqtt_client.logger = Mock()
+
+    async def test_alert_task_waits_for_disconnect(self):
+        """Test the alert task stays idle while connected and alerts on a long outage."""
+        loop = asyncio.get_running_loop()
+        self.mqtt_client._loop = loop
+        self.mqtt_client.connected = True
+        alerted = asyncio.Event()
+        callback = Mock(side_effect=lambda message, downtime: alerted.set())
+        self.mqtt_client.set_alert_callback(callback)
+
+        with patch("src.mqtt_client._DISCONNECT_ALERT_SECONDS", 0.05), \
+                patch.object(self.mqtt_client.client, "connect") as mock_connect:
+            task = asyncio.create_task(self.mqtt_client._connection_alert_task())
+            self.mqtt_client._alert_task = task
+            await asyncio.sleep(0.1)
+            callback.assert_not_called()
+
+            # Disconnect reported from paho's network thread
+            thread = threading.Thread(target=self.mqtt_client.on_disconnect, args=(None, None, 7))
+            thread.start()
+            thread.join()
+
+            await asyncio.wait_for(alerted.wait(), timeout=2.0)
+            self.mqtt_client.stop()
+            with self.assertRaises(asyncio.CancelledError):
+                await asyncio.wait_for(task, timeout=1.0)
+
+        callback.assert_called_once()
+        # Reconnecting is left to paho's network loop
+        mock_connect.assert_not_called()
+
+    async def test_no_alert_when_reconnected_in_time(self):
+        """Test a reconnect before the threshold cancels the pending alert."""
+        self.mqtt_client._loop = asyncio.get_running_loop()
+        callback = Mock()
+        self.mqtt_client.set_alert_callback(callback)
+        self.mqtt_client.on_disconnect(None, None, 7)
+
+        with patch("src.mqtt_client._DISCONNECT_ALERT_SECONDS", 0.2):
+            task = asyncio.create_task(self.mqtt_client._connection_alert_task())
+            self.mqtt_client._alert_task = task
+            await asyncio.sleep(0.05)
+            self.mqtt_client.on_connect(Mock(), None, {}, 0)
+            await asyncio.sleep(0.3)
+            self.mqtt_client.stop()
+            with self.assertRaises(asyncio.CancelledError):
+                await asyncio.wait_for(task, timeout=1.0)
+
+        callback.assert_not_called()
+
+
+class TestLoopDispatch(unittest.IsolatedAsyncioTestCase):
+    """Test cases for scheduling handlers onto the bound event loop."""
+
+    def setUp(self):
+        """Set up test configuration and MQTT client."""
+        self.config = Config(
+            discord_bot_token="test_token",
+            discord_guild_id=123456789,
+            discord_channel_id=987654321,
+            mqtt_broker_host="localhost",
+            mqtt_broker_port=1883,
+            mqtt_topic_prefix="polyspike/",
+            heartbeat_timeout_seconds=90,
+            heartbeat_check_interval=30,
+            log_level="INFO"
+        )
+        self.mqtt_client = MQTTClient(self.config)
+
+    async def test_handler_runs_on_loop_from_network_thread(self):
+        """Test handlers invoked from another thread run on the bound loop."""
+        loop = asyncio.get_running_loop()
+        self.mqtt_client._loop = loop
+        called = asyncio.Event()
+        seen = {}
+
+        def handler(data):
+            seen["loop"] = asyncio.get_running_loop()
+            called.set()
+
+        self.mqtt_client.register_handler("polyspike/status/+", handler)
+        msg = Mock()
+        msg.topic = "polyspike/status/bot"
+        msg.payload = json.dumps({"timestamp": time.time()}).encode('utf-8')
+
+        thread = threading.Thread(target=self.mqtt_client.on_message, args=(None, None, msg))
+        thread.start()
+        thread.join()
+
+        await asyncio.wait_for(called.wait(), timeout=1.0)
+        self.assertIs(seen["loop"], loop)
+
+    async def test_network_thread_only_hands_message_to_loop(self):
+        """Test on_message defers parsing and routing to the bound loop."""
+        loop = Mock()
+        self.mqtt_client._loop = loop
+        handler = Mock()
+        self.mqtt_client.register_handler("polyspike/#", handler)
+        msg = Mock()
+        msg.topic = "polyspike/status/bot"
+        msg.payload = b"not json"
+
+        with patch("src.mqtt_client.orjson.loads") as mock_loads:
+            thread = threading.Thread(target=self.mqtt_client.on_message, args=(None, None, msg))
+            thread.start()
+            thread.join()
+        mock_loads.assert_not_called()
+        handler.assert_not_called()
+
+        loop.call_soon_threadsafe.assert_called_once_with(
+            self.mqtt_client._process_queued_message, msg.topic, msg.payload, msg.retain
+        )
+
+    async def test_full_backlog_drops_new_messages(self):
+        """Test messages beyond the pending limit are dropped."""
+        loop = Mock()
+        self.mqtt_client._loop = loop
+        self.mqtt_client.logger = Mock()
+        self.mqtt_client._queued_messages = 1000
+        msg = Mock()
+        msg.topic = "polyspike/status/bot"
+
+        thread = threading.Thread(target=self.mqtt_client.on_message, args=(None, None, msg))
+        thread.start()
+        thread.join()
+
+        loop.call_soon_threadsafe.assert_not_called()
+        self.assertEqual(self.mqtt_client._dropped_messages, 1)
+        self.mqtt_client.logger.warning.assert_called_once()
+
+    async def test_closed_loop_does_not_count_message_as_queued(self):
+        """Test a message the closed loop refused is not left in the backlog count."""
+        loop = Mock()
+        loop.call_soon_threadsafe.side_effect = RuntimeError("Event loop is closed")
+        self.mqtt_client._loop = loop
+        self.mqtt_client.logger = Mock()
+        msg = Mock()
+        msg.topic = "polyspike/status/bot"
+
+        thread = threading.Thread(target=self.mqtt_client.on_message, args=(None, None, msg))
+        thread.start()
+        thread.join()
+
+        self.assertEqual(self.mqtt_client._queued_messages, 0)
+        self.mqtt_client.logger.warning.assert_called_once()
+
+    async def test_handler_runs_inline_on_bound_loop(self):
+        """Test handlers are called directly when already on the bound loop."""
+        self.mqtt_client._loop = asyncio.get_running_loop()
+        handler = Mock()
+        self.mqtt_client.register_handler("polyspike/#", handler)
+        msg = Mock()
+        msg.topic = "polyspike/status/bot"
+        msg.payload = json.dumps({"timestamp": time.time()}).encode('utf-8')
+        self.mqtt_client.on_message(None, None, msg)
+        handler.assert_called_once()
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -7,6 +7,7 @@ from unittest.mock import AsyncMock, MagicMock, Mock, patch
 import discord
 
 from src.handlers.status_handler import (
+    clear_seen_status_events,
     handle_bot_error,
     handle_bot_started,
     handle_bot_stopped,
@@ -18,6 +19,9 @@ class TestStatusHandlers(unittest.IsolatedAsyncioTestCase):
 
     def setUp(self):
         """Set up test fixtures."""
+        # Clear seen status events before each test
+        clear_seen_status_events()
+
         # Create mock Discord bot
         self.mock_bot = Mock(spec=discord.Client)
         self.mock_bot.config = Mock()
@@ -172,10 +176,7 @@ class TestStatusHandlers(unittest.IsolatedAsyncioTestCase):
         self.mock_bot.logger = Mock()
         self.mock_bot.safe_send_to_channel = AsyncMock(return_value=False)
 
-        with patch("src.handlers.status_handler.get_logger") as mock_logger:
-            logger_instance = Mock()
-            mock_logger.return_value = logger_instance
-
+        with patch("src.handlers.status_handler.logger") as logger_instance:
             # Call handler
             handle_bot_error(self.bot_error_payload, self.mock_bot)
 
@@ -191,10 +192,7 @@ class TestStatusHandlers(unittest.IsolatedAsyncioTestCase):
         """Test bot started handler when HTTP exception occurs."""
         self.mock_bot.safe_send_to_channel = AsyncMock(return_value=False)
 
-        with patch("src.handlers.status_handler.get_logger") as mock_logger:
-            logger_instance = Mock()
-            mock_logger.return_value = logger_instance
-
+        with patch("src.handlers.status_handler.logger") as logger_instance:
             # Call handler
             handle_bot_started(self.bot_started_payload, self.mock_bot)
 
@@ -219,10 +217,7 @@ class TestStatusHandlers(unittest.IsolatedAsyncioTestCase):
                 "severity": severity,
             }
 
-            with patch("src.handlers.status_handler.get_logger") as mock_logger:
-                logger_instance = Mock()
-                mock_logger.return_value = logger_instance
-
+            with patch("src.handlers.status_handler.logger") as logger_instance:
                 # Call handler
                 handle_bot_error(payload, self.mock_bot)
 
@@ -243,10 +238,7 @@ class TestStatusHandlers(unittest.IsolatedAsyncioTestCase):
             side_effect=Exception("test error")
         )
 
-        with patch("src.handlers.status_handler.get_logger") as mock_logger:
-            logger_instance = Mock()
-            mock_logger.return_value = logger_instance
-
+        with patch("src.handlers.status_handler.logger") as logger_instance:
             # Call handler
             handle_bot_started(self.bot_started_payload, self.mock_bot)
 
@@ -258,6 +250,25 @@ class TestStatusHandlers(unittest.IsolatedAsyncioTestCase):
             error_msg = logger_instance.error.call_args[0][0]
             self.assertIn("test error", error_msg)
 
+    async def test_critical_error_sent_urgently(self):
+        """Test critical errors (any case) bypass the notification batching delay."""
+        payload = dict(self.bot_error_payload, severity="CRITICAL")
+
+        handle_bot_error(payload, self.mock_bot)
+        await asyncio.sleep(0.1)
+
+        self.mock_bot.safe_send_to_channel.assert_called_once()
+        self.assertTrue(self.mock_bot.safe_send_to_channel.call_args.kwargs["urgent"])
+
+    async def test_duplicate_status_events_ignored(self):
+        """Test redelivered status events send only one notification each."""
+        for _ in range(2):
+            handle_bot_started(self.bot_started_payload, self.mock_bot)
+            handle_bot_error(self.bot_error_payload, self.mock_bot)
+        await asyncio.sleep(0.1)
+
+        self.assertEqual(self.mock_bot.safe_send_to_channel.call_count, 2)
+
     async def test_handlers_are_non_blocking(self):
         """Test that handlers return immediately (non-blocking)."""
         # Create slow mock that takes time to send
@@ -321,6 +332,8 @@ class TestStatusHandlerLogging(unittest.IsolatedAsyncioTestCase):
 
     def setUp(self):
         """Set up test fixtures."""
+        clear_seen_status_events()
+
         self.mock_bot = Mock(spec=discord.Client)
         self.mock_bot.config = Mock()
         self.mock_bot.config.discord_channel_id = 123456789
@@ -338,10 +351,7 @@ class TestStatusHandlerLogging(unittest.IsolatedAsyncioTestCase):
 
     async def test_handle_bot_started_logs_event(self):
         """Test that bot started handler logs the event."""
-        with patch("src.handlers.status_handler.get_logger") as mock_logger:
-            logger_instance = Mock()
-            mock_logger.return_value = logger_instance
-
+        with patch("src.handlers.status_handler.logger") as logger_instance:
             handle_bot_started(self.payload, self.mock_bot)
 
             # Wait for async task
@@ -352,10 +362,7 @@ class TestStatusHandlerLogging(unittest.IsolatedAsyncioTestCase):
 
     async def test_handle_bot_stopped_logs_event(self):
         """Test that bot stopped handler logs the event."""
-        with patch("src.handlers.status_handler.get_logger") as mock_logger:
-            logger_instance = Mock()
-            mock_logger.return_value = logger_instance
-
+        with patch("src.handlers.status_handler.logger") as logger_instance:
             handle_bot_stopped(self.payload, self.mock_bot)
 
             # Wait for async task
@@ -372,10 +379,7 @@ class TestStatusHandlerLogging(unittest.IsolatedAsyncioTestCase):
             "severity": "warning",
         }
 
-        with patch("src.handlers.status_handler.get_logger") as mock_logger:
-            logger_instance = Mock()
-            mock_logger.return_value = logger_instance
-
+        with patch("src.handlers.status_handler.logger") as logger_instance:
             handle_bot_error(payload, self.mock_bot)
 
             # Wait for async task
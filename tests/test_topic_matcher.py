@@ -0,0 +1,89 @@
+"""Unit tests for trie-based MQTT topic matching."""
+
+import itertools
+import unittest
+
+from paho.mqtt.client import topic_matches_sub
+
+from src.utils.topic_matcher import TopicMatcher
+
+
+class TestTopicMatcher(unittest.TestCase):
+    """Test cases for TopicMatcher class."""
+
+    def test_matches_agree_with_paho(self):
+        """Test the trie matches exactly the patterns paho's topic_matches_sub accepts."""
+        patterns = [
+            "polyspike/trading/position/opened",
+            "polyspike/trading/+/+",
+            "polyspike/+/position/#",
+            "polyspike/#",
+            "#",
+            "+",
+            "polyspike/+",
+            "polyspike/status/bot/+",
+            "other/#",
+        ]
+        topics = [
+            "polyspike",
+            "polyspike/trading",
+            "polyspike/trading/position",
+            "polyspike/trading/position/opened",
+            "polyspike/status/bot/heartbeat",
+            "polyspike/status/bot/heartbeat/extra",
+            "other",
+            "unrelated/topic",
+        ]
+        matcher = TopicMatcher()
+        for pattern in patterns:
+            matcher.add(pattern, pattern)
+
+        for topic in topics:
+            expected = [p for p in patterns if topic_matches_sub(p, topic)]
+            self.assertEqual(matcher.match(topic), expected, topic)
+
+    def test_matches_returned_in_insertion_order(self):
+        """Test routes from different branches keep the order they were added."""
+        matcher = TopicMatcher()
+        for route, pattern in enumerate(["a/#", "a/b/c", "+/b/+", "a/+/c"]):
+            matcher.add(pattern, route)
+
+        self.assertEqual(matcher.match("a/b/c"), [0, 1, 2, 3])
+
+    def test_shared_literal_prefixes_split_correctly(self):
+        """Test patterns sharing part of a compressed edge each match only their topic."""
+        patterns = ["a/b/c", "a/b", "a", "a/b/c/d", "a/x/c", "a/+/c", "a/b/#"]
+        matcher = TopicMatcher()
+        for pattern in patterns:
+            matcher.add(pattern, pattern)
+
+        self.assertEqual(matcher.match("a"), ["a"])
+        self.assertEqual(matcher.match("a/b"), ["a/b", "a/b/#"])
+        self.assertEqual(matcher.match("a/b/c"), ["a/b/c", "a/+/c", "a/b/#"])
+        self.assertEqual(matcher.match("a/b/c/d"), ["a/b/c/d", "a/b/#"])
+        self.assertEqual(matcher.match("a/x/c"), ["a/x/c", "a/+/c"])
+        self.assertEqual(matcher.match("a/x"), [])
+
+    def test_same_pattern_multiple_routes(self):
+        """Test every route added for one pattern is returned."""
+        matcher = TopicMatcher()
+        matcher.add("a/+", "first")
+        matcher.add("a/+", "second")
+
+        self.assertEqual(matcher.match("a/x"), ["first", "second"])
+        self.assertEqual(matcher.match("a/x/y"), [])
+        self.assertEqual(len(matcher), 2)
+
+    def test_many_patterns(self):
+        """Test matching stays correct with many registered patterns."""
+        matcher = TopicMatcher()
+        for i, j in itertools.product(range(30), range(30)):
+            matcher.add(f"site/{i}/sensor/{j}", (i, j))
+        matcher.add("site/+/sensor/7", "wildcard")
+
+        self.assertEqual(matcher.match("site/3/sensor/7"), [(3, 7), "wildcard"])
+        self.assertEqual(matcher.match("site/3/sensor/70"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,8 +6,10 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import discord
 
+from src.handlers import trading_handler
 from src.handlers.trading_handler import (
     clear_seen_trades,
+    enable_bloom_dedup,
     get_seen_trades_count,
     handle_position_opened,
     handle_trade_completed,
@@ -22,6 +24,12 @@ class TestTradingHandlers(unittest.IsolatedAsyncioTestCase):
         # Clear seen trades before each test
         clear_seen_trades()
 
+        # Send trade notifications without waiting for a digest window
+        window_patcher = patch.object(trading_handler._trade_digest, "window", 0.0)
+        window_patcher.start()
+        self.addCleanup(window_patcher.stop)
+        self.addCleanup(trading_handler._trade_digest.cancel)
+
         # Create mock Discord bot
         self.mock_bot = Mock(spec=discord.Client)
         self.mock_bot.config = Mock()
@@ -123,6 +131,49 @@ class TestTradingHandlers(unittest.IsolatedAsyncioTestCase):
         # Verify both messages were sent
         self.assertEqual(self.mock_bot.safe_send_to_channel.call_count, 2)
 
+    async def test_trade_burst_sent_as_one_digest(self):
+        """Test trades within the digest window share one notification."""
+        trading_handler._trade_digest.window = 0.05
+
+        for i in range(3):
+            payload = self.trade_completed_payload.copy()
+            payload["trade_id"] = f"burst-trade-{i}"
+            handle_trade_completed(payload, self.mock_bot)
+        await asyncio.sleep(0.1)
+
+        self.mock_bot.safe_send_to_channel.assert_called_once()
+        embed = self.mock_bot.safe_send_to_channel.call_args[0][0]
+        self.assertEqual(embed.title, "💰 3 Trades Completed")
+        self.assertEqual(len(embed.fields), 3)
+
+    async def test_cancel_active_tasks_sends_pending_digest(self):
+        """Test shutdown sends trades still waiting in the digest window."""
+        trading_handler._trade_digest.window = 10.0
+        handle_trade_completed(self.trade_completed_payload, self.mock_bot)
+
+        await asyncio.wait_for(trading_handler.cancel_active_tasks(), timeout=1.0)
+
+        self.mock_bot.safe_send_to_channel.assert_called_once()
+        self.assertEqual(trading_handler._trade_digest.pending_payloads, [])
+        self.assertIsNone(trading_handler._trade_digest._timer)
+
+    async def test_cancel_active_tasks_cancels_slow_sends(self):
+        """Test sends still running after the timeout are cancelled."""
+        send_started = asyncio.Event()
+
+        async def slow_send(embed):
+            send_started.set()
+            await asyncio.sleep(10)
+            return True
+
+        self.mock_bot.safe_send_to_channel = AsyncMock(side_effect=slow_send)
+        handle_position_opened(self.position_opened_payload, self.mock_bot)
+        await asyncio.wait_for(send_started.wait(), timeout=1.0)
+
+        await asyncio.wait_for(trading_handler.cancel_active_tasks(timeout=0.05), timeout=1.0)
+
+        self.assertEqual(trading_handler._active_tasks, set())
+
     async def test_handle_trade_completed_without_trade_id(self):
         """Test trade completed without trade_id field."""
         # Payload without trade_id
@@ -151,14 +202,41 @@ class TestTradingHandlers(unittest.IsolatedAsyncioTestCase):
             cache_size = get_seen_trades_count()
             self.assertLessEqual(cache_size, 5)
 
+    async def test_bloom_dedup_drops_duplicates(self):
+        """Test duplicate trade_ids are dropped in Bloom filter mode."""
+        with patch.object(trading_handler, "_seen_bloom", None):
+            enable_bloom_dedup(capacity=100)
+
+            handle_trade_completed(self.trade_completed_payload, self.mock_bot)
+            handle_trade_completed(self.trade_completed_payload, self.mock_bot)
+            other = dict(self.trade_completed_payload, trade_id="other-trade")
+            handle_trade_completed(other, self.mock_bot)
+            await asyncio.sleep(0.1)
+
+            # Both unique trades arrive in the same burst and share a digest
+            self.mock_bot.safe_send_to_channel.assert_called_once()
+            embed = self.mock_bot.safe_send_to_channel.call_args[0][0]
+            self.assertEqual(len(embed.fields), 2)
+            self.assertEqual(get_seen_trades_count(), 2)
+
+    async def test_bloom_dedup_accepts_integer_trade_id(self):
+        """Test numeric trade_ids work in Bloom filter mode like in the exact set."""
+        with patch.object(trading_handler, "_seen_bloom", None):
+            enable_bloom_dedup(capacity=100)
+
+            payload = dict(self.trade_completed_payload, trade_id=424242)
+            handle_trade_completed(payload, self.mock_bot)
+            handle_trade_completed(payload, self.mock_bot)
+            await asyncio.sleep(0.1)
+
+            self.mock_bot.safe_send_to_channel.assert_called_once()
+            self.assertEqual(get_seen_trades_count(), 1)
+
     async def test_handle_position_opened_channel_not_found(self):
         """Test position opened handler when channel is not found."""
         self.mock_bot.safe_send_to_channel = AsyncMock(return_value=False)
 
-        with patch("src.handlers.trading_handler.get_logger") as mock_logger:
-            logger_instance = Mock()
-            mock_logger.return_value = logger_instance
-
+        with patch("src.handlers.trading_handler.logger") as logger_instance:
             handle_position_opened(self.position_opened_payload, self.mock_bot)
             await asyncio.sleep(0.1)
 
@@ -173,10 +251,7 @@ class TestTradingHandlers(unittest.IsolatedAsyncioTestCase):
         # This test verifies the behavior when safe_send_to_channel fails for any reason
         self.mock_bot.safe_send_to_channel = AsyncMock(return_value=False)
 
-        with patch("src.handlers.trading_handler.get_logger") as mock_logger:
-            logger_instance = Mock()
-            mock_logger.return_value = logger_instance
-
+        with patch("src.handlers.trading_handler.logger") as logger_instance:
             handle_trade_completed(self.trade_completed_payload, self.mock_bot)
             await asyncio.sleep(0.1)
 
@@ -189,10 +264,7 @@ class TestTradingHandlers(unittest.IsolatedAsyncioTestCase):
         """Test position opened handler when permission is denied."""
         self.mock_bot.safe_send_to_channel = AsyncMock(return_value=False)
 
-        with patch("src.handlers.trading_handler.get_logger") as mock_logger:
-            logger_instance = Mock()
-            mock_logger.return_value = logger_instance
-
+        with patch("src.handlers.trading_handler.logger") as logger_instance:
             handle_position_opened(self.position_opened_payload, self.mock_bot)
             await asyncio.sleep(0.1)
 
@@ -205,10 +277,7 @@ class TestTradingHandlers(unittest.IsolatedAsyncioTestCase):
         """Test trade completed handler when HTTP exception occurs."""
         self.mock_bot.safe_send_to_channel = AsyncMock(return_value=False)
 
-        with patch("src.handlers.trading_handler.get_logger") as mock_logger:
-            logger_instance = Mock()
-            mock_logger.return_value = logger_instance
-
+        with patch("src.handlers.trading_handler.logger") as logger_instance:
             handle_trade_completed(self.trade_completed_payload, self.mock_bot)
             await asyncio.sleep(0.1)
 
@@ -222,10 +291,7 @@ class TestTradingHandlers(unittest.IsolatedAsyncioTestCase):
         # Payload with missing fields
         minimal_payload = {"timestamp": 1735833715.0}
 
-        with patch("src.handlers.trading_handler.get_logger") as mock_logger:
-            logger_instance = Mock()
-            mock_logger.return_value = logger_instance
-
+        with patch("src.handlers.trading_handler.logger") as logger_instance:
             handle_position_opened(minimal_payload, self.mock_bot)
             await asyncio.sleep(0.1)
 
@@ -245,10 +311,7 @@ class TestTradingHandlers(unittest.IsolatedAsyncioTestCase):
             "timestamp": 1735833745.0,
         }
 
-        with patch("src.handlers.trading_handler.get_logger") as mock_logger:
-            logger_instance = Mock()
-            mock_logger.return_value = logger_instance
-
+        with patch("src.handlers.trading_handler.logger") as logger_instance:
             handle_trade_completed(minimal_payload, self.mock_bot)
             await asyncio.sleep(0.1)
 
@@ -282,10 +345,7 @@ class TestTradingHandlers(unittest.IsolatedAsyncioTestCase):
         """Test position opened handler with unexpected exception."""
         self.mock_bot.safe_send_to_channel = AsyncMock(side_effect=Exception("test error"))
 
-        with patch("src.handlers.trading_handler.get_logger") as mock_logger:
-            logger_instance = Mock()
-            mock_logger.return_value = logger_instance
-
+        with patch("src.handlers.trading_handler.logger") as logger_instance:
             handle_position_opened(self.position_opened_payload, self.mock_bot)
             await asyncio.sleep(0.1)
 
@@ -302,6 +362,11 @@ class TestTradingHandlerLogging(unittest.IsolatedAsyncioTestCase):
         """Set up test fixtures."""
         clear_seen_trades()
 
+        window_patcher = patch.object(trading_handler._trade_digest, "window", 0.0)
+        window_patcher.start()
+        self.addCleanup(window_patcher.stop)
+        self.addCleanup(trading_handler._trade_digest.cancel)
+
         self.mock_bot = Mock(spec=discord.Client)
         self.mock_bot.config = Mock()
         self.mock_bot.config.discord_channel_id = 123456789
@@ -323,10 +388,7 @@ class TestTradingHandlerLogging(unittest.IsolatedAsyncioTestCase):
 
     async def test_handle_position_opened_logs_event(self):
         """Test that position opened handler logs the event."""
-        with patch("src.handlers.trading_handler.get_logger") as mock_logger:
-            logger_instance = Mock()
-            mock_logger.return_value = logger_instance
-
+        with patch("src.handlers.trading_handler.logger") as logger_instance:
             handle_position_opened(self.position_payload, self.mock_bot)
             await asyncio.sleep(0.01)
 
@@ -335,10 +397,7 @@ class TestTradingHandlerLogging(unittest.IsolatedAsyncioTestCase):
 
     async def test_handle_trade_completed_logs_event(self):
         """Test that trade completed handler logs the event."""
-        with patch("src.handlers.trading_handler.get_logger") as mock_logger:
-            logger_instance = Mock()
-            mock_logger.return_value = logger_instance
-
+        with patch("src.handlers.trading_handler.logger") as logger_instance:
             handle_trade_completed(self.trade_payload, self.mock_bot)
             await asyncio.sleep(0.01)
 
@@ -347,10 +406,7 @@ class TestTradingHandlerLogging(unittest.IsolatedAsyncioTestCase):
 
     async def test_handle_trade_completed_logs_duplicate(self):
         """Test that duplicate trade_id is logged."""
-        with patch("src.handlers.trading_handler.get_logger") as mock_logger:
-            logger_instance = Mock()
-            mock_logger.return_value = logger_instance
-
+        with patch("src.handlers.trading_handler.logger") as logger_instance:
             # Send first trade
             handle_trade_completed(self.trade_payload, self.mock_bot)
             await asyncio.sleep(0.01)
@@ -364,7 +420,8 @@ class TestTradingHandlerLogging(unittest.IsolatedAsyncioTestCase):
 
             # Verify debug log for duplicate was called
             logger_instance.debug.assert_called()
-            debug_msg = logger_instance.debug.call_args[0][0]
+            fmt, *args = logger_instance.debug.call_args[0]
+            debug_msg = fmt % tuple(args)
             self.assertIn("duplicate", debug_msg.lower())
             self.assertIn("test-trade-123", debug_msg)
 